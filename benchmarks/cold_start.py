@@ -0,0 +1,153 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Cold start of the model server: importing the serving modules and looking up the MMS properties files in a new
+interpreter, and starting gunicorn with ``serving:main`` until it answers its first ping and its first invocation.
+
+The gunicorn worker serves a joblib model from SAGEMAKER_BASE_DIR/model with the default handler functions, and
+loads it on the first ping. Its import and model load phases are read from the startup report it logs.
+
+Usage:
+    python -m benchmarks.cold_start
+"""
+from __future__ import absolute_import
+
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+NUM_FEATURES = 20
+REPEAT = 5
+# (case, statement timed in a new interpreter)
+IMPORTS = [
+    ('import serving', 'import sagemaker_sklearn_container.serving'),
+    ('import serving_mms', 'import sagemaker_sklearn_container.serving_mms'),
+    ('import handler_service', 'import sagemaker_sklearn_container.handler_service'),
+    # How the MMS properties files were found before, and how they are found now
+    ('pkg_resources lookup', 'import pkg_resources, sagemaker_inference; '
+                             'pkg_resources.resource_filename("sagemaker_inference", "/etc/default-mms.properties")'),
+    ('importlib.resources lookup', 'import importlib.resources, sagemaker_inference; '
+                                   'importlib.resources.files(sagemaker_inference).joinpath("etc", '
+                                   '"default-mms.properties")'),
+]
+STARTUP_REPORT = 'startup phases: '
+
+
+def _env():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.join(root, 'src'), root]))
+
+
+def _import_s(statement):
+    code = 'import time; start = time.perf_counter(); {}; print(time.perf_counter() - start)'.format(statement)
+    return float(subprocess.check_output([sys.executable, '-c', code], env=_env(), stderr=subprocess.DEVNULL))
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _request(port, method, path, body=None, headers=None):
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    try:
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    finally:
+        connection.close()
+
+
+def _gunicorn_start(base_dir):
+    port = _free_port()
+    server_env = dict(_env(), SAGEMAKER_BASE_DIR=base_dir, SAGEMAKER_PROGRAM='cold_start_user_module',
+                      PYTHONPATH=os.pathsep.join([os.path.join(base_dir, 'code'), _env()['PYTHONPATH']]))
+    start = time.perf_counter()
+    server = subprocess.Popen([sys.executable, '-m', 'gunicorn', '--timeout', '60', '-k', 'gevent',
+                               '-b', '127.0.0.1:{}'.format(port), '-w', '1', '--log-level', 'warning',
+                               'sagemaker_sklearn_container.serving:main'],
+                              env=server_env, stderr=subprocess.PIPE, universal_newlines=True)
+    try:
+        while True:
+            try:
+                status = _request(port, 'GET', '/ping')
+                break
+            except (ConnectionError, OSError):
+                time.sleep(0.01)
+        assert status == 200, status
+        first_ping_s = time.perf_counter() - start
+
+        body = '\n'.join([','.join(['0.5'] * NUM_FEATURES)] * 2)
+        status = _request(port, 'POST', '/invocations', body, {'Content-Type': 'text/csv', 'Accept': 'text/csv'})
+        assert status == 200, status
+        first_invocation_s = time.perf_counter() - start
+    finally:
+        server.terminate()
+        _, logs = server.communicate()
+
+    phases = {}
+    for line in logs.splitlines():
+        if STARTUP_REPORT in line:
+            phases = json.loads(line.split(STARTUP_REPORT, 1)[1])
+    return {'first_ping_s': first_ping_s, 'first_invocation_s': first_invocation_s,
+            'worker_import_s': phases.get('import'), 'worker_model_load_s': phases.get('model_load')}
+
+
+def _median(results):
+    """Returns the median of each measurement, None where it is missing, as from a tree without startup report."""
+    medians = {}
+    for key in results[0]:
+        values = [result[key] for result in results if result[key] is not None]
+        medians[key] = float(np.median(values)) if values else None
+    return medians
+
+
+def run(repeat=REPEAT):
+    results = [{'case': case, 'cold_start_s': float(np.median([_import_s(statement) for _ in range(repeat)]))}
+               for case, statement in IMPORTS]
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        os.makedirs(os.path.join(base_dir, 'model'))
+        os.makedirs(os.path.join(base_dir, 'code'))
+        open(os.path.join(base_dir, 'code', 'cold_start_user_module.py'), 'w').close()
+        random_state = np.random.RandomState(0)
+        x = random_state.rand(2000, NUM_FEATURES)
+        joblib.dump(RandomForestClassifier(n_estimators=100, random_state=0).fit(x, random_state.randint(0, 2, 2000)),
+                    os.path.join(base_dir, 'model', 'model.joblib'))
+
+        gunicorn = _median([_gunicorn_start(base_dir) for _ in range(repeat)])
+    results.append(dict({'case': 'gunicorn', 'cold_start_s': gunicorn.pop('first_ping_s')}, **gunicorn))
+    return results
+
+
+def main():
+    header = ('case', 'cold_start_s', 'first_invocation_s', 'worker_import_s', 'worker_model_load_s')
+    print('{:>28} {:>14} {:>20} {:>17} {:>21}'.format(*header))
+    for result in run():
+        print('{:>28} {:>14.4f} {:>20} {:>17} {:>21}'.format(
+            result['case'], result['cold_start_s'],
+            *['{:.3f}'.format(result[key]) if result.get(key) is not None else '' for key in header[2:]]))
+
+
+if __name__ == '__main__':
+    main()
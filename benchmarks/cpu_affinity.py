@@ -0,0 +1,97 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Single row prediction latency of concurrent workers, unpinned versus pinned to core sets with ``cpu_affinity``.
+
+One worker per core set reads the model into memory after pinning, as gunicorn and MMS workers do, and then serves
+requests back to back while all the others do the same.
+
+Usage:
+    python -m benchmarks.cpu_affinity
+"""
+from __future__ import absolute_import
+
+import multiprocessing
+import os
+import tempfile
+import time
+
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from sagemaker_sklearn_container import cpu_affinity, model_loader
+
+NUM_REQUESTS = 2000
+NUM_ROWS = 10000
+NUM_FEATURES = 20
+
+
+def _train(path):
+    random_state = np.random.RandomState(0)
+    x = random_state.rand(NUM_ROWS, NUM_FEATURES)
+    y = random_state.randint(0, 2, NUM_ROWS)
+    joblib.dump(RandomForestClassifier(n_estimators=20, random_state=0).fit(x, y), path)
+
+
+def _worker(path, pin, start, results):
+    if pin:
+        cpu_affinity.pin_worker()
+    model = model_loader.load_model(path, mmap_mode=None if pin else 'r')
+    row = np.random.RandomState(os.getpid()).rand(1, NUM_FEATURES)
+
+    start.wait()
+    latencies = []
+    for _ in range(NUM_REQUESTS):
+        request_start = time.perf_counter()
+        model.predict(row)
+        latencies.append(time.perf_counter() - request_start)
+    results.put(latencies)
+
+
+def _measure(path, pin, num_workers):
+    context = multiprocessing.get_context('fork')
+    start, results = context.Event(), context.Queue()
+    with tempfile.TemporaryDirectory() as slot_directory:
+        cpu_affinity.SLOT_DIRECTORY = slot_directory
+        workers = [context.Process(target=_worker, args=(path, pin, start, results)) for _ in range(num_workers)]
+        for worker in workers:
+            worker.start()
+        start.set()
+        latencies = np.concatenate([results.get() for _ in workers])
+        for worker in workers:
+            worker.join()
+
+    return {'pinned': pin, 'workers': num_workers, 'p50_ms': np.percentile(latencies, 50) * 1000,
+            'p99_ms': np.percentile(latencies, 99) * 1000}
+
+
+def run():
+    os.environ.setdefault('OMP_NUM_THREADS', '1')
+    num_workers = len(cpu_affinity.core_sets(cpu_affinity.cores_per_worker()))
+    with tempfile.TemporaryDirectory() as model_dir:
+        path = os.path.join(model_dir, model_loader.DEFAULT_MODEL_FILENAME)
+        _train(path)
+        return [_measure(path, pin, num_workers) for pin in (False, True)]
+
+
+def main():
+    print('{:>8} {:>8} {:>10} {:>10}'.format('pinned', 'workers', 'p50_ms', 'p99_ms'))
+    results = run()
+    for result in results:
+        print('{:>8} {:>8} {:>10.3f} {:>10.3f}'.format(str(result['pinned']), result['workers'], result['p50_ms'],
+                                                       result['p99_ms']))
+    print('p99 difference: {:+.3f} ms'.format(results[1]['p99_ms'] - results[0]['p99_ms']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Compares the bulk CSV decoder against ``np.genfromtxt`` at 1 KB, 100 KB and 5 MB payloads.
+
+Usage:
+    python -m benchmarks.csv_decoder
+"""
+from __future__ import absolute_import
+
+import timeit
+
+import numpy as np
+from six import StringIO
+
+from sagemaker_sklearn_container import decoder
+
+PAYLOAD_SIZES = [('1KB', 1024), ('100KB', 100 * 1024), ('5MB', 5 * 1024 ** 2)]
+NUM_FEATURES = 20
+
+
+def make_csv_payload(num_bytes, num_features=NUM_FEATURES, seed=0):
+    """Builds a numeric CSV payload of roughly ``num_bytes`` bytes."""
+    row = ','.join(['0.123456'] * num_features) + '\n'
+    num_rows = max(1, num_bytes // len(row))
+    array = np.random.RandomState(seed).rand(num_rows, num_features)
+    return '\n'.join(','.join('{:.6f}'.format(value) for value in row) for row in array) + '\n'
+
+
+def _best_of(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def run(repeat=5):
+    results = []
+    for name, num_bytes in PAYLOAD_SIZES:
+        payload = make_csv_payload(num_bytes)
+        genfromtxt = _best_of(lambda: np.genfromtxt(StringIO(payload), delimiter=','), repeat)
+        bulk = _best_of(lambda: decoder._csv_to_numpy(payload, np.float64), repeat)
+        results.append({'payload': name, 'bytes': len(payload),
+                        'genfromtxt_s': genfromtxt, 'decoder_s': bulk, 'speedup': genfromtxt / bulk})
+    return results
+
+
+def main():
+    print('{:>8} {:>10} {:>14} {:>12} {:>9}'.format('payload', 'bytes', 'genfromtxt_s', 'decoder_s', 'speedup'))
+    for result in run():
+        print('{payload:>8} {bytes:>10} {genfromtxt_s:>14.6f} {decoder_s:>12.6f} {speedup:>8.1f}x'.format(**result))
+
+
+if __name__ == '__main__':
+    main()
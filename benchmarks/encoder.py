@@ -0,0 +1,69 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Compares the bulk prediction encoders against the default gunicorn and MMS encoders.
+
+``encoder_s`` is the time of the bulk encoder and, for the content types it leaves to them, of the fallback to the
+default MMS encoder, as in the default output_fn.
+
+Usage:
+    python -m benchmarks.encoder
+"""
+from __future__ import absolute_import
+
+import timeit
+
+import numpy as np
+from sagemaker_containers.beta.framework import encoders
+from sagemaker_inference import content_types, encoder as inference_encoder
+
+from sagemaker_sklearn_container import encoder
+
+SHAPES = [(10,), (100000,), (100000, 3), (1000, 50)]
+CONTENT_TYPES = [content_types.CSV, content_types.JSON]
+
+
+def _best_of(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def _encode(prediction, content_type):
+    data = encoder.encode(prediction, content_type)
+    if data is None:
+        data = inference_encoder.encode(prediction, content_type)
+    return data
+
+
+def run(repeat=5):
+    results = []
+    for shape in SHAPES:
+        prediction = np.random.RandomState(0).rand(*shape)
+        for content_type in CONTENT_TYPES:
+            results.append({
+                'shape': 'x'.join(map(str, shape)),
+                'content_type': content_type,
+                'sagemaker_containers_s': _best_of(lambda: encoders.encode(prediction, content_type), repeat),
+                'sagemaker_inference_s': _best_of(lambda: inference_encoder.encode(prediction, content_type), repeat),
+                'encoder_s': _best_of(lambda: _encode(prediction, content_type), repeat),
+            })
+    return results
+
+
+def main():
+    header = ('shape', 'content_type', 'sagemaker_containers_s', 'sagemaker_inference_s', 'encoder_s')
+    print('{:>10} {:>18} {:>24} {:>24} {:>12}'.format(*header))
+    for result in run():
+        print('{:>10} {:>18} {:>24.6f} {:>24.6f} {:>12.6f}'.format(*[result[key] for key in header]))
+
+
+if __name__ == '__main__':
+    main()
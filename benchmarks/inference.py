@@ -0,0 +1,160 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Latency of the default input_fn, predict_fn and output_fn, and of a full request through the gunicorn app
+of ``serving`` and the MMS ``HandlerService``, across model families, content types and payload sizes.
+
+Requests are decoded and encoded in the same content type. The full requests run in process, without the HTTP
+server, through the Flask app built like ``serving.load_app`` and through ``HandlerService.handle`` with a
+context shaped like the one MMS passes.
+
+Usage:
+    python -m benchmarks.inference
+"""
+from __future__ import absolute_import
+
+import io
+import os
+import tempfile
+import timeit
+import types
+
+import joblib
+import numpy as np
+from sagemaker_containers.beta.framework import worker
+from sagemaker_inference import content_types
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from sagemaker_sklearn_container import model_loader, serving
+from sagemaker_sklearn_container.handler_service import HandlerService
+
+NUM_FEATURES = 20
+NUM_TRAINING_ROWS = 2000
+ROWS = [10, 1000, 10000]
+CONTENT_TYPES = [content_types.CSV, content_types.JSON, content_types.NPY]
+MODELS = {
+    'linear': lambda: LogisticRegression(),
+    'random_forest': lambda: RandomForestClassifier(n_estimators=50, random_state=0),
+    'gradient_boosting': lambda: GradientBoostingClassifier(n_estimators=50, random_state=0),
+    'pipeline': lambda: make_pipeline(StandardScaler(), LogisticRegression()),
+}
+
+
+class _RequestProcessor(object):
+    def __init__(self, request_properties):
+        self._request_properties = request_properties
+
+    def get_request_properties(self):
+        return self._request_properties
+
+
+class _Context(object):
+    """The parts of ``mms.context.Context`` that the handler service uses."""
+
+    def __init__(self, model_dir, content_type):
+        self.system_properties = {'model_dir': model_dir}
+        self.request_processor = [_RequestProcessor({'Content-Type': content_type, 'Accept': content_type})]
+
+    def set_response_content_type(self, index, content_type):
+        pass
+
+    def set_response_status(self, code, phrase, idx=0):
+        raise RuntimeError('{} {}'.format(code, phrase))
+
+
+def _train(name, model_dir):
+    random_state = np.random.RandomState(0)
+    x = random_state.rand(NUM_TRAINING_ROWS, NUM_FEATURES)
+    model = MODELS[name]().fit(x, random_state.randint(0, 2, NUM_TRAINING_ROWS))
+    joblib.dump(model, os.path.join(model_dir, model_loader.DEFAULT_MODEL_FILENAME))
+    return model
+
+
+def make_payload(content_type, num_rows, seed=0):
+    """Returns a request body of num_rows random rows in the given content type, as bytes."""
+    array = np.random.RandomState(seed).rand(num_rows, NUM_FEATURES)
+    if content_type == content_types.CSV:
+        return '\n'.join(','.join('{:.6f}'.format(value) for value in row) for row in array).encode('utf-8')
+    if content_type == content_types.JSON:
+        return ('[' + ','.join('[' + ','.join('{:.6f}'.format(value) for value in row) + ']'
+                               for row in array) + ']').encode('utf-8')
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    return buffer.getvalue()
+
+
+def _gunicorn_app(model):
+    user_module = types.ModuleType('benchmark_user_module')
+    user_module.model_fn = lambda model_dir: model
+    user_module_transformer = serving._user_module_transformer(user_module)
+    user_module_transformer.initialize()
+    return worker.Worker(transform_fn=user_module_transformer.transform, module_name=user_module.__name__)
+
+
+def _best_of(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def _measure(name, model, model_dir, content_type, num_rows, repeat):
+    payload = make_payload(content_type, num_rows)
+    input_data = payload.decode('utf-8') if content_type in content_types.UTF8_TYPES else payload
+
+    data = serving.default_input_fn(input_data, content_type)
+    prediction = serving.default_predict_fn(data, model)
+
+    client = _gunicorn_app(model).test_client()
+    headers = {'Content-Type': content_type, 'Accept': content_type}
+    handler_service = HandlerService()
+    context = _Context(model_dir, content_type)
+    handler_service.initialize(context)
+
+    def gunicorn_request():
+        response = client.post('/invocations', data=payload, headers=headers)
+        assert response.status_code == 200, response.get_data()
+
+    return {
+        'model': name,
+        'content_type': content_type,
+        'rows': num_rows,
+        'payload_bytes': len(payload),
+        'input_fn_s': _best_of(lambda: serving.default_input_fn(input_data, content_type), repeat),
+        'predict_fn_s': _best_of(lambda: serving.default_predict_fn(data, model), repeat),
+        'output_fn_s': _best_of(lambda: serving.default_output_fn(prediction, content_type), repeat),
+        'gunicorn_s': _best_of(gunicorn_request, repeat),
+        'mms_s': _best_of(lambda: handler_service.handle([{'body': payload}], context), repeat),
+    }
+
+
+def run(repeat=5):
+    results = []
+    for name in MODELS:
+        with tempfile.TemporaryDirectory() as model_dir:
+            model = _train(name, model_dir)
+            for content_type in CONTENT_TYPES:
+                for num_rows in ROWS:
+                    results.append(_measure(name, model, model_dir, content_type, num_rows, repeat))
+    return results
+
+
+def main():
+    header = ('model', 'content_type', 'rows', 'input_fn_s', 'predict_fn_s', 'output_fn_s', 'gunicorn_s', 'mms_s')
+    print('{:>18} {:>24} {:>6} {:>12} {:>12} {:>12} {:>12} {:>12}'.format(*header))
+    for result in run():
+        print('{:>18} {:>24} {:>6} {:>12.6f} {:>12.6f} {:>12.6f} {:>12.6f} {:>12.6f}'.format(
+            *[result[key] for key in header]))
+
+
+if __name__ == '__main__':
+    main()
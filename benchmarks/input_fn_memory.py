@@ -0,0 +1,86 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Peak memory of decoding a request into float32: decode-then-cast versus fused decode-and-cast.
+
+Each measurement runs in a fresh process and reports the peak of the memory allocated while decoding, as
+traced by ``tracemalloc`` (NumPy reports its buffers to it). ``ru_maxrss`` is not used, as building the payload
+raises it past what decoding needs.
+
+Usage:
+    python -m benchmarks.input_fn_memory
+"""
+from __future__ import absolute_import
+
+import multiprocessing
+import tracemalloc
+
+import numpy as np
+from sagemaker_inference import content_types
+
+from benchmarks.csv_decoder import make_csv_payload
+from sagemaker_sklearn_container import decoder
+
+PAYLOAD_BYTES = 20 * 1024 ** 2
+
+
+def _decode_then_cast(payload, content_type):
+    return decoder.decode(payload, content_type).astype(np.float32)
+
+
+def _fused(payload, content_type):
+    return decoder.decode(payload, content_type, np.float32)
+
+
+VARIANTS = {'decode_then_cast': _decode_then_cast, 'fused': _fused}
+
+
+def _payload(content_type):
+    csv_payload = make_csv_payload(PAYLOAD_BYTES)
+    if content_type == content_types.CSV:
+        return csv_payload
+    return '[' + ','.join('[' + row + ']' for row in csv_payload.splitlines()) + ']'
+
+
+def _measure(variant, content_type, queue):
+    payload = _payload(content_type)
+    tracemalloc.start()
+    array = VARIANTS[variant](payload, content_type)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    queue.put({'variant': variant, 'content_type': content_type, 'result_bytes': array.nbytes,
+               'peak_allocated_bytes': peak_bytes})
+
+
+def run():
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for content_type in (content_types.CSV, content_types.JSON):
+        for variant in VARIANTS:
+            queue = context.Queue()
+            process = context.Process(target=_measure, args=(variant, content_type, queue))
+            process.start()
+            results.append(queue.get())
+            process.join()
+    return results
+
+
+def main():
+    print('{:>18} {:>18} {:>14} {:>24}'.format('content_type', 'variant', 'result_MB', 'peak_allocated_MB'))
+    for result in run():
+        print('{:>18} {:>18} {:>14.1f} {:>24.1f}'.format(result['content_type'], result['variant'],
+                                                         result['result_bytes'] / 1024 ** 2,
+                                                         result['peak_allocated_bytes'] / 1024 ** 2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Load test of single row CSV requests against gunicorn, for each connection setting.
+
+gunicorn is started with the command line of ``sagemaker_containers.beta.framework.server.start`` and the
+``gunicorn_config`` module, serving the default input, predict and output functions of ``serving``. Concurrent
+clients either open a new connection for every request or keep one connection open.
+
+Usage:
+    python -m benchmarks.keep_alive
+"""
+from __future__ import absolute_import
+
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import joblib
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+NUM_CLIENTS = 16
+NUM_REQUESTS = 500
+NUM_WORKERS = 2
+NUM_FEATURES = 20
+MODEL_FILE_ENV = 'BENCHMARK_MODEL_FILE'
+
+# (name, environment of the server, whether clients keep their connection open)
+SETTINGS = [
+    ('default', {}, False),
+    ('keep-alive 75s', {'SAGEMAKER_KEEP_ALIVE_TIMEOUT': '75'}, True),
+    ('keep-alive 75s, 64 connections', {'SAGEMAKER_KEEP_ALIVE_TIMEOUT': '75', 'SAGEMAKER_WORKER_CONNECTIONS': '64'},
+     True),
+]
+
+_app = None
+
+
+def app(environ, start_response):
+    """WSGI app serving the model in BENCHMARK_MODEL_FILE, loaded on the first request."""
+    global _app
+
+    if _app is None:
+        from sagemaker_containers.beta.framework import transformer, worker
+        from sagemaker_sklearn_container import serving
+
+        def model_fn(model_dir):
+            return joblib.load(os.environ[MODEL_FILE_ENV])
+
+        def predict_fn(input_data, model):
+            # A single CSV row decodes to a 1D array
+            return serving.default_predict_fn(np.atleast_2d(input_data), model)
+
+        model_transformer = transformer.Transformer(model_fn=model_fn, input_fn=serving.default_input_fn,
+                                                    predict_fn=predict_fn, output_fn=serving.default_output_fn)
+        model_transformer.initialize()
+        _app = worker.Worker(transform_fn=model_transformer.transform, module_name='benchmark')
+    return _app(environ, start_response)
+
+
+def _train(path):
+    random_state = np.random.RandomState(0)
+    x = random_state.rand(1000, NUM_FEATURES)
+    joblib.dump(LogisticRegression().fit(x, random_state.randint(0, 2, 1000)), path)
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _start_server(port, model_file, settings_env):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    server_env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.join(root, 'src'), root]),
+                      **{MODEL_FILE_ENV: model_file}, **settings_env)
+    server = subprocess.Popen([sys.executable, '-m', 'gunicorn', '--timeout', '60', '-k', 'gevent',
+                               '-b', '127.0.0.1:{}'.format(port), '--worker-connections', str(1000 * NUM_WORKERS),
+                               '-w', str(NUM_WORKERS), '--log-level', 'warning',
+                               '--config', 'python:sagemaker_sklearn_container.gunicorn_config',
+                               'benchmarks.keep_alive:app'], env=server_env)
+    while True:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port)
+            connection.request('GET', '/ping')
+            connection.getresponse().read()
+            return server
+        except (ConnectionError, OSError):
+            time.sleep(0.1)
+
+
+def _client(port, keep_alive, body, latencies):
+    headers = {'Content-Type': 'text/csv', 'Accept': 'text/csv'}
+    if not keep_alive:
+        headers['Connection'] = 'close'
+    connection = None
+    for _ in range(NUM_REQUESTS):
+        start = time.perf_counter()
+        if connection is None:
+            connection = http.client.HTTPConnection('127.0.0.1', port)
+        connection.request('POST', '/invocations', body=body, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        assert response.status == 200, response.status
+        if not keep_alive or response.will_close:
+            connection.close()
+            connection = None
+        latencies.append(time.perf_counter() - start)
+
+
+def _measure(model_file, name, settings_env, keep_alive):
+    port = _free_port()
+    server = _start_server(port, model_file, settings_env)
+    try:
+        body = ','.join(['0.5'] * NUM_FEATURES)
+        # Warm up the workers, so that model loading is not measured
+        _client(port, False, body, [])
+
+        latencies = []
+        clients = [threading.Thread(target=_client, args=(port, keep_alive, body, latencies))
+                   for _ in range(NUM_CLIENTS)]
+        start = time.perf_counter()
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {'setting': name, 'keep_alive': keep_alive, 'requests_per_s': len(latencies) / elapsed,
+            'p50_ms': np.percentile(latencies, 50) * 1000, 'p99_ms': np.percentile(latencies, 99) * 1000}
+
+
+def run():
+    with tempfile.TemporaryDirectory() as model_dir:
+        model_file = os.path.join(model_dir, 'model.joblib')
+        _train(model_file)
+        return [_measure(model_file, name, settings_env, keep_alive) for name, settings_env, keep_alive in SETTINGS]
+
+
+def main():
+    print('{:>32} {:>14} {:>10} {:>10}'.format('setting', 'requests_per_s', 'p50_ms', 'p99_ms'))
+    for result in run():
+        print('{:>32} {:>14.1f} {:>10.3f} {:>10.3f}'.format(
+            result['setting'], result['requests_per_s'], result['p50_ms'], result['p99_ms']))
+
+
+if __name__ == '__main__':
+    main()
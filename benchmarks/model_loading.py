@@ -0,0 +1,93 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Load time and total worker PSS of a joblib model read into the heap versus memory-mapped.
+
+Every worker loads the model itself, as gunicorn and MMS workers do without preloading, and serves a few
+predictions so that the pages it needs are faulted in.
+
+Usage:
+    python -m benchmarks.model_loading
+"""
+from __future__ import absolute_import
+
+import multiprocessing
+import os
+import tempfile
+import time
+
+import joblib
+import numpy as np
+import psutil
+from sklearn.neighbors import KNeighborsClassifier
+
+from sagemaker_sklearn_container import model_loader
+
+NUM_WORKERS = 4
+NUM_ROWS = 250000
+NUM_FEATURES = 50
+
+
+def _train(path):
+    random_state = np.random.RandomState(0)
+    x = random_state.rand(NUM_ROWS, NUM_FEATURES)
+    y = random_state.randint(0, 2, NUM_ROWS)
+    joblib.dump(KNeighborsClassifier(algorithm='brute').fit(x, y), path)
+
+
+def _worker(path, mmap_mode, ready, done):
+    start = time.time()
+    model = model_loader.load_model(path, mmap_mode=mmap_mode)
+    load_s = time.time() - start
+    model.predict(np.random.RandomState(1).rand(10, NUM_FEATURES))
+    ready.put((os.getpid(), load_s))
+    done.wait()
+
+
+def _measure(path, mmap_mode):
+    context = multiprocessing.get_context('fork')
+    ready, done = context.Queue(), context.Event()
+    workers = [context.Process(target=_worker, args=(path, mmap_mode, ready, done)) for _ in range(NUM_WORKERS)]
+    for worker in workers:
+        worker.start()
+
+    load_times, pss = [], 0
+    for _ in workers:
+        pid, load_s = ready.get()
+        load_times.append(load_s)
+        pss += psutil.Process(pid).memory_full_info().pss
+    done.set()
+    for worker in workers:
+        worker.join()
+
+    return {'mmap_mode': str(mmap_mode), 'workers': NUM_WORKERS, 'load_s': max(load_times), 'pss_bytes': pss}
+
+
+def run():
+    with tempfile.TemporaryDirectory() as model_dir:
+        path = os.path.join(model_dir, model_loader.DEFAULT_MODEL_FILENAME)
+        _train(path)
+        model_bytes = os.path.getsize(path)
+        return [dict(_measure(path, mmap_mode), model_bytes=model_bytes) for mmap_mode in (None, 'r')]
+
+
+def main():
+    print('{:>10} {:>8} {:>10} {:>10} {:>14}'.format('mmap_mode', 'workers', 'model_MB', 'load_s', 'total_pss_MB'))
+    for result in run():
+        print('{:>10} {:>8} {:>10.1f} {:>10.4f} {:>14.1f}'.format(result['mmap_mode'], result['workers'],
+                                                                  result['model_bytes'] / 1024 ** 2,
+                                                                  result['load_s'],
+                                                                  result['pss_bytes'] / 1024 ** 2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Per-worker memory of a forked model server: loading the model in each worker versus preloading it in the parent.
+
+Workers are forked the way gunicorn forks them, serve a few predictions and run a full collection. Memory is
+reported as PSS (proportional set size), which splits shared pages between the processes sharing them, because
+RSS counts every shared page once per worker and hides the effect of copy-on-write sharing.
+
+Usage:
+    python -m benchmarks.preload_memory
+"""
+from __future__ import absolute_import
+
+import gc
+import multiprocessing
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import psutil
+from sklearn.ensemble import RandomForestClassifier
+
+NUM_WORKERS = 4
+NUM_ROWS = 20000
+NUM_FEATURES = 20
+
+
+def _train(path):
+    random_state = np.random.RandomState(0)
+    x = random_state.rand(NUM_ROWS, NUM_FEATURES)
+    y = random_state.randint(0, 2, NUM_ROWS)
+    with open(path, 'wb') as f:
+        pickle.dump(RandomForestClassifier(n_estimators=50, random_state=0).fit(x, y), f)
+
+
+def _load(path):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def _worker(model, path, ready, done):
+    gc.enable()
+    if model is None:
+        model = _load(path)
+    payload = np.random.RandomState(1).rand(10, NUM_FEATURES)
+    for _ in range(10):
+        model.predict(payload)
+    gc.collect()
+    ready.put(os.getpid())
+    done.wait()
+
+
+def _measure(variant, path, results):
+    context = multiprocessing.get_context('fork')
+    model = None
+    if variant != 'per_worker':
+        gc.disable()
+        model = _load(path)
+        if variant == 'preload_gc_freeze':
+            gc.freeze()
+
+    ready, done = context.Queue(), context.Event()
+    workers = [context.Process(target=_worker, args=(model, path, ready, done)) for _ in range(NUM_WORKERS)]
+    for worker in workers:
+        worker.start()
+
+    memory = [psutil.Process(ready.get()).memory_full_info() for _ in workers]
+    done.set()
+    for worker in workers:
+        worker.join()
+
+    results.put({'variant': variant, 'workers': NUM_WORKERS,
+                 'rss_bytes': sum(m.rss for m in memory), 'pss_bytes': sum(m.pss for m in memory)})
+
+
+def run():
+    context = multiprocessing.get_context('fork')
+    results = []
+    with tempfile.TemporaryDirectory() as model_dir:
+        path = os.path.join(model_dir, 'model.pkl')
+        _train(path)
+        for variant in ('per_worker', 'preload', 'preload_gc_freeze'):
+            # Each variant runs in its own process, standing in for the gunicorn master.
+            queue = context.Queue()
+            process = context.Process(target=_measure, args=(variant, path, queue))
+            process.start()
+            results.append(queue.get())
+            process.join()
+    return results
+
+
+def main():
+    print('{:>18} {:>8} {:>16} {:>16}'.format('variant', 'workers', 'total_rss_MB', 'total_pss_MB'))
+    for result in run():
+        print('{:>18} {:>8} {:>16.1f} {:>16.1f}'.format(result['variant'], result['workers'],
+                                                        result['rss_bytes'] / 1024 ** 2,
+                                                        result['pss_bytes'] / 1024 ** 2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Runs the benchmarks and writes their results as JSON, or compares two such files to find regressions.
+
+Every benchmark module has a ``run()`` that returns a list of dicts. Values named ``*_s``, ``*_ms`` or ``*_bytes``
+are costs, and a result file from another container version regresses where they grew. The other float values
+are derived measurements, and the remaining values identify the case that was measured.
+
+Usage:
+    python -m benchmarks.suite run --output results.json [--benchmarks inference encoder]
+    python -m benchmarks.suite compare baseline.json results.json [--threshold 0.1]
+"""
+from __future__ import absolute_import
+
+import argparse
+import importlib
+from importlib import metadata
+import json
+import multiprocessing
+import platform
+import sys
+import time
+
+import numpy as np
+import sklearn
+
+BENCHMARKS = ['csv_decoder', 'encoder', 'input_fn_memory', 'inference', 'model_loading', 'preload_memory',
+              'cpu_affinity', 'keep_alive', 'cold_start']
+COST_SUFFIXES = ('_s', '_ms', '_bytes')
+
+
+def _to_json(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _metadata():
+    try:
+        version = metadata.version('sagemaker_sklearn_container')
+    except metadata.PackageNotFoundError:
+        version = None
+    return {'container_version': version, 'python': platform.python_version(), 'numpy': np.__version__,
+            'scikit-learn': sklearn.__version__, 'cpu_count': multiprocessing.cpu_count(),
+            'platform': platform.platform(), 'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}
+
+
+def run(benchmarks=BENCHMARKS):
+    """Runs the named benchmarks. Returns: a dict with the run's metadata and the results of each benchmark."""
+    results = {}
+    for name in benchmarks:
+        module = importlib.import_module('benchmarks.' + name)
+        start = time.time()
+        results[name] = [{key: _to_json(value) for key, value in result.items()} for result in module.run()]
+        print('{} finished in {:.1f}s'.format(name, time.time() - start), file=sys.stderr)
+    return {'metadata': _metadata(), 'results': results}
+
+
+def _is_cost(key, value):
+    return key.endswith(COST_SUFFIXES) and isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _case(result):
+    return tuple(sorted((key, value) for key, value in result.items()
+                        if not _is_cost(key, value) and not isinstance(value, float)))
+
+
+def compare(baseline, current, threshold=0.1):
+    """Compares the costs measured in two result files.
+    Args:
+        baseline: results returned by ``run``, as loaded from JSON.
+        current: results returned by ``run``, as loaded from JSON.
+        threshold: relative growth of a cost above which it is reported as a regression.
+    Returns: a list of dicts, one per cost measured in both, with the benchmark, case, measurement, both values,
+        their ratio and whether it is a regression.
+    """
+    comparisons = []
+    for name, current_results in current['results'].items():
+        baseline_cases = {_case(result): result for result in baseline['results'].get(name, [])}
+        for result in current_results:
+            baseline_result = baseline_cases.get(_case(result))
+            if baseline_result is None:
+                continue
+            for key, value in result.items():
+                if not _is_cost(key, value) or not baseline_result.get(key):
+                    continue
+                ratio = value / baseline_result[key]
+                comparisons.append({'benchmark': name, 'case': dict(_case(result)), 'measurement': key,
+                                    'baseline': baseline_result[key], 'current': value, 'ratio': ratio,
+                                    'regression': ratio > 1 + threshold})
+    return comparisons
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='run benchmarks and write their results')
+    run_parser.add_argument('--output', default='-', help='JSON file to write, stdout by default')
+    run_parser.add_argument('--benchmarks', nargs='+', default=BENCHMARKS, choices=BENCHMARKS)
+
+    compare_parser = subparsers.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = json.dumps(run(args.benchmarks), indent=2)
+        if args.output == '-':
+            print(results)
+        else:
+            with open(args.output, 'w') as f:
+                f.write(results + '\n')
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    regressions = [comparison for comparison in compare(baseline, current, args.threshold)
+                   if comparison['regression']]
+    for regression in regressions:
+        print('{benchmark} {case} {measurement}: {baseline:.6g} -> {current:.6g} ({ratio:.2f}x)'.format(
+            **regression))
+    print('{} regressions above {:.0%}'.format(len(regressions), args.threshold))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
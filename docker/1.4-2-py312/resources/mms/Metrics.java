@@ -0,0 +1,90 @@
+package software.amazon.ai.mms.plugins.endpoint;
+
+import java.io.File;
+import java.io.IOException;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import software.amazon.ai.mms.servingsdk.Context;
+import software.amazon.ai.mms.servingsdk.ModelServerEndpoint;
+import software.amazon.ai.mms.servingsdk.annotations.Endpoint;
+import software.amazon.ai.mms.servingsdk.annotations.helpers.EndpointTypes;
+import software.amazon.ai.mms.servingsdk.http.Request;
+import software.amazon.ai.mms.servingsdk.http.Response;
+
+/**
+The endpoint source code for the Prometheus metrics of the model server workers. It is built into endpoints-1.0.jar
+with ExecutionParameters.java by the mms-plugins stage of docker/.../final/Dockerfile.cpu, following the
+instructions in ExecutionParameters.java, with both classes listed in
+plugins/endpoints/src/main/resources/META-INF/services/*.
+
+Each worker writes its metrics to <pid>.prom in SAGEMAKER_METRICS_DIR. This merges the files of the live workers
+like sagemaker_sklearn_container.prometheus.collect, with the samples of each metric family under a single HELP
+and TYPE header.
+**/
+@Endpoint(
+        urlPattern = "metrics",
+        endpointType = EndpointTypes.INFERENCE,
+        description = "Prometheus metrics endpoint")
+public class Metrics extends ModelServerEndpoint {
+
+    private static final String DEFAULT_METRICS_DIR = "/tmp/sagemaker-metrics";
+    private static final String CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8";
+
+    @Override
+    public void doGet(Request req, Response rsp, Context ctx) throws IOException {
+        String directory = System.getenv("SAGEMAKER_METRICS_DIR");
+        File[] files = new File(directory == null ? DEFAULT_METRICS_DIR : directory).listFiles();
+        if (files == null) {
+            files = new File[0];
+        }
+        Arrays.sort(files);
+
+        // Family name -> (headers, samples)
+        Map<String, List<List<String>>> families = new LinkedHashMap<>();
+        for (File file : files) {
+            String name = file.getName();
+            if (!name.endsWith(".prom")) {
+                continue;
+            }
+            String pid = name.substring(0, name.length() - ".prom".length());
+            // The image runs Java 8, without ProcessHandle
+            if (!pid.matches("[0-9]+") || !new File("/proc/" + pid).exists()) {
+                continue;
+            }
+
+            List<List<String>> family = null;
+            for (String line : Files.readAllLines(file.toPath(), StandardCharsets.UTF_8)) {
+                if (line.startsWith("# ")) {
+                    String familyName = line.split(" ")[2];
+                    family = families.get(familyName);
+                    if (family == null) {
+                        family = Arrays.asList(new ArrayList<String>(), new ArrayList<String>());
+                        families.put(familyName, family);
+                    }
+                    if (!family.get(0).contains(line)) {
+                        family.get(0).add(line);
+                    }
+                } else if (!line.isEmpty() && family != null) {
+                    family.get(1).add(line);
+                }
+            }
+        }
+
+        StringBuilder body = new StringBuilder();
+        for (List<List<String>> family : families.values()) {
+            for (List<String> lines : family) {
+                for (String line : lines) {
+                    body.append(line).append('\n');
+                }
+            }
+        }
+
+        rsp.setContentType(CONTENT_TYPE);
+        rsp.getOutputStream().write(body.toString().getBytes(StandardCharsets.UTF_8));
+    }
+}
@@ -0,0 +1,176 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Asyncio front end for single-model serving.
+
+A single event loop process reads requests and writes responses for every connection, so slow clients only hold
+a coroutine. Complete requests are handed to a pool of processes that hold the model and run them through the
+WSGI app built by ``serving.load_app``, so the routes, user module functions and error handling are the same as
+with gunicorn. Only the pool processes hold a model copy.
+"""
+from __future__ import absolute_import
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import gc
+import logging
+import multiprocessing
+import os
+
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+
+from sagemaker_containers import _env as env, _modules as modules
+
+from sagemaker_sklearn_container import cpu_affinity, gunicorn_config, startup, thread_limits
+
+ASYNC_SERVER_ENV = 'SAGEMAKER_ASYNC_SERVER'
+
+logger = logging.getLogger(__name__)
+
+# Pool of processes that hold the model, created by start before the event loop runs
+_executor = None
+
+
+def is_enabled():
+    return os.environ.get(ASYNC_SERVER_ENV, 'false').lower() == 'true'
+
+
+def _initialize_worker():
+    from sagemaker_sklearn_container import serving
+
+    gc.enable()
+    # Forked after NumPy was imported, so the thread limits of the environment aren't read by its thread pools
+    thread_limits.limit_loaded_thread_pools()
+    if cpu_affinity.is_enabled():
+        cpu_affinity.pin_worker()
+    serving.load_app()
+    # Pings are answered by the event loop process
+    startup.report()
+
+
+def _new_executor():
+    return ProcessPoolExecutor(max_workers=env.ServingEnv().model_server_workers,
+                               mp_context=multiprocessing.get_context('fork'), initializer=_initialize_worker)
+
+
+def _replace_executor(broken_executor):
+    """Replaces a pool that a process left broken by dying, once for all the requests that found it broken."""
+    global _executor
+
+    if _executor is broken_executor:
+        logger.warning('A model process died, restarting the pool of model processes')
+        _executor = _new_executor()
+        broken_executor.shutdown(wait=False)
+
+
+def _handle(method, path, query_string, headers, body):
+    """Runs a request through the WSGI app of the pool process. Arguments and return value are pickled.
+    Returns: the response status code, headers and body.
+    """
+    from sagemaker_sklearn_container import serving
+
+    environ = EnvironBuilder(path=path, method=method, query_string=query_string, headers=headers,
+                             data=body).get_environ()
+    app_iter, status, response_headers = run_wsgi_app(serving.load_app(), environ, buffered=True)
+    try:
+        response_body = b''.join(app_iter)
+    finally:
+        if hasattr(app_iter, 'close'):
+            app_iter.close()
+    return int(status.split(' ', 1)[0]), list(response_headers.items()), response_body
+
+
+async def _read_body(receive):
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        chunks.append(message.get('body', b''))
+        more_body = message.get('more_body', False)
+    return b''.join(chunks)
+
+
+async def _send_response(send, status, headers, body):
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': [(name.encode('latin-1'), value.encode('latin-1')) for name, value in headers]})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def app(scope, receive, send):
+    """ASGI application serving /ping on the event loop and every other request in the process pool."""
+    if scope['type'] == 'lifespan':
+        # The process pool is started before the event loop and shut down after it
+        await receive()
+        await send({'type': 'lifespan.startup.complete'})
+        await receive()
+        await send({'type': 'lifespan.shutdown.complete'})
+        return
+
+    if scope['type'] != 'http':
+        return
+
+    # Health checks must not queue up behind predictions
+    if scope['path'] == '/ping' and scope['method'] == 'GET':
+        startup.on_ping()
+        await _send_response(send, 200, [], b'')
+        return
+
+    body = await _read_body(receive)
+    headers = [(name.decode('latin-1'), value.decode('latin-1')) for name, value in scope['headers']]
+    executor = _executor
+    try:
+        status, response_headers, response_body = await asyncio.get_running_loop().run_in_executor(
+            executor, _handle, scope['method'], scope['path'], scope['query_string'].decode('latin-1'), headers,
+            body)
+    except BrokenProcessPool:
+        # The pool fails every pending and later request once one of its processes dies, e.g. out of memory
+        _replace_executor(executor)
+        status, response_headers, response_body = 500, [('Content-Type', 'text/plain')], b'Model process died'
+    await _send_response(send, status, response_headers, response_body)
+
+
+def start():
+    """Starts the event loop on the SageMaker port, with a pool of SAGEMAKER_MODEL_SERVER_WORKERS model processes.
+
+    Requires uvicorn. The user module is downloaded and installed once, before the pool processes are forked. With
+    SAGEMAKER_PRELOAD_MODEL the model is loaded before too, so that they share its memory. A pool broken by the
+    death of one of its processes is replaced. The connection settings are the same as for gunicorn, see
+    ``gunicorn_config.CONNECTION_SETTINGS_ENV``.
+    """
+    from sagemaker_sklearn_container import serving
+    import uvicorn
+
+    global _executor
+
+    serving_env = env.ServingEnv()
+    if serving_env.module_name:
+        with startup.timed(startup.USER_MODULE):
+            modules.import_module(serving_env.module_dir, serving_env.module_name)
+
+    if serving.is_preload_model():
+        gc.disable()
+        serving.load_app()
+        gc.freeze()
+
+    _executor = _new_executor()
+    # Forks the pool processes, and fails before binding the port if the model can't be loaded
+    _executor.submit(os.getpid).result()
+    gc.enable()
+
+    settings = gunicorn_config.connection_settings()
+    uvicorn_settings = {'timeout_keep_alive': settings.get('keepalive'),
+                        'limit_concurrency': settings.get('worker_connections'), 'backlog': settings.get('backlog')}
+    try:
+        uvicorn.run(app, host='0.0.0.0', port=int(serving_env.http_port), lifespan='on', log_level='info',
+                    **{name: int(value) for name, value in uvicorn_settings.items() if value})
+    finally:
+        _executor.shutdown()
@@ -0,0 +1,25 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Content types supported by the Scikit-learn container in addition to the ones defined by
+``sagemaker_inference.content_types``."""
+from __future__ import absolute_import
+
+from sagemaker_inference.content_types import CSV, JSON
+
+JSONLINES = "application/jsonlines"
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+PARQUET = "application/x-parquet"
+NPZ = "application/x-npz"
+
+# Content types that default_input_fn decodes into float32 matrices.
+FLOAT32_TYPES = [CSV, JSON, ARROW_STREAM, PARQUET]
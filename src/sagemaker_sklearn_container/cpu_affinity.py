@@ -0,0 +1,111 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Pinning of inference workers to core sets that don't cross NUMA nodes.
+
+Each worker claims a free core set by locking its slot file, so gunicorn and MMS workers need no coordinator and
+the slot of a worker that dies is freed with its lock. Linux allocates anonymous memory on the NUMA node of the
+core that first touches it, so a model read into the heap after pinning is local to the worker's node. That does not
+hold for memory-mapped artifacts, whose pages stay in the page cache on whichever node first read the file and are
+shared by the workers of every node, so the default model_fns load models without memory-mapping when pinning is on.
+"""
+from __future__ import absolute_import
+import fcntl
+import glob
+import logging
+import os
+import re
+
+CPU_AFFINITY_ENV = 'SAGEMAKER_CPU_AFFINITY'
+SLOT_DIRECTORY = os.path.join('/tmp', 'sagemaker-cpu-affinity')
+NUMA_NODE_DIRECTORY = '/sys/devices/system/node'
+
+logger = logging.getLogger(__name__)
+
+# Keeps the claimed slot locked for the life of the worker
+_slot_file = None
+
+
+def is_enabled():
+    return os.environ.get(CPU_AFFINITY_ENV, 'false').lower() == 'true'
+
+
+def _parse_cpu_list(cpu_list):
+    """Parses a sysfs cpu list such as '0-3,8-11'."""
+    cpus = []
+    for cpu_range in cpu_list.strip().split(','):
+        if cpu_range:
+            first, _, last = cpu_range.partition('-')
+            cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def numa_nodes():
+    """Returns the cpus available to this process, grouped by NUMA node."""
+    available = os.sched_getaffinity(0)
+    nodes = []
+    node_dirs = sorted(glob.glob(os.path.join(NUMA_NODE_DIRECTORY, 'node[0-9]*')),
+                       key=lambda node_dir: int(re.search(r'(\d+)$', node_dir).group(1)))
+    for node_dir in node_dirs:
+        with open(os.path.join(node_dir, 'cpulist')) as f:
+            cpus = [cpu for cpu in _parse_cpu_list(f.read()) if cpu in available]
+        if cpus:
+            nodes.append(cpus)
+    return nodes or [sorted(available)]
+
+
+def core_sets(cores_per_worker, nodes=None):
+    """Splits the cpus of each NUMA node into sets of cores_per_worker cores. Cores that don't fill a set are left
+    out, so that no set crosses a node. If no node has cores_per_worker cpus, there is a single set of all cpus.
+    """
+    nodes = numa_nodes() if nodes is None else nodes
+    sets = []
+    for cpus in nodes:
+        last_start = len(cpus) - cores_per_worker
+        sets.extend(cpus[i:i + cores_per_worker] for i in range(0, last_start + 1, cores_per_worker))
+    return sets or [[cpu for cpus in nodes for cpu in cpus]]
+
+
+def cores_per_worker():
+    """Returns the number of cores per worker: the threads each worker's thread pools are limited to."""
+    return max(1, int(os.environ.get('OMP_NUM_THREADS') or 1))
+
+
+def _claim_slot(num_slots):
+    global _slot_file
+
+    if not os.path.isdir(SLOT_DIRECTORY):
+        os.makedirs(SLOT_DIRECTORY, exist_ok=True)
+
+    for slot in range(num_slots):
+        slot_file = open(os.path.join(SLOT_DIRECTORY, 'slot-{}.lock'.format(slot)), 'w')
+        try:
+            fcntl.flock(slot_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (IOError, OSError):
+            slot_file.close()
+            continue
+        _slot_file = slot_file
+        return slot
+
+    # More workers than core sets, share them
+    return os.getpid() % num_slots
+
+
+def pin_worker():
+    """Pins the calling worker process to a free core set. Must be called before the worker loads the model.
+    Returns: the cpus the worker is pinned to.
+    """
+    sets = core_sets(cores_per_worker())
+    cpus = sets[_claim_slot(len(sets))]
+    os.sched_setaffinity(0, cpus)
+    logger.info('Pinned worker {} to cpus {}'.format(os.getpid(), cpus))
+    return cpus
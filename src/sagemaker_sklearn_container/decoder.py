@@ -0,0 +1,510 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module contains functionality for converting request payloads to NumPy arrays.
+
+It mirrors the patched ``sagemaker_inference.decoder`` shipped in the container images, and is
+shared by the gunicorn (``serving``) and MMS (``handler_service``) stacks. pyarrow is only imported
+when an Arrow or Parquet payload is decoded, and scipy.sparse when a sparse NPZ payload is.
+"""
+from __future__ import absolute_import
+
+import json
+import re
+import warnings
+
+import numpy as np
+from numpy.lib import format as npy_format
+from six import BytesIO, StringIO
+
+from sagemaker_inference import content_types, errors
+
+from sagemaker_sklearn_container import content_types as sklearn_content_types
+
+_COMMA = ord(',')
+_NEWLINE = ord('\n')
+_BULK_JSON_MIN_BYTES = 64 * 1024
+_CHUNK_BYTES = 1024 ** 2
+_JSON_AFFIX_CHARS = 256
+_JSON_INSTANCES = re.compile(br'\s*\{\s*"instances"\s*:')
+_JSON_WHITESPACE = b' \t\r\n'
+_JSON_NUMERIC_CHARS = b'0123456789+-.eE,[]'
+_JSON_STRUCTURAL_CHARS = b',[]'
+_CSV_BLANKS = b' \t'
+
+
+def _to_bytes(string_like):  # type: (str or bytes) -> bytes
+    return string_like.encode('utf-8') if isinstance(string_like, str) else bytes(string_like)
+
+
+def _as_text(string_like):  # type: (str or bytes) -> str or bytes
+    return string_like if isinstance(string_like, (str, bytes, bytearray)) else bytes(string_like)
+
+
+def _chunk_bounds(data, separator, start, end):
+    """Split ``data[start:end]`` into ranges of about ``_CHUNK_BYTES`` that end right after a separator,
+    except for the last one."""
+    if isinstance(data, str):
+        separator = separator.decode('ascii')
+    while start < end:
+        stop = data.find(separator, start + _CHUNK_BYTES, end) + 1 or end
+        yield start, stop
+        start = stop
+
+
+def _byte_mask(buf, chars):
+    mask = buf == chars[0]
+    for char in chars[1:]:
+        mask |= buf == char
+    return mask
+
+
+def _strip_json_whitespace(data):  # type: (bytes) -> bytes or None
+    """Remove the whitespace around the commas and brackets of a JSON array.
+    Returns None if there is whitespace inside a number, as in ``[1 2]``."""
+    stripped = data.translate(None, _JSON_WHITESPACE)
+    if len(stripped) == len(data):
+        return data
+
+    # Padded with separators, so that every run of whitespace has a byte before and after it
+    buf = np.frombuffer(b',' + data + b',', dtype=np.uint8)
+    whitespace = _byte_mask(buf, _JSON_WHITESPACE)
+    positions = np.flatnonzero(whitespace)
+    before_runs = buf[positions[~whitespace[positions - 1]] - 1]
+    after_runs = buf[positions[~whitespace[positions + 1]] + 1]
+    if (~_byte_mask(before_runs, _JSON_STRUCTURAL_CHARS) & ~_byte_mask(after_runs, _JSON_STRUCTURAL_CHARS)).any():
+        return None
+    return stripped
+
+
+def _is_digit(buf):
+    return (buf - np.uint8(ord('0'))) < 10
+
+
+def _is_json_numbers(data):  # type: (bytes) -> bool
+    """Check the numbers of a JSON array without whitespace against the JSON number grammar, which rejects
+    ``+1``, ``.5``, ``1.`` and ``01`` among others. Numbers with more than one fraction or exponent are left to
+    the CSV parser, which fails on them.
+
+    Only the bytes around the non-digits are looked at, so that the checks run on a fraction of the payload.
+    """
+    # Padded with separators, so that every byte has one byte before it and two after it. The leading
+    # separator is checked too, as it stands for the comma that ends the previous chunk of a payload.
+    buf = np.frombuffer(b',' + data + b',,', dtype=np.uint8)
+    positions = np.flatnonzero(~_is_digit(buf[:-2]))
+    current, previous, following = buf[positions], buf[positions - 1], buf[positions + 1]
+    previous_separator = _byte_mask(previous, _JSON_STRUCTURAL_CHARS)
+    previous_exponent = _byte_mask(previous, b'eE')
+    following_digit = _is_digit(following)
+
+    invalid = (current == ord('.')) & ~(_is_digit(previous) & following_digit)
+    invalid |= _byte_mask(current, b'eE') & ~(_is_digit(previous) & (following_digit | _byte_mask(following, b'+-')))
+    invalid |= (current == ord('+')) & ~(previous_exponent & following_digit)
+    minus = current == ord('-')
+    invalid |= minus & ~((previous_separator | previous_exponent) & following_digit)
+    # The integer part of a number, after a separator or the sign of the number, has no leading zeros
+    integer_start = _byte_mask(current, b',[') | (minus & previous_separator)
+    invalid |= integer_start & (following == ord('0')) & _is_digit(buf[positions + 2])
+    return not invalid.any()
+
+
+def _parse_numeric_json(string_like, dtype=None):  # type: (str or bytes, np.dtype) -> np.array or None
+    """Parse a JSON array of numbers, or of equal-length arrays of numbers, in bulk.
+
+    Handles ``[...]``, ``[[...], [...]]`` and the same arrays wrapped as ``{"instances": ...}``.
+    The payload is checked and rewritten as CSV in chunks of about ``_CHUNK_BYTES``, which are
+    handed to ``_parse_numeric_csv``, so neither intermediate Python objects nor full-size copies
+    of the payload are created. Returns None for any other document, including empty rows and
+    numbers ``json.loads`` would reject, so that the caller raises the same error it does.
+
+    Args:
+        string_like (str or bytes): JSON payload.
+        dtype (dtype, optional): floating point data type of the resulting array. Defaults to float64.
+
+    Returns:
+        (np.array or None): array with the same shape ``np.array(json.loads(...))`` would return, or None.
+    """
+    data = _as_text(string_like)
+    start, end = 0, len(data)
+    match = _JSON_INSTANCES.match(_to_bytes(data[:_JSON_AFFIX_CHARS]))
+    if match:
+        # The pattern and the JSON whitespace are ASCII, so byte and character offsets agree.
+        tail = _to_bytes(data[-_JSON_AFFIX_CHARS:])
+        start, end = match.end(), end - (len(tail) - len(tail.rstrip(_JSON_WHITESPACE)))
+        if end <= start or _to_bytes(data[end - 1:end]) != b'}':
+            return None
+        end -= 1
+
+    arrays = []
+    pending = None
+    row_separator = None
+    for chunk_start, chunk_end in _chunk_bounds(data, b',', start, end):
+        chunk = _strip_json_whitespace(_to_bytes(data[chunk_start:chunk_end]))
+        if chunk is None or chunk.translate(None, _JSON_NUMERIC_CHARS) or b'[]' in chunk:
+            return None
+        if not _is_json_numbers(chunk):
+            return None
+
+        if pending is None:
+            if chunk.startswith(b'[['):
+                pending, row_separator = chunk[2:], b'],['
+            elif chunk.startswith(b'['):
+                pending, row_separator = chunk[1:], b','
+            else:
+                return None
+        else:
+            pending += chunk
+
+        cut = pending.rfind(row_separator)
+        if cut > 0:
+            arrays.append(_parse_json_rows(pending[:cut], row_separator, dtype))
+            pending = pending[cut + len(row_separator):]
+
+    closing = b']]' if row_separator == b'],[' else b']'
+    if pending is None or not pending.endswith(closing):
+        return None
+    arrays.append(_parse_json_rows(pending[:-len(closing)], row_separator, dtype))
+
+    if any(array is None for array in arrays) or len({array.shape[1] for array in arrays}) != 1:
+        return None
+    array = arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+    return array if row_separator == b'],[' else array.reshape(-1)
+
+
+def _parse_json_rows(rows, row_separator, dtype):  # type: (bytes, bytes, np.dtype) -> np.array or None
+    # A trailing separator would read as the line terminator of the last row.
+    if rows.endswith(row_separator):
+        return None
+    rows = rows.replace(row_separator, b'\n')
+    if b'[' in rows or b']' in rows:
+        return None
+    return _parse_numeric_csv(rows, dtype)
+
+
+def _json_to_numpy(string_like, dtype=None):  # type: (str) -> np.array
+    """Convert a JSON object to a numpy array.
+
+    When a dtype is requested, large numeric arrays (optionally wrapped in ``{"instances": ...}``)
+    are parsed in bulk by ``_parse_numeric_json``; anything else goes through ``json.loads``, which
+    is faster than the bulk parser's fixed overhead for small payloads.
+
+    Args:
+        string_like (str): JSON string.
+        dtype (dtype, optional): Data type of the resulting array, written directly without an
+            intermediate array. If None, the dtypes will be determined by the contents of each column,
+            individually.
+
+    Returns:
+        (np.array): numpy array
+    """
+    if dtype is not None and len(string_like) >= _BULK_JSON_MIN_BYTES:
+        array = _parse_numeric_json(string_like, dtype)
+        if array is not None:
+            return array
+
+    data = json.loads(string_like)
+    if isinstance(data, dict) and 'instances' in data:
+        data = data['instances']
+    return np.array(data, dtype=dtype)
+
+
+def _has_blank_csv_field(data):  # type: (bytes) -> bool
+    """Check for an empty or whitespace-only field or line, which ``np.fromstring`` would read as -1
+    where ``np.genfromtxt`` reads NaN or skips the line."""
+    buf = np.frombuffer(data.translate(None, _CSV_BLANKS), dtype=np.uint8)
+    if not buf.size:
+        return True
+    separators = (buf == _COMMA) | (buf == _NEWLINE)
+    return bool(separators[0] or separators[-1] or (separators[1:] & separators[:-1]).any())
+
+
+def _parse_numeric_csv(string_like, dtype=None):  # type: (str or bytes, np.dtype) -> np.array or None
+    """Parse a rectangular, purely numeric CSV payload in bulk.
+
+    The payload is parsed in chunks of whole lines of about ``_CHUNK_BYTES``, so that the
+    vectorized checks never hold more than a chunk's worth of temporaries. Returns None when the
+    payload is not a plain numeric matrix (ragged rows, quoted, non-numeric or blank fields,
+    blank lines, ...), in which case the caller falls back to ``np.genfromtxt``.
+
+    Args:
+        string_like (str or bytes): CSV payload.
+        dtype (dtype, optional): floating point data type of the resulting array. Defaults to float64.
+
+    Returns:
+        (np.array or None): 2-D array of shape (rows, columns), or None.
+    """
+    dtype = np.dtype(dtype or np.float64)
+    if dtype.kind != 'f':
+        return None
+
+    data = _as_text(string_like)
+    arrays = []
+    for chunk_start, chunk_end in _chunk_bounds(data, b'\n', 0, len(data)):
+        array = _parse_csv_lines(_to_bytes(data[chunk_start:chunk_end]), dtype)
+        if array is None or (arrays and array.shape[1] != arrays[0].shape[1]):
+            return None
+        arrays.append(array)
+
+    if not arrays:
+        return None
+    return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+
+def _parse_csv_lines(data, dtype):  # type: (bytes, np.dtype) -> np.array or None
+    """Parse whole CSV lines: field and row boundaries are located with vectorized byte comparisons,
+    and the values are converted by NumPy's C text parser in a single pass."""
+    # A single line terminator ends the last line; any other is a blank line.
+    if data.endswith(b'\r\n'):
+        data = data[:-2]
+    elif data.endswith(b'\n'):
+        data = data[:-1]
+    if not data:
+        return None
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n')
+
+    if _has_blank_csv_field(data):
+        return None
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    row_starts = np.flatnonzero(buf == _NEWLINE) + 1
+    row_starts = np.concatenate(([0], row_starts))
+
+    commas_per_row = np.add.reduceat(buf == _COMMA, row_starts, dtype=np.intp)
+    if (commas_per_row != commas_per_row[0]).any():
+        return None
+
+    n_rows = len(row_starts)
+    n_cols = int(commas_per_row[0]) + 1
+
+    try:
+        with warnings.catch_warnings():
+            # NumPy < 2 warns instead of raising when the text cannot be read to its end.
+            warnings.simplefilter('error', DeprecationWarning)
+            values = np.fromstring(data.replace(b'\n', b','), dtype=dtype, sep=',')
+    except (ValueError, DeprecationWarning):
+        return None
+
+    if values.size != n_rows * n_cols:
+        return None
+
+    return values.reshape(n_rows, n_cols)
+
+
+def _csv_to_numpy(string_like, dtype=None):  # type: (str) -> np.array
+    """Convert a CSV object to a numpy array.
+
+    When a floating point dtype is requested, numeric payloads are parsed in bulk by
+    ``_parse_numeric_csv``; anything else goes through ``np.genfromtxt``.
+
+    Args:
+        string_like (str): CSV string.
+        dtype (dtype, optional): Data type of the resulting array, written directly without an
+            intermediate array. If None, the dtypes will be determined by the contents of each column,
+            individually.
+
+    Returns:
+        (np.array): numpy array
+    """
+    if dtype is not None:
+        array = _parse_numeric_csv(string_like, dtype)
+        if array is not None:
+            # np.genfromtxt drops single-row and single-column dimensions.
+            return array.squeeze()
+
+    if not isinstance(string_like, str):
+        string_like = bytes(string_like).decode('utf-8')
+    stream = StringIO(string_like)
+    return np.genfromtxt(stream, dtype=dtype, delimiter=",")
+
+
+_NPY_MAX_HEADER_SIZE = 2 ** 16 + 10
+_NPY_HEADER_READERS = {
+    (1, 0): npy_format.read_array_header_1_0,
+    (2, 0): npy_format.read_array_header_2_0,
+}
+
+
+def _npy_to_numpy(npy_array, dtype=None):  # type: (object) -> np.array
+    """Convert a NPY array into numpy.
+
+    The NPY header is parsed and the array is returned as a view over the request buffer, so the
+    payload is not copied. The view is read-only when the request buffer is immutable (``bytes``).
+    Other header versions, and payloads whose header cannot be parsed, are loaded with ``np.load``.
+
+    Args:
+        npy_array (npy array): to be converted to numpy array
+        dtype (dtype, optional): Data type of the resulting array. The array is only copied when
+            it differs from the dtype stored in the payload.
+
+    Returns:
+        (np.array): converted numpy array.
+    """
+    # Only the header is wrapped in a stream; BytesIO would otherwise copy mutable buffers.
+    stream = BytesIO(bytes(memoryview(npy_array)[:_NPY_MAX_HEADER_SIZE]))
+    try:
+        read_header = _NPY_HEADER_READERS[npy_format.read_magic(stream)]
+        shape, fortran_order, stored_dtype = read_header(stream)
+    except (KeyError, ValueError):
+        array = np.load(BytesIO(npy_array), allow_pickle=False)
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    if stored_dtype.hasobject:
+        raise ValueError("Object arrays cannot be loaded when allow_pickle=False")
+
+    order = 'F' if fortran_order else 'C'
+    count = int(np.prod(shape, dtype=np.int64))
+    if count == 0:
+        return np.empty(shape, dtype=dtype or stored_dtype, order=order)
+
+    array = np.frombuffer(npy_array, dtype=stored_dtype, count=count, offset=stream.tell())
+    array = array.reshape(shape, order=order)
+    return array if dtype is None else array.astype(dtype, copy=False)
+
+
+def _npz_to_sparse(npz_bytes, dtype=None):  # type: (object, np.dtype) -> scipy.sparse.csr_matrix
+    """Convert a sparse matrix saved with ``scipy.sparse.save_npz`` to a CSR matrix.
+
+    The matrix is never densified. CSR payloads are returned as loaded; other sparse formats
+    are converted to CSR, which is what scikit-learn estimators expect for sparse input.
+
+    Args:
+        npz_bytes (object): Bytes encoding a sparse matrix in the .npz format.
+        dtype (dtype, optional): Data type of the resulting matrix.
+
+    Returns:
+        (scipy.sparse.csr_matrix): A CSR matrix.
+    """
+    import scipy.sparse
+
+    matrix = scipy.sparse.load_npz(BytesIO(npz_bytes)).tocsr()
+    return matrix if dtype is None else matrix.astype(dtype, copy=False)
+
+
+def _is_numeric_arrow_type(arrow_type):
+    import pyarrow as pa
+
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type) or pa.types.is_boolean(arrow_type)
+
+
+def _chunked_array_to_numpy(chunked_array, dtype):
+    """Convert a pyarrow ChunkedArray to numpy, without a copy when it is a single chunk without
+    nulls that already has the requested dtype."""
+    if chunked_array.num_chunks == 1 and chunked_array.null_count == 0:
+        array = chunked_array.chunk(0).to_numpy(zero_copy_only=False)
+        return array.astype(dtype, copy=False)
+    return chunked_array.to_numpy().astype(dtype, copy=False)
+
+
+def _table_to_numpy(table, dtype=None):  # type: (pyarrow.Table, np.dtype) -> np.array
+    """Convert a pyarrow Table to a 2-D numpy array with one column per table column.
+
+    A table with a single fixed size list column is treated as a tensor column, with one row per
+    list. Single-column tables, and fixed size list columns, are returned as views over the Arrow
+    buffers when they are contiguous, have no nulls and already have the requested dtype; other
+    tables are written column by column into one preallocated array. Nulls become NaN.
+
+    Args:
+        table (pyarrow.Table): table of numeric (or boolean) columns.
+        dtype (dtype, optional): Data type of the resulting array. If None, the common type of the
+            columns is used.
+
+    Returns:
+        (np.array): array of shape (rows, columns).
+    """
+    import pyarrow as pa
+
+    if table.num_columns == 1 and pa.types.is_fixed_size_list(table.schema.types[0]):
+        column_type = table.schema.types[0]
+        if not _is_numeric_arrow_type(column_type.value_type):
+            raise ValueError("Unsupported Arrow list value type: {}".format(column_type.value_type))
+        values = pa.chunked_array([chunk.flatten() for chunk in table.column(0).chunks], column_type.value_type)
+        values = _chunked_array_to_numpy(values, dtype or column_type.value_type.to_pandas_dtype())
+        return values.reshape(table.num_rows, column_type.list_size)
+
+    for field in table.schema:
+        if not _is_numeric_arrow_type(field.type):
+            raise ValueError("Unsupported Arrow column type for {}: {}".format(field.name, field.type))
+    if table.num_columns == 0:
+        raise ValueError("Arrow table has no columns")
+
+    dtype = np.dtype(dtype or np.result_type(*[arrow_type.to_pandas_dtype() for arrow_type in table.schema.types]))
+    if table.num_columns == 1:
+        return _chunked_array_to_numpy(table.column(0), dtype).reshape(-1, 1)
+
+    array = np.empty((table.num_rows, table.num_columns), dtype=dtype)
+    for i, column in enumerate(table.columns):
+        array[:, i] = _chunked_array_to_numpy(column, dtype)
+    return array
+
+
+def _arrow_stream_to_numpy(arrow_stream, dtype=None):  # type: (object, np.dtype) -> np.array
+    """Convert an Arrow IPC stream into numpy. See ``_table_to_numpy``.
+
+    Args:
+        arrow_stream (bytes): Arrow IPC stream.
+        dtype (dtype, optional): Data type of the resulting array.
+
+    Returns:
+        (np.array): converted numpy array.
+    """
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(pa.py_buffer(arrow_stream)).read_all()
+    return _table_to_numpy(table, dtype)
+
+
+def _parquet_to_numpy(parquet_file, dtype=None):  # type: (object, np.dtype) -> np.array
+    """Convert a Parquet file into numpy. See ``_table_to_numpy``.
+
+    Args:
+        parquet_file (bytes): Parquet file contents.
+        dtype (dtype, optional): Data type of the resulting array.
+
+    Returns:
+        (np.array): converted numpy array.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(pa.BufferReader(pa.py_buffer(parquet_file)))
+    return _table_to_numpy(table, dtype)
+
+
+_decoder_map = {
+    content_types.NPY: _npy_to_numpy,
+    content_types.CSV: _csv_to_numpy,
+    content_types.JSON: _json_to_numpy,
+    sklearn_content_types.ARROW_STREAM: _arrow_stream_to_numpy,
+    sklearn_content_types.PARQUET: _parquet_to_numpy,
+    sklearn_content_types.NPZ: _npz_to_sparse,
+}
+
+
+def decode(obj, content_type, dtype=None):
+    # type: (np.array or Iterable or int or float, str, np.dtype) -> np.array
+    """Decode an object to one of the default content types to a numpy array.
+
+    Args:
+        obj (object): to be decoded.
+        content_type (str): content type to be used.
+        dtype (dtype, optional): Data type the decoder should produce. If None, the dtype is
+            determined by the payload.
+
+    Returns:
+        np.array or scipy.sparse.csr_matrix: decoded object.
+    """
+    try:
+        decoder = _decoder_map[content_type]
+    except KeyError:
+        raise errors.UnsupportedFormatError(content_type)
+    return decoder(obj, dtype)
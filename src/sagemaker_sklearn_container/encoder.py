@@ -0,0 +1,178 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module contains bulk encoders for predictions.
+
+The CSV encoder formats a whole 1-D or 2-D numeric array at once and produces exactly the same text
+as the default ``sagemaker_containers`` and ``sagemaker_inference`` encoders. JSON is left to those
+encoders, whose ``json.dumps`` is as fast as joining the formatted elements. ``encode`` returns None
+for anything it does not handle, so callers fall back to their stack's default encoder. JSON Lines,
+Arrow and Parquet are only provided by this module. pyarrow is only imported when an
+Arrow or Parquet response is encoded.
+"""
+from __future__ import absolute_import
+
+import json
+
+import numpy as np
+
+from sagemaker_inference import content_types as inference_content_types
+
+from sagemaker_sklearn_container import content_types
+
+_NUMERIC_KINDS = 'fiu'
+
+
+def _bulk_array(array_like):  # type: (object) -> np.array or None
+    if not isinstance(array_like, np.ndarray) or array_like.dtype.kind not in _NUMERIC_KINDS:
+        return None
+    if array_like.ndim not in (1, 2) or array_like.size == 0:
+        return None
+    return array_like
+
+
+def _fields(array, numpy_str=False):  # type: (np.array, bool) -> Iterator[str]
+    """Lazily format every element of an array, in row-major order.
+
+    Python ints and floats from ``tolist()`` are formatted with ``repr``, which is what ``json`` and
+    ``csv`` write and is considerably faster than NumPy's own float formatting. ``numpy_str`` formats
+    non-float64 floating point elements like ``str()`` of their NumPy scalar instead.
+    """
+    if numpy_str and array.dtype.kind == 'f' and array.dtype != np.float64:
+        return iter(array.astype(str).ravel().tolist())
+    return map(repr, array.ravel().tolist())
+
+
+def _join_rows(fields, n_cols, field_sep, row_sep):  # type: (Iterator[str], int, str, str) -> str
+    # Zipping n_cols references to the same iterator groups consecutive fields into rows.
+    rows = zip(*[fields] * n_cols)
+    return row_sep.join(map(field_sep.join, rows))
+
+
+def _array_to_csv(array_like):  # type: (np.array) -> str or None
+    """Convert a numeric array to CSV, with one line per row and one line per element of a 1-D array.
+
+    Args:
+        array_like (np.array): array to be converted to CSV.
+
+    Returns:
+        (str): object serialized to CSV, or None if it is not a 1-D or 2-D numeric array.
+    """
+    array = _bulk_array(array_like)
+    if array is None:
+        return None
+    n_cols = 1 if array.ndim == 1 else array.shape[1]
+    return _join_rows(_fields(array, numpy_str=True), n_cols, ',', '\n') + '\n'
+
+
+def _json_array(array_like):  # type: (object) -> np.array or None
+    array = _bulk_array(array_like)
+    if array is None or (array.dtype.kind == 'f' and not np.isfinite(array).all()):
+        # json.dumps writes NaN and Infinity where repr writes nan and inf.
+        return None
+    return array
+
+
+def _array_to_jsonlines(array_like):  # type: (np.array or Iterable) -> str
+    """Convert an array-like object to JSON Lines, with one JSON document per row.
+
+    Args:
+        array_like (np.array or Iterable): array-like object to be converted to JSON Lines.
+
+    Returns:
+        (str): object serialized to JSON Lines.
+    """
+    array = _json_array(array_like)
+    if array is not None and array.ndim == 1:
+        return '\n'.join(_fields(array)) + '\n'
+    if array is not None:
+        return '[' + _join_rows(_fields(array), array.shape[1], ', ', ']\n[') + ']\n'
+
+    def default(_array_like):
+        if hasattr(_array_like, "tolist"):
+            return _array_like.tolist()
+        return json.JSONEncoder().default(_array_like)
+
+    return ''.join(json.dumps(row, default=default) + '\n' for row in array_like)
+
+
+def _array_to_table(array_like):  # type: (np.array or Iterable) -> pyarrow.Table
+    """Convert a 1-D or 2-D array-like object to a pyarrow Table with one column per array column.
+
+    Columns are named by their index. Numeric columns without nulls are wrapped without a copy.
+    """
+    import pyarrow as pa
+
+    array = np.asarray(array_like)
+    if array.ndim == 1:
+        array = array.reshape(-1, 1)
+    if array.ndim != 2:
+        raise ValueError("Only 1-D and 2-D arrays can be encoded as Arrow, got shape {}".format(array.shape))
+    return pa.table([pa.array(array[:, i]) for i in range(array.shape[1])],
+                    names=[str(i) for i in range(array.shape[1])])
+
+
+def _array_to_arrow_stream(array_like):  # type: (np.array or Iterable) -> bytes
+    """Convert an array-like object to an Arrow IPC stream. See ``_array_to_table``.
+
+    Args:
+        array_like (np.array or Iterable): array-like object to be converted.
+
+    Returns:
+        (bytes): Arrow IPC stream.
+    """
+    import pyarrow as pa
+
+    table = _array_to_table(array_like)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _array_to_parquet(array_like):  # type: (np.array or Iterable) -> bytes
+    """Convert an array-like object to a Parquet file. See ``_array_to_table``.
+
+    Args:
+        array_like (np.array or Iterable): array-like object to be converted.
+
+    Returns:
+        (bytes): Parquet file contents.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = pa.BufferOutputStream()
+    pq.write_table(_array_to_table(array_like), sink)
+    return sink.getvalue().to_pybytes()
+
+
+_encoder_map = {
+    inference_content_types.CSV: _array_to_csv,
+    content_types.JSONLINES: _array_to_jsonlines,
+    content_types.ARROW_STREAM: _array_to_arrow_stream,
+    content_types.PARQUET: _array_to_parquet,
+}
+
+
+def encode(array_like, content_type):  # type: (np.array or Iterable, str) -> str or None
+    """Encode an array-like object with the vectorized encoders.
+
+    Args:
+        array_like (np.array or Iterable): to be encoded.
+        content_type (str): content type to be used.
+
+    Returns:
+        (str or bytes): encoded object, or None if the stack's default encoder should be used instead.
+    """
+    encoder = _encoder_map.get(content_type)
+    return encoder(array_like) if encoder else None
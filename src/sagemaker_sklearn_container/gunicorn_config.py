@@ -0,0 +1,73 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Gunicorn configuration that loads the model in the master process before the workers are forked, pins each
+worker to its own core set and applies the connection settings set in the environment.
+
+Used by ``serving.serving_entrypoint`` when SAGEMAKER_PRELOAD_MODEL, SAGEMAKER_CPU_AFFINITY or any of
+CONNECTION_SETTINGS_ENV is set, through the GUNICORN_CMD_ARGS environment variable since the gunicorn command line
+is built by sagemaker-containers.
+"""
+from __future__ import absolute_import
+import gc
+import os
+
+from sagemaker_sklearn_container import cpu_affinity
+
+KEEP_ALIVE_TIMEOUT_ENV = 'SAGEMAKER_KEEP_ALIVE_TIMEOUT'
+WORKER_CONNECTIONS_ENV = 'SAGEMAKER_WORKER_CONNECTIONS'
+LISTEN_BACKLOG_ENV = 'SAGEMAKER_LISTEN_BACKLOG'
+
+# Gunicorn settings, by the environment variable that sets them
+CONNECTION_SETTINGS_ENV = {
+    'keepalive': KEEP_ALIVE_TIMEOUT_ENV,
+    'worker_connections': WORKER_CONNECTIONS_ENV,
+    'backlog': LISTEN_BACKLOG_ENV,
+}
+
+
+def connection_settings():
+    """Returns the gunicorn connection settings set in the environment, as a dict of strings."""
+    return {setting: os.environ[env_var] for setting, env_var in CONNECTION_SETTINGS_ENV.items()
+            if os.environ.get(env_var)}
+
+
+def on_starting(server):
+    """Loads the model once in the master so that the workers share its pages copy-on-write."""
+    from sagemaker_sklearn_container import serving
+
+    # Set here rather than as module variables because the command line built by sagemaker-containers takes
+    # precedence over the config file, and it sets worker_connections. The listeners are created after this hook.
+    for setting, value in connection_settings().items():
+        server.cfg.set(setting, value)
+
+    if not serving.is_preload_model():
+        return
+
+    if cpu_affinity.is_enabled():
+        server.log.warning('SAGEMAKER_PRELOAD_MODEL and SAGEMAKER_CPU_AFFINITY are both set: the model is loaded '
+                           'in the master before the workers are pinned, so its memory is not local to their '
+                           'NUMA nodes')
+
+    # Collections in the workers write to the GC header of every tracked object, which copies the pages holding
+    # the model. Freezing moves everything allocated so far to a permanent generation that is never collected.
+    gc.disable()
+    serving.load_app()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    gc.enable()
+    # Unless the model was preloaded in the master, workers load it lazily on their first request, after pinning,
+    # so its memory is local to their node
+    if cpu_affinity.is_enabled():
+        cpu_affinity.pin_worker()
@@ -14,9 +14,11 @@ from __future__ import absolute_import
 import numpy as np
 import textwrap
 
-from sagemaker_inference import content_types, decoder, default_inference_handler, encoder
+from sagemaker_inference import default_inference_handler
+from sagemaker_inference import encoder as inference_encoder
 from sagemaker_inference.default_handler_service import DefaultHandlerService
-from sagemaker_inference.transformer import Transformer
+from sagemaker_sklearn_container import content_types, cpu_affinity, decoder, encoder, model_loader
+from sagemaker_sklearn_container.transformer import SKLearnTransformer
 
 
 class HandlerService(DefaultHandlerService):
@@ -32,12 +34,16 @@ class HandlerService(DefaultHandlerService):
 
         @staticmethod
         def default_model_fn(model_dir):
-            """Loads a model. For Scikit-learn, a default function to load a model is not provided.
-            Users should provide customized model_fn() in script.
+            """Loads a model. For Scikit-learn, the model saved with joblib or pickle in model_dir is loaded, with
+            the numpy arrays of uncompressed joblib artifacts memory-mapped unless workers are pinned with
+            SAGEMAKER_CPU_AFFINITY. Otherwise users should provide customized model_fn() in script.
             Args:
                 model_dir: a directory where model is saved.
             Returns: A Scikit-learn model.
             """
+            model_file = model_loader.find_model_file(model_dir)
+            if model_file is not None:
+                return model_loader.load_model(model_file, mmap_mode=model_loader.default_mmap_mode())
             raise NotImplementedError(textwrap.dedent("""
             Please provide a model_fn implementation.
             See documentation for model_fn at https://github.com/aws/sagemaker-python-sdk
@@ -57,16 +63,17 @@ class HandlerService(DefaultHandlerService):
             Returns:
                 (obj): data ready for prediction.
             """
-            np_array = decoder.decode(input_data, content_type)
+            dtype = np.float32 if content_type in content_types.FLOAT32_TYPES else None
+            np_array = decoder.decode(input_data, content_type, dtype)
             if len(np_array.shape) == 1:
                 np_array = np_array.reshape(1, -1)
-            return np_array.astype(np.float32) if content_type in content_types.UTF8_TYPES else np_array
+            return np_array if dtype is None else np_array.astype(dtype, copy=False)
 
         @staticmethod
         def default_predict_fn(input_data, model):
             """A default predict_fn for Scikit-learn. Calls a model on data deserialized in input_fn.
             Args:
-                input_data: input data (Numpy array) for prediction deserialized by input_fn
+                input_data: input data (Numpy array or scipy.sparse matrix) for prediction deserialized by input_fn
                 model: Scikit-learn model loaded in memory by model_fn
             Returns: a prediction
             """
@@ -85,8 +92,19 @@ class HandlerService(DefaultHandlerService):
                         response: the serialized data to return
                         accept: the content-type that the data was transformed to.
             """
-            return encoder.encode(prediction, accept), accept
+            data = encoder.encode(prediction, accept)
+            if data is None:
+                data = inference_encoder.encode(prediction, accept)
+            return data, accept
 
     def __init__(self):
-        transformer = Transformer(default_inference_handler=self.DefaultSKLearnUserModuleInferenceHandler())
+        transformer = SKLearnTransformer(default_inference_handler=self.DefaultSKLearnUserModuleInferenceHandler())
         super(HandlerService, self).__init__(transformer=transformer)
+
+    def initialize(self, context):
+        """Pins the worker to its own core set when SAGEMAKER_CPU_AFFINITY is set, before the model is read into
+        memory local to the worker's NUMA node, then initializes the handler service.
+        """
+        if cpu_affinity.is_enabled():
+            cpu_affinity.pin_worker()
+        super(HandlerService, self).initialize(context)
@@ -0,0 +1,178 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+from collections import Counter
+import functools
+import json
+import logging
+import os
+import time
+
+INPUT_FN = 'input_fn'
+PREDICT_FN = 'predict_fn'
+OUTPUT_FN = 'output_fn'
+TRANSFORM_FN = 'transform_fn'
+STAGES = (INPUT_FN, PREDICT_FN, OUTPUT_FN, TRANSFORM_FN)
+METRICS_LOG_INTERVAL_ENV = 'SAGEMAKER_METRICS_LOG_INTERVAL'
+DEFAULT_METRICS_LOG_INTERVAL = 60
+
+logger = logging.getLogger(__name__)
+
+
+def bucket(value):
+    """Returns the smallest power of two that is greater than or equal to value."""
+    return 1 << max(int(value) - 1, 0).bit_length()
+
+
+class Histogram(object):
+    """Count, total, max and power-of-two bucket counts of integer values."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets = Counter()
+
+    def record(self, value):
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.buckets[bucket(value)] += 1
+
+    def stats(self):
+        return {'count': self.count, 'total': self.total, 'max': self.max, 'histogram': dict(self.buckets)}
+
+
+class PayloadSizeStats(Histogram):
+    """Sizes of the request payloads seen by a worker, in bytes.
+
+    The MMS JVM heap is sized for max size payloads; these are the sizes actually received. Each time the largest
+    payload reaches a new bucket, it is logged.
+    """
+
+    def record(self, value):
+        if bucket(value) > bucket(self.max):
+            logger.info('Largest request payload so far: {} bytes'.format(value))
+        super(PayloadSizeStats, self).record(value)
+
+
+def _num_rows(data):
+    shape = getattr(data, 'shape', None)
+    if shape is None:
+        return None
+    return shape[0] if len(shape) == 2 else 1
+
+
+def _num_bytes(data):
+    if isinstance(data, tuple):
+        data = data[0]
+    if hasattr(data, 'get_data'):
+        data = data.get_data()
+    if isinstance(data, (bytes, bytearray, str)):
+        return len(data)
+    return None
+
+
+class StageStats(object):
+    """Wall time of the input_fn, predict_fn and output_fn (or transform_fn) calls of a worker, with the payload
+    bytes and rows they handled, in power-of-two histograms.
+
+    Latencies are recorded in microseconds. The stats so far are logged as one JSON line every
+    SAGEMAKER_METRICS_LOG_INTERVAL seconds (60 by default, 0 disables it), checked when a request finishes.
+    """
+
+    def __init__(self, log_interval=None):
+        if log_interval is None:
+            log_interval = float(os.environ.get(METRICS_LOG_INTERVAL_ENV, DEFAULT_METRICS_LOG_INTERVAL))
+        self.log_interval = log_interval
+        self.latency_us = {stage: Histogram() for stage in STAGES}
+        self.request_bytes = Histogram()
+        self.response_bytes = Histogram()
+        self.rows = Histogram()
+        self._last_log = time.monotonic()
+
+    def timed(self, stage, fn):
+        """Wraps a handler function so that every call is recorded as the given stage."""
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = fn(*args, **kwargs)
+            self.record(stage, time.perf_counter() - start, args, result)
+            return result
+
+        return wrapper
+
+    def record(self, stage, seconds, args, result):
+        self.latency_us[stage].record(int(seconds * 1e6))
+
+        if stage in (INPUT_FN, TRANSFORM_FN):
+            request_bytes = _num_bytes(args[1] if stage == TRANSFORM_FN else args[0])
+            if request_bytes is not None:
+                self.request_bytes.record(request_bytes)
+        if stage == INPUT_FN:
+            rows = _num_rows(result)
+            if rows is not None:
+                self.rows.record(rows)
+        if stage in (OUTPUT_FN, TRANSFORM_FN):
+            response_bytes = _num_bytes(result)
+            if response_bytes is not None:
+                self.response_bytes.record(response_bytes)
+            self._maybe_log()
+
+    def _maybe_log(self):
+        if self.log_interval > 0 and time.monotonic() - self._last_log >= self.log_interval:
+            self._last_log = time.monotonic()
+            logger.info('stage metrics: {}'.format(json.dumps(self.stats(), sort_keys=True)))
+
+    def stats(self):
+        """Returns the histograms of the stages that were called, and of the request bytes, response bytes and
+        rows, as a dict."""
+        return {'pid': os.getpid(),
+                'latency_us': {stage: histogram.stats() for stage, histogram in self.latency_us.items()
+                               if histogram.count},
+                'request_bytes': self.request_bytes.stats(), 'response_bytes': self.response_bytes.stats(),
+                'rows': self.rows.stats()}
+
+
+class RequestStats(object):
+    """Requests served by a worker: in flight, responses by status code, latency in a power-of-two microsecond
+    histogram, and how long the model took to load."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.responses = Counter()
+        self.latency_us = Histogram()
+        self.model_load_seconds = None
+
+    def start(self, num_requests=1):
+        """Records that requests were received. Returns: the start time to pass to finish."""
+        self.in_flight += num_requests
+        return time.perf_counter()
+
+    def finish(self, start, status_code, num_requests=1):
+        """Records that requests received at start were answered with status_code."""
+        latency_us = int((time.perf_counter() - start) * 1e6)
+        self.in_flight -= num_requests
+        self.responses[status_code] += num_requests
+        for _ in range(num_requests):
+            self.latency_us.record(latency_us)
+
+    def stats(self):
+        return {'in_flight': self.in_flight, 'responses': dict(self.responses),
+                'latency_us': self.latency_us.stats(), 'model_load_seconds': self.model_load_seconds}
+
+
+payload_sizes = PayloadSizeStats()
+stage_stats = StageStats()
+request_stats = RequestStats()
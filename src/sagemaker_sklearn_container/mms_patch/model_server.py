@@ -11,12 +11,13 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
+import functools
+import importlib.resources
 import os
 import signal
 import subprocess
 import sys
 
-import pkg_resources
 import psutil
 from retrying import retry
 
@@ -24,12 +25,14 @@ import sagemaker_inference
 from sagemaker_inference import default_handler_service, environment, logging, utils
 from sagemaker_inference.environment import code_dir
 
+from sagemaker_sklearn_container import cpu_affinity, startup
+
 logger = logging.get_logger()
 
 DEFAULT_HANDLER_SERVICE = default_handler_service.__name__
 MMS_CONFIG_FILE = os.path.join('/etc', 'sagemaker-mms.properties')
-DEFAULT_MMS_CONFIG_FILE = pkg_resources.resource_filename(sagemaker_inference.__name__, '/etc/default-mms.properties')
-DEFAULT_MMS_LOG_FILE = pkg_resources.resource_filename(sagemaker_inference.__name__, '/etc/log4j.properties')
+DEFAULT_MMS_CONFIG_FILE_NAME = 'default-mms.properties'
+DEFAULT_MMS_LOG_FILE_NAME = 'log4j.properties'
 DEFAULT_MMS_MODEL_DIRECTORY = os.path.join(os.getcwd(), '.sagemaker/mms/models')
 DEFAULT_MMS_MODEL_NAME = 'model'
 
@@ -38,6 +41,17 @@ REQUIREMENTS_PATH = os.path.join(code_dir, "requirements.txt")
 MMS_NAMESPACE = "com.amazonaws.ml.mms.ModelServer"
 
 
+@functools.lru_cache(maxsize=None)
+def inference_resource(name):
+    """Returns the path of a file in the etc directory of sagemaker_inference.
+
+    Looked up on first use with importlib.resources rather than at import with pkg_resources, which scans every
+    installed distribution when it is imported. sagemaker_inference is installed as a directory, so the path is
+    that of the file itself.
+    """
+    return str(importlib.resources.files(sagemaker_inference).joinpath('etc', name))
+
+
 def start_model_server(is_multi_model=False, handler_service=DEFAULT_HANDLER_SERVICE, config_file=None):
     """Configure and start the model server.
     Args:
@@ -53,24 +67,34 @@ def start_model_server(is_multi_model=False, handler_service=DEFAULT_HANDLER_SER
         config_file = MMS_CONFIG_FILE
 
     if os.path.exists(REQUIREMENTS_PATH):
-        _install_requirements()
+        with startup.timed(startup.REQUIREMENTS_INSTALL):
+            _install_requirements()
 
     _set_python_path()
 
+    if cpu_affinity.is_enabled():
+        # Each worker pins itself in HandlerService.initialize, claiming one of these core sets
+        logger.info('pinning workers to core sets {}'.format(cpu_affinity.core_sets(cpu_affinity.cores_per_worker())))
+
     mxnet_model_server_cmd = ['mxnet-model-server',
                               '--start',
                               '--mms-config', config_file,
-                              '--log-config', DEFAULT_MMS_LOG_FILE,
+                              '--log-config', inference_resource(DEFAULT_MMS_LOG_FILE_NAME),
                               ]
 
     if not is_multi_model:
-        _adapt_to_mms_format(handler_service)
+        with startup.timed(startup.MODEL_ARCHIVE):
+            _adapt_to_mms_format(handler_service)
         mxnet_model_server_cmd += ['--model-store', DEFAULT_MMS_MODEL_DIRECTORY]
 
     logger.info(mxnet_model_server_cmd)
     subprocess.Popen(mxnet_model_server_cmd)
 
     mms_process = _retrieve_mms_server_process()
+
+    # The workers report their own model load
+    startup.report()
+
     _add_sigterm_handler(mms_process)
     _add_sigchild_handler()
     mms_process.wait()
@@ -131,7 +155,7 @@ def _generate_mms_config_properties():
         if value:
             custom_configuration += '{}={}\n'.format(key, value)
 
-    mms_default_configuration = utils.read_file(DEFAULT_MMS_CONFIG_FILE)
+    mms_default_configuration = utils.read_file(inference_resource(DEFAULT_MMS_CONFIG_FILE_NAME))
 
     return mms_default_configuration + custom_configuration
 
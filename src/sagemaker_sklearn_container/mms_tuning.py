@@ -0,0 +1,139 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+from math import ceil
+import logging
+import multiprocessing
+import queue
+import time
+
+import numpy as np
+import psutil
+
+from sagemaker_sklearn_container import model_loader
+
+# Share of the host memory that the workers and the JVM are sized to use
+MEMORY_FRACTION = 0.9
+# Longest time a request should wait in the job queue when all workers are busy
+TARGET_QUEUE_DELAY_S = 1.0
+MAX_JOB_QUEUE_SIZE = 1000
+NUM_LATENCY_SAMPLES = 20
+# Longest time the model may take to load and be profiled
+PROFILE_TIMEOUT_S = 300
+PROFILE_POLL_INTERVAL_S = 1
+
+logger = logging.getLogger(__name__)
+
+
+def max_heap_size_mb(max_workers, max_job_queue_size, max_content_length):
+    """Returns the MMS JVM heap size in MB that holds a max size payload for every worker and queued job."""
+    # Max heap size = (max workers + max job queue size) * max payload size * 1.2 (20% buffer) + 128 (base amount)
+    return ceil((max_workers + max_job_queue_size) * (int(max_content_length) / 1024 ** 2) * 1.2) + 128
+
+
+def _median_latency(model, input_data):
+    latencies = []
+    for _ in range(NUM_LATENCY_SAMPLES):
+        start = time.perf_counter()
+        model.predict(input_data)
+        latencies.append(time.perf_counter() - start)
+    return float(np.median(latencies))
+
+
+def _profile(model_dir, results):
+    try:
+        model_file = model_loader.find_model_file(model_dir)
+        if model_file is None:
+            results.put(None)
+            return
+
+        model = model_loader.load_model(model_file)
+        profile = {'worker_bytes': psutil.Process().memory_info().rss, 'request_latency_s': None}
+
+        num_features = getattr(model, 'n_features_in_', None)
+        if num_features is not None and hasattr(model, 'predict'):
+            profile['request_latency_s'] = _median_latency(model, np.zeros((1, num_features)))
+        results.put(profile)
+    except Exception:  # pylint: disable=broad-except
+        results.put(None)
+        raise
+
+
+def profile_model(model_dir, timeout=PROFILE_TIMEOUT_S):
+    """Measures the cost of serving the model saved in model_dir, in a child process that exits afterwards.
+    Args:
+        model_dir: a directory where model is saved.
+        timeout: seconds after which the child process is terminated.
+    Returns: a dict with the resident memory of a worker that loaded the model ('worker_bytes') and the median
+        latency of predicting one row ('request_latency_s'), which is None if the model doesn't declare
+        ``n_features_in_``. None if there is no model artifact, or it fails to load within the timeout.
+    """
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    process = context.Process(target=_profile, args=(model_dir, results))
+    process.start()
+
+    deadline = time.monotonic() + timeout
+    profile = None
+    while True:
+        try:
+            profile = results.get(timeout=PROFILE_POLL_INTERVAL_S)
+            break
+        except queue.Empty:
+            # The child may have been killed, by the OOM killer for one, before it could answer
+            if process.exitcode is not None:
+                logger.warning('Profiling the model in {} exited with code {}'.format(model_dir, process.exitcode))
+                break
+            if time.monotonic() >= deadline:
+                logger.warning('Profiling the model in {} took longer than {}s'.format(model_dir, timeout))
+                process.terminate()
+                break
+
+    process.join()
+    return profile
+
+
+def tune(profile, cpu_count, host_memory, max_content_length, num_models=1):
+    """Chooses the MMS worker count, job queue size and JVM heap size for a model profiled by ``profile_model``.
+
+    MMS gives every model its own workers and job queue, and num_models models like the profiled one share the
+    host. Workers are CPU bound, so the models' workers add up to one per core, with at least one per model,
+    fewer if they don't fit in the host memory next to the JVM. The job queue holds what a model's workers serve
+    in TARGET_QUEUE_DELAY_S, and the heap holds a max size payload for every worker and queued job of every model,
+    shrinking the queues if needed to fit.
+    Returns: a dict with the per model 'workers' and 'job_queue_size', and the 'max_heap_size_mb'.
+    """
+    memory_budget = host_memory * MEMORY_FRACTION
+    worker_bytes = profile['worker_bytes']
+
+    def fits(workers, job_queue_size):
+        jvm_bytes = max_heap_size_mb(num_models * workers, num_models * job_queue_size, max_content_length) * 1024 ** 2
+        return num_models * workers * worker_bytes + jvm_bytes <= memory_budget
+
+    workers = max(cpu_count // num_models, 1)
+    while workers > 1 and not fits(workers, 2 * workers):
+        workers -= 1
+
+    request_latency = profile['request_latency_s']
+    if request_latency:
+        job_queue_size = int(min(max(workers * TARGET_QUEUE_DELAY_S / request_latency, 2 * workers),
+                                 MAX_JOB_QUEUE_SIZE))
+    else:
+        job_queue_size = 2 * workers
+
+    while job_queue_size > workers and not fits(workers, job_queue_size):
+        job_queue_size = max(job_queue_size // 2, workers)
+
+    return {'workers': workers, 'job_queue_size': job_queue_size,
+            'max_heap_size_mb': max_heap_size_mb(num_models * workers, num_models * job_queue_size,
+                                                 max_content_length)}
@@ -0,0 +1,190 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+import hashlib
+import logging
+import os
+import tempfile
+
+from sagemaker_sklearn_container import cpu_affinity
+
+DEFAULT_MODEL_FILENAME = 'model.joblib'
+MODEL_FILE_EXTENSIONS = ('.joblib', '.pkl', '.pickle')
+MODEL_ARTIFACT_CACHE_ENV = 'SAGEMAKER_MODEL_ARTIFACT_CACHE'
+MODEL_ARTIFACT_CACHE_MAX_BYTES_ENV = 'SAGEMAKER_MODEL_ARTIFACT_CACHE_MAX_BYTES'
+DEFAULT_MODEL_ARTIFACT_CACHE_MAX_BYTES = 10 * 1024 ** 3
+
+_HASH_CHUNK_SIZE = 1024 ** 2
+
+logger = logging.getLogger(__name__)
+
+
+def find_model_file(model_dir):
+    """Finds the joblib or pickle artifact of the model saved in model_dir.
+    Args:
+        model_dir: a directory where model is saved.
+    Returns: the path to ``model.joblib`` if present, otherwise to the only file in model_dir with a joblib or
+        pickle extension. None if there is no such file or more than one.
+    """
+    if not os.path.isdir(model_dir):
+        return None
+
+    if os.path.isfile(os.path.join(model_dir, DEFAULT_MODEL_FILENAME)):
+        return os.path.join(model_dir, DEFAULT_MODEL_FILENAME)
+
+    candidates = [name for name in sorted(os.listdir(model_dir))
+                  if name.endswith(MODEL_FILE_EXTENSIONS) and os.path.isfile(os.path.join(model_dir, name))]
+    if len(candidates) != 1:
+        return None
+    return os.path.join(model_dir, candidates[0])
+
+
+def _artifact_hash(model_file, cache_dir):
+    """Returns the SHA-256 of the artifact's content, remembered in cache_dir by path, size and mtime so that
+    unchanged artifacts are hashed once per host.
+    """
+    stat = os.stat(model_file)
+    stat_key = '{}:{}:{}'.format(os.path.abspath(model_file), stat.st_size, stat.st_mtime_ns).encode('utf-8')
+    index_file = os.path.join(cache_dir, hashlib.sha256(stat_key).hexdigest() + '.sha256')
+
+    if os.path.isfile(index_file):
+        with open(index_file) as f:
+            return f.read()
+
+    digest = hashlib.sha256()
+    with open(model_file, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    _atomic_write(index_file, lambda path: _write_text(path, digest.hexdigest()))
+    return digest.hexdigest()
+
+
+def _write_text(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+def _atomic_write(path, write_fn):
+    """Writes path with write_fn(tmp_path) and renames it into place, so concurrent readers never see it
+    partially written."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    os.close(fd)
+    try:
+        write_fn(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _evict(cache_dir, max_bytes, keep):
+    """Removes the least recently used converted artifacts, other than keep, until those in cache_dir take up at
+    most max_bytes, with the index files that point to them. Workers that have an evicted artifact memory-mapped
+    keep reading it until they unmap it."""
+    artifacts = []
+    for name in os.listdir(cache_dir):
+        if name.endswith('.joblib'):
+            path = os.path.join(cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:  # evicted by another worker
+                continue
+            artifacts.append((stat.st_mtime, stat.st_size, path))
+
+    used_bytes = sum(size for _, size, _ in artifacts)
+    evicted = set()
+    for _, size, path in sorted(artifacts):
+        if used_bytes <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        used_bytes -= size
+        evicted.add(os.path.basename(path)[:-len('.joblib')])
+        logger.info('Evicted {} ({} bytes) from the model artifact cache'.format(path, size))
+
+    for name in os.listdir(cache_dir) if evicted else []:
+        if name.endswith('.sha256'):
+            path = os.path.join(cache_dir, name)
+            try:
+                with open(path) as f:
+                    if f.read() in evicted:
+                        os.remove(path)
+            except OSError:
+                pass
+
+
+def cache_model_file(model_file, cache_dir, max_bytes=None):
+    """Converts an artifact to an uncompressed joblib file in cache_dir, keyed by the artifact's content hash.
+
+    Compressed joblib artifacts and plain pickles can't be memory-mapped and are unpickled from scratch by every
+    worker. Converted once per host, they are then opened with their arrays memory-mapped by every later worker.
+    When a conversion takes the cache over max_bytes, the least recently used artifacts are evicted.
+    Args:
+        model_file: path to the artifact.
+        cache_dir: node-local directory of converted artifacts.
+        max_bytes: size limit of the converted artifacts, SAGEMAKER_MODEL_ARTIFACT_CACHE_MAX_BYTES (10 GiB by
+            default) if None.
+    Returns: the path to the converted artifact.
+    """
+    if max_bytes is None:
+        max_bytes = int(os.environ.get(MODEL_ARTIFACT_CACHE_MAX_BYTES_ENV, DEFAULT_MODEL_ARTIFACT_CACHE_MAX_BYTES))
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir, exist_ok=True)
+
+    cached_file = os.path.join(cache_dir, _artifact_hash(model_file, cache_dir) + '.joblib')
+    if os.path.isfile(cached_file):
+        # The modification time orders the artifacts for eviction
+        os.utime(cached_file)
+    else:
+        import joblib
+
+        model = joblib.load(model_file)
+        _atomic_write(cached_file, lambda path: joblib.dump(model, path, compress=0))
+        _evict(cache_dir, max_bytes, cached_file)
+    return cached_file
+
+
+def default_mmap_mode():
+    """Returns the mmap_mode the default model_fns load models with: None when workers are pinned to NUMA nodes
+    with SAGEMAKER_CPU_AFFINITY, so that each worker reads its model into memory local to its node, 'r' otherwise.
+    """
+    return None if cpu_affinity.is_enabled() else 'r'
+
+
+def load_model(model_file, mmap_mode='r'):
+    """Loads a model saved with ``joblib.dump`` or ``pickle.dump``.
+
+    The numpy arrays of uncompressed joblib artifacts are memory-mapped rather than read into the heap, so that
+    loading returns without reading them and every worker on the host shares them through the page cache.
+    If SAGEMAKER_MODEL_ARTIFACT_CACHE is set, the artifact is first converted to an uncompressed joblib file in
+    that directory, see ``cache_model_file``. Otherwise, as by default, compressed joblib artifacts and plain
+    pickles are read into memory.
+    Args:
+        model_file: path to the artifact.
+        mmap_mode: mode to memory-map the arrays with, or None to read them into memory.
+    Returns: A Scikit-learn model.
+    """
+    import joblib
+
+    cache_dir = os.environ.get(MODEL_ARTIFACT_CACHE_ENV)
+    if cache_dir and mmap_mode:
+        try:
+            model_file = cache_model_file(model_file, cache_dir)
+        except (OSError, IOError):
+            logger.warning('Failed to cache {} in {}, loading it directly'.format(model_file, cache_dir),
+                           exc_info=True)
+    return joblib.load(model_file, mmap_mode=mmap_mode)
@@ -0,0 +1,193 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Time-bounded sampling CPU profiles of the inference handlers of a live worker.
+
+A profile samples the stack of the worker's main thread, where gunicorn, the async server's model processes and
+MMS run the handlers, every 1/SAGEMAKER_PROFILE_SAMPLE_RATE seconds of CPU time. Only the samples taken inside
+input_fn (and so the decoders), predict_fn, output_fn or transform_fn are kept, rooted at the stage they were taken
+in. When the profile ends, they are written to SAGEMAKER_PROFILE_DIR in the collapsed stack format read by
+flamegraph.pl, speedscope and inferno.
+
+A profile is started either by SAGEMAKER_PROFILE_SECONDS, in the first worker to serve a request, or by a POST to
+/profile?seconds=N on the worker that answers it when SAGEMAKER_PROFILE_ENDPOINT is true. nginx then proxies
+/profile to gunicorn, see ``serving.serving_entrypoint``.
+"""
+from __future__ import absolute_import
+from collections import Counter
+import logging
+import os
+import signal
+import tempfile
+import time
+
+from sagemaker_sklearn_container import metrics
+
+PROFILE_SECONDS_ENV = 'SAGEMAKER_PROFILE_SECONDS'
+PROFILE_ENDPOINT_ENV = 'SAGEMAKER_PROFILE_ENDPOINT'
+PROFILE_DIR_ENV = 'SAGEMAKER_PROFILE_DIR'
+DEFAULT_PROFILE_DIR = os.path.join('/tmp', 'sagemaker-profiles')
+PROFILE_SAMPLE_RATE_ENV = 'SAGEMAKER_PROFILE_SAMPLE_RATE'
+DEFAULT_PROFILE_SAMPLE_RATE = 100
+MAX_PROFILE_SECONDS = 600
+# Created by the worker that takes the profile requested by SAGEMAKER_PROFILE_SECONDS
+ENV_PROFILE_CLAIM = 'env-profile.claim'
+
+logger = logging.getLogger(__name__)
+
+_sampler = None
+_env_checked = False
+
+
+def is_endpoint_enabled():
+    return os.environ.get(PROFILE_ENDPOINT_ENV, 'false').lower() == 'true'
+
+
+def profile_dir():
+    return os.environ.get(PROFILE_DIR_ENV, DEFAULT_PROFILE_DIR)
+
+
+def _frame_name(code):
+    return '{} ({}:{})'.format(getattr(code, 'co_qualname', code.co_name), code.co_filename, code.co_firstlineno)
+
+
+def _stage_stack(frame):
+    """Returns the stack of frame from the outermost stage wrapper of ``metrics.StageStats.timed``, as a tuple of
+    frame names with the stage first, or None if frame isn't in a stage."""
+    names = []
+    stack = None
+    while frame is not None:
+        code = frame.f_code
+        if frame.f_globals is metrics.__dict__ and code.co_name == 'wrapper':
+            stack = [frame.f_locals['stage']] + names[::-1]
+        else:
+            names.append(_frame_name(code))
+        frame = frame.f_back
+    return tuple(stack) if stack is not None else None
+
+
+class StackSampler(object):
+    """Samples the stack of the main thread on SIGPROF, raised by the interval timer of the process CPU time.
+
+    Python runs the signal handler only once native code returns to the interpreter, and the timer expirations in
+    between are merged into one pending signal. Each sample is therefore weighted by the CPU time used since the
+    previous one, in timer intervals, so that long NumPy or BLAS calls are not under-counted.
+    """
+
+    def __init__(self, seconds, sample_rate, path):
+        self.seconds = seconds
+        self.sample_rate = sample_rate
+        self.path = path
+        self.stacks = Counter()
+        self.samples = 0
+        self._deadline = None
+        self._previous_handler = None
+        self._previous_cpu_time = None
+
+    def start(self):
+        # Raises ValueError outside the main thread, where signal handlers can't be set
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        self._deadline = time.monotonic() + self.seconds
+        self._previous_cpu_time = time.process_time()
+        signal.setitimer(signal.ITIMER_PROF, 1.0 / self.sample_rate, 1.0 / self.sample_rate)
+
+    def expired(self):
+        return time.monotonic() >= self._deadline
+
+    def _sample(self, signum, frame):
+        if self.expired():
+            stop()
+            return
+        cpu_time = time.process_time()
+        weight = max(1, int(round((cpu_time - self._previous_cpu_time) * self.sample_rate)))
+        self._previous_cpu_time = cpu_time
+        self.samples += weight
+        stack = _stage_stack(frame)
+        if stack is not None:
+            self.stacks[stack] += weight
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+
+        directory = os.path.dirname(self.path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write('{} {}\n'.format(';'.join(stack), count))
+        os.replace(tmp_path, self.path)
+
+
+def start(seconds, sample_rate=None):
+    """Starts profiling this worker for the given number of seconds, capped at MAX_PROFILE_SECONDS.
+    Returns: the path the profile will be written to, or None if this worker is already profiling."""
+    global _sampler
+
+    if _sampler is not None:
+        return None
+
+    if sample_rate is None:
+        sample_rate = float(os.environ.get(PROFILE_SAMPLE_RATE_ENV, DEFAULT_PROFILE_SAMPLE_RATE))
+    seconds = min(float(seconds), MAX_PROFILE_SECONDS)
+    if seconds <= 0 or sample_rate <= 0:
+        raise ValueError('The profile duration and sample rate must be positive')
+
+    directory = profile_dir()
+    if not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, 'profile-{}-{}.folded'.format(os.getpid(), time.strftime('%Y%m%dT%H%M%S')))
+
+    sampler = StackSampler(seconds, sample_rate, path)
+    sampler.start()
+    _sampler = sampler
+    logger.info('Profiling worker {} for {}s at {} samples/s into {}'.format(
+        os.getpid(), seconds, sample_rate, path))
+    return path
+
+
+def stop():
+    """Stops the profile of this worker, if any, and writes it. Returns: the path it was written to, or None."""
+    global _sampler
+
+    sampler, _sampler = _sampler, None
+    if sampler is None:
+        return None
+    sampler.stop()
+    logger.info('Wrote profile of worker {} with {} samples, {} in the inference handlers, to {}'.format(
+        os.getpid(), sampler.samples, sum(sampler.stacks.values()), sampler.path))
+    return sampler.path
+
+
+def _claim_env_profile():
+    directory = profile_dir()
+    if not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+    try:
+        os.close(os.open(os.path.join(directory, ENV_PROFILE_CLAIM), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        return True
+    except FileExistsError:
+        return False
+
+
+def on_request():
+    """Called when a worker receives a request. Starts the profile requested by SAGEMAKER_PROFILE_SECONDS in the
+    first worker to get here, and ends a profile that ran past its duration while no CPU time was used."""
+    global _env_checked
+
+    if not _env_checked:
+        _env_checked = True
+        seconds = os.environ.get(PROFILE_SECONDS_ENV)
+        if seconds and _claim_env_profile():
+            start(seconds)
+
+    if _sampler is not None and _sampler.expired():
+        stop()
@@ -0,0 +1,177 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Prometheus text exposition of the metrics of every worker of the model server.
+
+gunicorn and MMS workers are separate processes, and a scrape of /metrics reaches only one of them. Each worker
+writes its own metrics, labelled with its pid, to a file in SAGEMAKER_METRICS_DIR at most every
+SAGEMAKER_METRICS_FLUSH_INTERVAL seconds when a request finishes. /metrics merges the files of the live workers,
+in ``collect`` for gunicorn and in the Metrics endpoint plugin for MMS (docker/.../resources/mms/Metrics.java),
+which must keep to the same merge.
+
+With gunicorn, nginx proxies /metrics as ``serving_entrypoint`` adds it to the routes of its config. With MMS,
+/metrics is served by the endpoints-1.0.jar plugin, which the image builds from Metrics.java and
+ExecutionParameters.java.
+"""
+from __future__ import absolute_import
+from collections import OrderedDict
+import glob
+import os
+import tempfile
+import time
+
+import psutil
+
+from sagemaker_sklearn_container import metrics, startup
+
+METRICS_DIR_ENV = 'SAGEMAKER_METRICS_DIR'
+DEFAULT_METRICS_DIR = os.path.join('/tmp', 'sagemaker-metrics')
+METRICS_FLUSH_INTERVAL_ENV = 'SAGEMAKER_METRICS_FLUSH_INTERVAL'
+DEFAULT_METRICS_FLUSH_INTERVAL = 5
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+PREFIX = 'sagemaker_sklearn_'
+# Power-of-two microsecond buckets up to about a minute, the same for every worker so that they can be summed
+LATENCY_BUCKETS_US = [1 << i for i in range(27)]
+
+_last_write = None
+
+
+def metrics_dir():
+    return os.environ.get(METRICS_DIR_ENV, DEFAULT_METRICS_DIR)
+
+
+def _labels(labels):
+    return '{' + ','.join('{}="{}"'.format(name, value) for name, value in labels) + '}'
+
+
+class _Family(object):
+    def __init__(self, name, metric_type, description):
+        self.name = PREFIX + name
+        self.lines = ['# HELP {} {}'.format(self.name, description), '# TYPE {} {}'.format(self.name, metric_type)]
+
+    def sample(self, labels, value, suffix=''):
+        self.lines.append('{}{}{} {}'.format(self.name, suffix, _labels(labels), value))
+
+    def histogram(self, labels, histogram):
+        """Adds a histogram of microseconds as seconds."""
+        cumulative = 0
+        for bucket in LATENCY_BUCKETS_US:
+            cumulative += histogram.buckets.get(bucket, 0)
+            self.sample(labels + [('le', repr(bucket * 1e-6))], cumulative, '_bucket')
+        self.sample(labels + [('le', '+Inf')], histogram.count, '_bucket')
+        self.sample(labels, histogram.total * 1e-6, '_sum')
+        self.sample(labels, histogram.count, '_count')
+
+
+def render_worker():
+    """Returns the metrics of this worker process in the Prometheus text format."""
+    pid = [('pid', os.getpid())]
+    request_stats = metrics.request_stats
+    stage_stats = metrics.stage_stats
+    families = []
+
+    requests = _Family('requests_total', 'counter', 'Requests answered, by status code.')
+    for code, count in sorted(request_stats.responses.items()):
+        requests.sample(pid + [('code', code)], count)
+    families.append(requests)
+
+    in_flight = _Family('requests_in_flight', 'gauge', 'Requests received and not answered yet.')
+    in_flight.sample(pid, request_stats.in_flight)
+    families.append(in_flight)
+
+    latency = _Family('request_duration_seconds', 'histogram', 'Time to answer a request.')
+    latency.histogram(pid, request_stats.latency_us)
+    families.append(latency)
+
+    stage_latency = _Family('stage_duration_seconds', 'histogram', 'Time spent in input_fn, predict_fn, output_fn '
+                                                                   'or transform_fn per call.')
+    for stage, histogram in stage_stats.latency_us.items():
+        if histogram.count:
+            stage_latency.histogram(pid + [('stage', stage)], histogram)
+    families.append(stage_latency)
+
+    # The rate of bytes over the rate of stage_duration_seconds_sum is the decode and encode throughput
+    stage_bytes = _Family('stage_bytes_total', 'counter', 'Bytes decoded by input_fn and encoded by output_fn.')
+    stage_bytes.sample(pid + [('stage', metrics.INPUT_FN)], stage_stats.request_bytes.total)
+    stage_bytes.sample(pid + [('stage', metrics.OUTPUT_FN)], stage_stats.response_bytes.total)
+    families.append(stage_bytes)
+
+    rows = _Family('rows_total', 'counter', 'Rows decoded by input_fn.')
+    rows.sample(pid, stage_stats.rows.total)
+    families.append(rows)
+
+    if request_stats.model_load_seconds is not None:
+        model_load = _Family('model_load_seconds', 'gauge', 'Time the worker took to load the model.')
+        model_load.sample(pid, request_stats.model_load_seconds)
+        families.append(model_load)
+
+    if startup.phases:
+        startup_phases = _Family('startup_phase_seconds', 'gauge', 'Time the worker spent in each startup phase.')
+        for phase, seconds in startup.phases.items():
+            startup_phases.sample(pid + [('phase', phase)], seconds)
+        families.append(startup_phases)
+
+    memory_info = psutil.Process().memory_full_info()
+    rss = _Family('worker_resident_memory_bytes', 'gauge', 'Resident memory of the worker.')
+    rss.sample(pid, memory_info.rss)
+    pss = _Family('worker_proportional_memory_bytes', 'gauge', 'Resident memory of the worker, with shared pages '
+                                                               'divided among the processes sharing them.')
+    pss.sample(pid, getattr(memory_info, 'pss', memory_info.rss))
+    families += [rss, pss]
+
+    return ''.join(line + '\n' for family in families for line in family.lines)
+
+
+def write_worker_file():
+    """Writes the metrics of this worker to <pid>.prom in the metrics directory, replacing the previous ones."""
+    global _last_write
+
+    directory = metrics_dir()
+    if not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        f.write(render_worker())
+    os.replace(tmp_path, os.path.join(directory, '{}.prom'.format(os.getpid())))
+    _last_write = time.monotonic()
+
+
+def maybe_write_worker_file():
+    """Writes the metrics of this worker if it hasn't in the last SAGEMAKER_METRICS_FLUSH_INTERVAL seconds."""
+    interval = float(os.environ.get(METRICS_FLUSH_INTERVAL_ENV, DEFAULT_METRICS_FLUSH_INTERVAL))
+    if _last_write is None or time.monotonic() - _last_write >= interval:
+        write_worker_file()
+
+
+def collect():
+    """Returns the metrics of every live worker in the Prometheus text format, with the samples of each metric
+    family grouped under a single HELP and TYPE header."""
+    write_worker_file()
+
+    families = OrderedDict()
+    for path in sorted(glob.glob(os.path.join(metrics_dir(), '*.prom'))):
+        pid = os.path.basename(path)[:-len('.prom')]
+        if not pid.isdigit() or not psutil.pid_exists(int(pid)):
+            continue
+
+        with open(path) as f:
+            family = None
+            for line in f.read().splitlines():
+                if line.startswith('# '):
+                    family = families.setdefault(line.split(' ')[2], ([], []))
+                    if line not in family[0]:
+                        family[0].append(line)
+                elif line and family is not None:
+                    family[1].append(line)
+
+    return ''.join(line + '\n' for headers, samples in families.values() for line in headers + samples)
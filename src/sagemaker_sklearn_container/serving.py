@@ -11,15 +11,27 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
+import functools
 import os
 import importlib
+import json
 import logging
+import time
 import numpy as np
+from six.moves import http_client
 
 import sagemaker_sklearn_container.exceptions as exc
-from sagemaker_containers.beta.framework import (
-    content_types, encoders, env, modules, transformer, worker, server)
-from sagemaker_sklearn_container.serving_mms import start_model_server
+# The modules that sagemaker_containers.beta.framework aliases, imported directly: the framework package also
+# imports its training, MPI and server modules, with paramiko, in every gunicorn worker. pkg_resources is still
+# imported, by _env through setuptools' distutils shim. The server, MMS and asyncio front ends are imported by
+# serving_entrypoint for the mode it starts.
+from sagemaker_containers import (_encoders as encoders, _env as env, _errors as errors, _modules as modules,
+                                  _transformer as transformer, _worker as worker)
+from sagemaker_inference import errors as inference_errors
+from sagemaker_sklearn_container import (content_types, cpu_affinity, decoder, encoder, gunicorn_config, metrics,
+                                         model_loader, profiling, prometheus, startup, thread_limits)
+
+startup.record_import()
 
 logging.basicConfig(format='%(asctime)s %(levelname)s - %(name)s - %(message)s', level=logging.INFO)
 
@@ -31,18 +43,34 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+GUNICORN_CONFIG = 'python:sagemaker_sklearn_container.gunicorn_config'
+NGINX_CONFIG_TEMPLATE_FILE = os.path.join('/tmp', 'sagemaker-sklearn-nginx.conf.template')
+# The routes of the nginx config template of sagemaker_containers, and the routes nginx proxies to gunicorn
+NGINX_DEFAULT_ROUTES = '^/(ping|invocations|execution-parameters)'
+NGINX_ROUTES = ('ping', 'invocations', 'execution-parameters', 'metrics')
+DEFAULT_PROFILE_SECONDS = 30
+
+
 def is_multi_model():
     return os.environ.get('SAGEMAKER_MULTI_MODEL')
 
 
+def is_preload_model():
+    return os.environ.get('SAGEMAKER_PRELOAD_MODEL', 'false').lower() == 'true'
+
+
 def default_model_fn(model_dir):
-    """Loads a model. For Scikit-learn, a default function to load a model is not provided.
-    Users should provide customized model_fn() in script.
+    """Loads a model. For Scikit-learn, the model saved with joblib or pickle in model_dir is loaded, with
+    the numpy arrays of uncompressed joblib artifacts memory-mapped unless workers are pinned with
+    SAGEMAKER_CPU_AFFINITY. Otherwise users should provide customized model_fn() in script.
     Args:
         model_dir: a directory where model is saved.
     Returns: A Scikit-learn model.
     """
-    return transformer.default_model_fn(model_dir)
+    model_file = model_loader.find_model_file(model_dir)
+    if model_file is None:
+        return transformer.default_model_fn(model_dir)
+    return model_loader.load_model(model_file, mmap_mode=model_loader.default_mmap_mode())
 
 
 def default_input_fn(input_data, content_type):
@@ -58,14 +86,18 @@ def default_input_fn(input_data, content_type):
     Returns:
         (obj): data ready for prediction.
     """
-    np_array = encoders.decode(input_data, content_type)
-    return np_array.astype(np.float32) if content_type in content_types.UTF8_TYPES else np_array
+    dtype = np.float32 if content_type in content_types.FLOAT32_TYPES else None
+    try:
+        np_array = decoder.decode(input_data, content_type, dtype)
+    except inference_errors.UnsupportedFormatError:
+        raise errors.UnsupportedFormatError(content_type)
+    return np_array if dtype is None else np_array.astype(dtype, copy=False)
 
 
 def default_predict_fn(input_data, model):
     """A default predict_fn for Scikit-learn. Calls a model on data deserialized in input_fn.
     Args:
-        input_data: input data (Numpy array) for prediction deserialized by input_fn
+        input_data: input data (Numpy array or scipy.sparse matrix) for prediction deserialized by input_fn
         model: Scikit-learn model loaded in memory by model_fn
     Returns: a prediction
     """
@@ -84,7 +116,10 @@ def default_output_fn(prediction, accept):
                 response: the serialized data to return
                 accept: the content-type that the data was transformed to.
     """
-    return worker.Response(encoders.encode(prediction, accept), accept, mimetype=accept)
+    data = encoder.encode(prediction, accept)
+    if data is None:
+        data = encoders.encode(prediction, accept)
+    return worker.Response(data, accept, mimetype=accept)
 
 
 def _user_module_transformer(user_module):
@@ -97,14 +132,17 @@ def _user_module_transformer(user_module):
     if transform_fn and (input_fn or predict_fn or output_fn):
         raise exc.UserError("Cannot use transform_fn implementation with input_fn, predict_fn, and/or output_fn")
 
+    # Every call is recorded in metrics.stage_stats
+    stage_stats = metrics.stage_stats
     if transform_fn is not None:
-        return transformer.Transformer(model_fn=model_fn, transform_fn=transform_fn)
+        return transformer.Transformer(model_fn=model_fn,
+                                       transform_fn=stage_stats.timed(metrics.TRANSFORM_FN, transform_fn))
     else:
         return transformer.Transformer(
             model_fn=model_fn,
-            input_fn=input_fn or default_input_fn,
-            predict_fn=predict_fn or default_predict_fn,
-            output_fn=output_fn or default_output_fn,
+            input_fn=stage_stats.timed(metrics.INPUT_FN, input_fn or default_input_fn),
+            predict_fn=stage_stats.timed(metrics.PREDICT_FN, predict_fn or default_predict_fn),
+            output_fn=stage_stats.timed(metrics.OUTPUT_FN, output_fn or default_output_fn),
         )
 
 
@@ -123,15 +161,66 @@ def import_module(module_name, module_dir):
         raise
 
     user_module_transformer = _user_module_transformer(user_module)
+    start = time.perf_counter()
     user_module_transformer.initialize()
+    metrics.request_stats.model_load_seconds = time.perf_counter() - start
+    startup.record(startup.MODEL_LOAD, metrics.request_stats.model_load_seconds)
 
     return user_module_transformer, _user_module_execution_parameters_fn(user_module)
 
 
+def _recorded(transform_fn):
+    """Wraps the view of /invocations to record every request in ``metrics.request_stats``."""
+    @functools.wraps(transform_fn)
+    def recorded_transform_fn():
+        profiling.on_request()
+        status_code = http_client.INTERNAL_SERVER_ERROR
+        start = metrics.request_stats.start()
+        try:
+            response = transform_fn()
+            status_code = response.status_code
+            return response
+        except Exception as e:
+            # Flask answers HTTP exceptions with their code and anything else with a 500
+            status_code = getattr(e, 'code', None) or status_code
+            raise
+        finally:
+            metrics.request_stats.finish(start, status_code)
+            prometheus.maybe_write_worker_file()
+
+    return recorded_transform_fn
+
+
+def ping_fn():
+    startup.on_ping()
+    return worker.Response(status=http_client.OK)
+
+
+def metrics_fn():
+    """Returns the metrics of every worker in the Prometheus text format."""
+    return worker.Response(prometheus.collect(), headers={'Content-Type': prometheus.CONTENT_TYPE})
+
+
+def profile_fn():
+    """Starts profiling the worker that answers the request for ?seconds=N, 30 by default."""
+    try:
+        path = profiling.start(worker.Request().args.get('seconds', DEFAULT_PROFILE_SECONDS))
+    except ValueError as e:
+        return worker.Response(json.dumps({'error': str(e)}), status=http_client.BAD_REQUEST)
+    if path is None:
+        return worker.Response(json.dumps({'error': 'This worker is already profiling'}), status=http_client.CONFLICT)
+    return worker.Response(json.dumps({'pid': os.getpid(), 'path': path}), status=http_client.ACCEPTED)
+
+
 app = None
 
 
-def main(environ, start_response):
+def load_app():
+    """Imports the user module, loads the model and creates the WSGI app, once per process.
+
+    With SAGEMAKER_PRELOAD_MODEL, this runs in the gunicorn master before the workers are forked, so that all
+    workers share the model's memory. Otherwise each worker loads its own copy on its first request.
+    """
     global app
 
     if app is None:
@@ -140,20 +229,95 @@ def main(environ, start_response):
         user_module_transformer, execution_parameters_fn = import_module(serving_env.module_name,
                                                                          serving_env.module_dir)
 
-        app = worker.Worker(transform_fn=user_module_transformer.transform,
+        app = worker.Worker(transform_fn=_recorded(user_module_transformer.transform),
+                            healthcheck_fn=ping_fn,
                             module_name=serving_env.module_name,
                             execution_parameters_fn=execution_parameters_fn)
+        app.add_url_rule(rule='/metrics', endpoint='metrics', view_func=metrics_fn, methods=['GET'])
+        if profiling.is_endpoint_enabled():
+            app.add_url_rule(rule='/profile', endpoint='profile', view_func=profile_fn, methods=['POST'])
+
+    return app
+
+
+def main(environ, start_response):
+    return load_app()(environ, start_response)
+
 
-    return app(environ, start_response)
+def _reported(import_module_fn):
+    """Wraps ``modules.import_module``, which ``server.start`` calls in the launcher process to download, install
+    and import the user module before it starts gunicorn, to record it as a startup phase and report the startup
+    of the launcher."""
+    @functools.wraps(import_module_fn)
+    def reported_import_module(*args, **kwargs):
+        with startup.timed(startup.USER_MODULE):
+            user_module = import_module_fn(*args, **kwargs)
+        startup.report()
+        return user_module
+
+    return reported_import_module
+
+
+def _nginx_routes():
+    """Returns the location pattern of the routes nginx proxies, with /profile if SAGEMAKER_PROFILE_ENDPOINT is
+    set."""
+    routes = NGINX_ROUTES + (('profile',) if profiling.is_endpoint_enabled() else ())
+    return '^/({})'.format('|'.join(routes))
+
+
+def _set_nginx_config_template(server):
+    """Has ``server.start`` configure nginx from its own template with /metrics, and /profile if enabled, proxied
+    to gunicorn too."""
+    with open(server.nginx_config_template_file) as f:
+        template = f.read()
+    if NGINX_DEFAULT_ROUTES not in template:
+        logger.warning('Unexpected nginx config template {}, /metrics and /profile are not proxied'.format(
+            server.nginx_config_template_file))
+        return
+
+    with open(NGINX_CONFIG_TEMPLATE_FILE, 'w') as f:
+        f.write(template.replace(NGINX_DEFAULT_ROUTES, _nginx_routes()))
+    server.nginx_config_template_file = NGINX_CONFIG_TEMPLATE_FILE
 
 
 def serving_entrypoint():
     """Start Inference Server.
 
     NOTE: If the inference server is multi-model, MxNet Model Server will be used as the base server. Otherwise,
-        GUnicorn is used as the base server.
+        GUnicorn is used as the base server, or an asyncio server with a pool of model processes if
+        SAGEMAKER_ASYNC_SERVER is set.
     """
     if is_multi_model():
+        from sagemaker_sklearn_container.serving_mms import start_model_server
+
         start_model_server()
     else:
-        server.start(env.ServingEnv().framework_module)
+        threads = thread_limits.threads_per_worker()
+        if threads and not os.environ.get('SAGEMAKER_MODEL_SERVER_WORKERS'):
+            os.environ['SAGEMAKER_MODEL_SERVER_WORKERS'] = str(thread_limits.workers_for_threads(threads))
+        thread_limits.set_thread_limits(env.ServingEnv().model_server_workers)
+
+        # With keep-alive, clients hold their connections to the model server. Behind nginx they only hold them to
+        # nginx, which keeps them for 3 seconds and opens a new upstream connection for every request.
+        if os.environ.get(gunicorn_config.KEEP_ALIVE_TIMEOUT_ENV) and not os.environ.get('SAGEMAKER_USE_NGINX'):
+            os.environ['SAGEMAKER_USE_NGINX'] = 'false'
+
+        from sagemaker_sklearn_container import asgi
+
+        if asgi.is_enabled():
+            asgi.start()
+        else:
+            from sagemaker_containers import _server as server
+
+            if is_preload_model() or cpu_affinity.is_enabled() or gunicorn_config.connection_settings():
+                gunicorn_args = [os.environ.get('GUNICORN_CMD_ARGS'), '--config', GUNICORN_CONFIG]
+                os.environ['GUNICORN_CMD_ARGS'] = ' '.join(arg for arg in gunicorn_args if arg)
+            if env.ServingEnv().use_nginx:
+                _set_nginx_config_template(server)
+
+            import_module_fn = modules.import_module
+            modules.import_module = _reported(import_module_fn)
+            try:
+                server.start(env.ServingEnv().framework_module)
+            finally:
+                modules.import_module = import_module_fn
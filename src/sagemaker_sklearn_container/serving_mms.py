@@ -12,18 +12,19 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 import logging
-import pkg_resources
-from math import ceil
 import multiprocessing
 import os
+import psutil
 import sagemaker_inference
+import sagemaker_inference.environment
 
 from retrying import retry
 from subprocess import CalledProcessError
 
-from sagemaker_containers.beta.framework import env, modules
+# The aliased modules rather than sagemaker_containers.beta.framework, whose server module imports pkg_resources
+from sagemaker_containers import _env as env, _modules as modules
 
-from sagemaker_sklearn_container import handler_service
+from sagemaker_sklearn_container import handler_service, mms_tuning, startup, thread_limits
 from sagemaker_sklearn_container.mms_patch import model_server
 
 HANDLER_SERVICE = handler_service.__name__
@@ -33,14 +34,19 @@ DEFAULT_MAX_CONTENT_LEN = 6 * 1024 ** 2
 MAX_CONTENT_LEN_LIMIT = 20 * 1024 ** 2
 MMS_NUM_MODEL_WORKERS_INIT = 1
 MMS_MODEL_JOB_QUEUE_SIZE_DEFAULT = 100
-MME_MMS_CONFIG_FILE = pkg_resources.resource_filename(
-    sagemaker_inference.__name__, "/etc/mme-mms.properties")
+MMS_HEAP_SIZING_DEFAULT = 'static'
+MMS_MAX_GC_PAUSE_MILLIS_DEFAULT = 50
+MME_MMS_CONFIG_FILE_NAME = 'mme-mms.properties'
 
 
 def get_mms_config_file_path():
     return os.environ['SKLEARN_MMS_CONFIG']
 
 
+def get_mme_mms_config_file_path():
+    return model_server.inference_resource(MME_MMS_CONFIG_FILE_NAME)
+
+
 def _retry_if_error(exception):
     return isinstance(exception, CalledProcessError or OSError)
 
@@ -62,6 +68,30 @@ def _set_default_if_not_exist(sagemaker_env_var_name, default_value):
         os.environ[sagemaker_env_var_name] = str(default_value)
 
 
+def is_autotune():
+    return os.environ.get('SAGEMAKER_MMS_AUTOTUNE', 'false').lower() == 'true'
+
+
+def _tune_mms_configs(max_content_length):
+    """Profiles the model in SAGEMAKER_MMS_AUTOTUNE_MODEL_DIR, the SageMaker model directory by default, and
+    chooses the MMS worker count, job queue size and JVM heap size for it. In multi-model mode, that model stands
+    in for the SAGEMAKER_MMS_AUTOTUNE_MODELS models the endpoint is expected to hold at once, one per core by
+    default, so that every model keeps a single worker. Returns None if there is no model to profile.
+    """
+    model_dir = os.environ.get("SAGEMAKER_MMS_AUTOTUNE_MODEL_DIR", sagemaker_inference.environment.model_dir)
+    profile = mms_tuning.profile_model(model_dir)
+    if profile is None:
+        logging.warning("No model to profile in {}, MMS configs are not auto-tuned".format(model_dir))
+        return None
+
+    cpu_count = multiprocessing.cpu_count()
+    num_models = int(os.environ.get("SAGEMAKER_MMS_AUTOTUNE_MODELS", cpu_count))
+    tuned_configs = mms_tuning.tune(profile, cpu_count, psutil.virtual_memory().total, max_content_length,
+                                    num_models)
+    logging.info("Auto-tuned MMS configs {} for model profile {}".format(tuned_configs, profile))
+    return tuned_configs
+
+
 def _set_mms_configs(is_multi_model, handler):
     """Set environment variables for MMS to parse during server initialization. These env vars are used to
     propagate the config.properties.tmp file used during MxNet Model Server initialization.
@@ -77,8 +107,23 @@ def _set_mms_configs(is_multi_model, handler):
     max_workers = multiprocessing.cpu_count()
     max_job_queue_size = 2 * max_workers
 
-    # Max heap size = (max workers + max job queue size) * max payload size * 1.2 (20% buffer) + 128 (base amount)
-    max_heap_size = ceil((max_workers + max_job_queue_size) * (int(max_content_length) / 1024 ** 2) * 1.2) + 128
+    num_model_workers = MMS_NUM_MODEL_WORKERS_INIT
+    model_job_queue_size = MMS_MODEL_JOB_QUEUE_SIZE_DEFAULT
+    max_heap_size = mms_tuning.max_heap_size_mb(max_workers, max_job_queue_size, max_content_length)
+
+    if is_autotune():
+        tuned_configs = _tune_mms_configs(max_content_length)
+        if tuned_configs:
+            num_model_workers = tuned_configs['workers']
+            model_job_queue_size = tuned_configs['job_queue_size']
+            max_heap_size = tuned_configs['max_heap_size_mb']
+
+    # A model's workers trade off against its threads when SAGEMAKER_THREADS_PER_WORKER is set. Otherwise every
+    # worker is limited to one thread, as MMS may run up to one worker per core across the models it serves.
+    threads = thread_limits.threads_per_worker()
+    if threads:
+        num_model_workers = min(num_model_workers, thread_limits.workers_for_threads(threads, max_workers))
+    thread_limits.set_thread_limits(max_workers, max_workers)
 
     os.environ["SAGEMAKER_MMS_MODEL_STORE"] = '/'
     os.environ["SAGEMAKER_MMS_LOAD_MODELS"] = ''
@@ -88,13 +133,24 @@ def _set_mms_configs(is_multi_model, handler):
     _set_default_if_not_exist("SAGEMAKER_BIND_TO_PORT", str(PORT))
 
     # Multi Model Server configs, exposed to users as env vars
-    _set_default_if_not_exist("SAGEMAKER_NUM_MODEL_WORKERS", MMS_NUM_MODEL_WORKERS_INIT)
-    _set_default_if_not_exist("SAGEMAKER_MODEL_JOB_QUEUE_SIZE", MMS_MODEL_JOB_QUEUE_SIZE_DEFAULT)
+    _set_default_if_not_exist("SAGEMAKER_NUM_MODEL_WORKERS", num_model_workers)
+    _set_default_if_not_exist("SAGEMAKER_MODEL_JOB_QUEUE_SIZE", model_job_queue_size)
     _set_default_if_not_exist("SAGEMAKER_MAX_REQUEST_SIZE", max_content_length)
 
     # JVM configurations for MMS, exposed to users as env vars
+    user_max_heap_size = os.getenv("SAGEMAKER_MAX_HEAP_SIZE")
     _set_default_if_not_exist("SAGEMAKER_MAX_HEAP_SIZE", str(max_heap_size) + 'm')
     _set_default_if_not_exist("SAGEMAKER_MAX_DIRECT_MEMORY_SIZE", os.environ["SAGEMAKER_MAX_HEAP_SIZE"])
+    _set_default_if_not_exist("SAGEMAKER_MMS_MAX_GC_PAUSE_MILLIS", MMS_MAX_GC_PAUSE_MILLIS_DEFAULT)
+
+    # With 'static' heap sizing the whole heap is committed at start up. With 'dynamic' heap sizing the heap starts
+    # with room for one max size payload per worker and grows up to the max heap size as jobs queue up.
+    _set_default_if_not_exist("SAGEMAKER_MMS_HEAP_SIZING", MMS_HEAP_SIZING_DEFAULT)
+    if os.environ["SAGEMAKER_MMS_HEAP_SIZING"] != 'dynamic':
+        _set_default_if_not_exist("SAGEMAKER_INITIAL_HEAP_SIZE", os.environ["SAGEMAKER_MAX_HEAP_SIZE"])
+    elif not user_max_heap_size:
+        initial_heap_size = min(mms_tuning.max_heap_size_mb(max_workers, 0, max_content_length), max_heap_size)
+        _set_default_if_not_exist("SAGEMAKER_INITIAL_HEAP_SIZE", str(initial_heap_size) + 'm')
 
     MMS_CONFIG_FILE_PATH = get_mms_config_file_path()
 
@@ -105,21 +161,41 @@ def _set_mms_configs(is_multi_model, handler):
     try:
         with open(MMS_CONFIG_FILE_PATH + '.tmp', 'r') as f:
             with open(MMS_CONFIG_FILE_PATH, 'w+') as g:
-                g.write("vmargs=-XX:-UseLargePages"
-                        + " -XX:+UseParNewGC"
-                        + " -XX:MaxMetaspaceSize=32M"
-                        + " -XX:InitiatingHeapOccupancyPercent=25"
-                        + " -Xms" + os.environ["SAGEMAKER_MAX_HEAP_SIZE"]
-                        + " -Xmx" + os.environ["SAGEMAKER_MAX_HEAP_SIZE"]
-                        + " -XX:MaxDirectMemorySize=" + os.environ["SAGEMAKER_MAX_DIRECT_MEMORY_SIZE"] + "\n")
+                g.write("vmargs=" + " ".join(_jvm_args()) + "\n")
                 g.write(f.read())
     except Exception:
         pass
 
 
+def _jvm_args():
+    """Returns the MMS JVM arguments for the heap and GC configuration set in the environment by _set_mms_configs."""
+    # G1 keeps pauses short on large heaps and is available from JDK 8 on, unlike ParNew which JDK 10 removed
+    jvm_args = ["-XX:-UseLargePages",
+                "-XX:+UseG1GC",
+                "-XX:MaxGCPauseMillis=" + os.environ["SAGEMAKER_MMS_MAX_GC_PAUSE_MILLIS"],
+                "-XX:MaxMetaspaceSize=32M",
+                "-XX:InitiatingHeapOccupancyPercent=25"]
+
+    if os.environ.get("SAGEMAKER_INITIAL_HEAP_SIZE"):
+        jvm_args.append("-Xms" + os.environ["SAGEMAKER_INITIAL_HEAP_SIZE"])
+    jvm_args += ["-Xmx" + os.environ["SAGEMAKER_MAX_HEAP_SIZE"],
+                 "-XX:MaxDirectMemorySize=" + os.environ["SAGEMAKER_MAX_DIRECT_MEMORY_SIZE"]]
+
+    if os.environ["SAGEMAKER_MMS_HEAP_SIZING"] == 'dynamic':
+        # Give heap that is no longer needed back to the OS instead of keeping it committed
+        jvm_args += ["-XX:MinHeapFreeRatio=10", "-XX:MaxHeapFreeRatio=30"]
+
+    # GC pauses and heap occupancy before and after each collection, to size the heap on evidence
+    if os.environ.get("SAGEMAKER_MMS_GC_LOG"):
+        jvm_args += ["-Xloggc:" + os.environ["SAGEMAKER_MMS_GC_LOG"], "-XX:+PrintGCDetails"]
+
+    return jvm_args
+
+
 def start_model_server():
     serving_env = env.ServingEnv()
     is_multi_model = True
 
-    modules.import_module(serving_env.module_dir, serving_env.module_name)
+    with startup.timed(startup.USER_MODULE):
+        modules.import_module(serving_env.module_dir, serving_env.module_name)
     _start_model_server(is_multi_model, HANDLER_SERVICE)
@@ -0,0 +1,83 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Durations of the startup phases of a model server process.
+
+Every process records the phases it goes through: importing the serving code since the process started,
+downloading, installing and importing the user module (in the process that starts the model server), for MMS
+archiving the model and installing the user requirements, loading the model and answering the first ping. They
+are logged as one JSON line when the process answers its first ping or, for the process that starts gunicorn or
+MMS, once it has started them.
+"""
+from __future__ import absolute_import
+from collections import OrderedDict
+import contextlib
+import json
+import logging
+import time
+
+import psutil
+
+IMPORT = 'import'
+USER_MODULE = 'user_module'
+MODEL_ARCHIVE = 'model_archive'
+REQUIREMENTS_INSTALL = 'requirements_install'
+MODEL_LOAD = 'model_load'
+FIRST_PING = 'first_ping'
+
+logger = logging.getLogger(__name__)
+
+phases = OrderedDict()
+_reported = False
+
+
+def since_process_start():
+    """Returns the seconds since this process was created, by fork or exec."""
+    return time.time() - psutil.Process().create_time()
+
+
+def record(phase, seconds):
+    phases[phase] = phases.get(phase, 0) + seconds
+
+
+def record_import():
+    """Records the time from the process start until now as the import phase, once."""
+    if IMPORT not in phases:
+        phases[IMPORT] = since_process_start()
+
+
+@contextlib.contextmanager
+def timed(phase):
+    """Records the time spent in the with block as the given phase."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - start)
+
+
+def report():
+    """Logs the phases recorded so far and the time since the process started as one JSON line."""
+    stats = dict(phases, total=since_process_start())
+    logger.info('startup phases: {}'.format(json.dumps(stats)))
+    return stats
+
+
+def on_ping():
+    """Records the time from the process start until its first ping as the first_ping phase, and reports the
+    startup of the process."""
+    global _reported
+
+    if not _reported:
+        _reported = True
+        phases[FIRST_PING] = since_process_start()
+        report()
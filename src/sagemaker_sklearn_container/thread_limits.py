@@ -0,0 +1,78 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+import logging
+import multiprocessing
+import os
+
+THREADS_PER_WORKER_ENV = 'SAGEMAKER_THREADS_PER_WORKER'
+# Read by OpenMP, OpenBLAS, MKL, BLIS, Accelerate and numexpr when they are loaded in a worker process
+THREAD_LIMIT_ENV_VARS = ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'BLIS_NUM_THREADS',
+                         'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS']
+BLAS_THREAD_LIMIT_ENV_VARS = ['OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'BLIS_NUM_THREADS']
+
+logger = logging.getLogger(__name__)
+
+
+def threads_per_worker():
+    """Returns the number of threads per worker requested in SAGEMAKER_THREADS_PER_WORKER, None if not set.
+
+    Requesting more than one thread per worker trades workers for threads: the model server starts one worker
+    per that many cores, which suits large models whose predict parallelizes well.
+    """
+    threads = os.environ.get(THREADS_PER_WORKER_ENV)
+    return int(threads) if threads else None
+
+
+def workers_for_threads(threads, cpu_count=None):
+    """Returns how many workers of the given number of threads the host's cores fit."""
+    return max(1, (cpu_count or multiprocessing.cpu_count()) // threads)
+
+
+def set_thread_limits(num_workers, cpu_count=None):
+    """Limits the native thread pools of the workers that will be started, so that num_workers workers don't
+    start more threads than the host has cores. Must be called before the workers are started; thread limits
+    already set in the environment are kept.
+    Args:
+        num_workers: number of worker processes on the host.
+        cpu_count: number of cores on the host, multiprocessing.cpu_count() by default.
+    Returns: the number of threads per worker.
+    """
+    threads = threads_per_worker() or max(1, (cpu_count or multiprocessing.cpu_count()) // num_workers)
+    for env_var in THREAD_LIMIT_ENV_VARS:
+        if not os.environ.get(env_var):
+            os.environ[env_var] = str(threads)
+
+    logger.info('Limiting {} workers to {} threads each'.format(num_workers, threads))
+    return threads
+
+
+def limit_loaded_thread_pools():
+    """Applies the thread limits of the environment to the native thread pools already loaded in this process.
+
+    The pools read their environment variables only when they are loaded, so the limits set by set_thread_limits
+    don't reach a worker forked from a process that had already imported NumPy, such as the model processes of
+    the async server.
+    Returns: the limits applied, by threadpoolctl user API.
+    """
+    from threadpoolctl import threadpool_limits
+
+    limits = {}
+    if os.environ.get('OMP_NUM_THREADS'):
+        limits['openmp'] = int(os.environ['OMP_NUM_THREADS'])
+    blas_threads = [os.environ[env_var] for env_var in BLAS_THREAD_LIMIT_ENV_VARS if os.environ.get(env_var)]
+    if blas_threads:
+        limits['blas'] = int(blas_threads[0])
+    if limits:
+        threadpool_limits(limits=limits)
+    return limits
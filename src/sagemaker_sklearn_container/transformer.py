@@ -0,0 +1,256 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+from collections import Counter, OrderedDict
+import time
+import traceback
+
+import numpy as np
+from six.moves import http_client
+
+from sagemaker_inference import content_types, environment, utils
+from sagemaker_inference.errors import BaseInferenceToolkitError, GenericInferenceToolkitError
+from sagemaker_inference.transformer import Transformer
+
+from sagemaker_sklearn_container import metrics, profiling, prometheus, startup
+
+
+def _num_rows(input_data):
+    """Returns the number of rows of a 2-D numpy array or scipy.sparse matrix, None for anything else."""
+    import scipy.sparse
+
+    if (isinstance(input_data, np.ndarray) or scipy.sparse.issparse(input_data)) and input_data.ndim == 2:
+        return input_data.shape[0]
+    return None
+
+
+def _num_predictions(prediction):
+    """Returns the length of the first dimension of a prediction, None if it has none."""
+    shape = getattr(prediction, 'shape', None)
+    if shape is not None:
+        return shape[0] if len(shape) else None
+    try:
+        return len(prediction)
+    except TypeError:
+        return None
+
+
+def _stack(inputs):
+    """Stacks the rows of the given inputs into one matrix, or returns None if they can't be stacked."""
+    if any(_num_rows(input_data) is None for input_data in inputs):
+        return None
+    if len(set(input_data.shape[1] for input_data in inputs)) != 1:
+        return None
+
+    import scipy.sparse
+
+    sparse = [scipy.sparse.issparse(input_data) for input_data in inputs]
+    if all(sparse):
+        return scipy.sparse.vstack(inputs, format='csr')
+    if not any(sparse):
+        return np.concatenate(inputs)
+    return None
+
+
+class SKLearnTransformer(Transformer):
+    """Transformer that makes a single prediction for all the requests of an MMS batch.
+
+    MMS hands the handler a list of requests when the model is registered with a ``batch_size`` greater than one,
+    after waiting up to ``max_batch_delay`` milliseconds for the batch to fill. The container starts MMS without
+    models, so these are set by whoever registers the model through the management API. The default ``Transformer`` runs
+    input_fn, predict_fn and output_fn once per request. This one decodes every request, stacks their rows into
+    one matrix, calls predict_fn once and encodes each request's slice of the prediction. Requests are grouped by
+    their content type and accept headers, with one prediction per group.
+
+    Batches that can't be coalesced, because a ``transform_fn`` or ``predict_fn`` is provided or input_fn doesn't
+    return 2-D arrays with matching columns, are predicted one request at a time.
+
+    Every request of a batch gets a response. A request whose input_fn or output_fn raises gets its own error
+    status, and a failed prediction fails only the requests of its group.
+    """
+
+    def transform(self, data, context):
+        """Take a batch of requests, deserialize them, make a single prediction per content type and accept,
+        and return a serialized response per request.
+
+        Args:
+            data (obj): the request data.
+            context (obj): metadata on the incoming request data.
+
+        Returns:
+            list[obj]: The serialized prediction results, one per request. A request that failed is answered
+                with an error message, and its status is set in the context.
+        """
+        profiling.on_request()
+        # The status of each request of the batch, set by handle_error and _handle_request_error
+        self._status_codes = [http_client.OK] * len(data)
+        start = metrics.request_stats.start(len(data))
+        try:
+            return self._transform(data, context)
+        finally:
+            for status_code, num_requests in Counter(self._status_codes).items():
+                metrics.request_stats.finish(start, status_code, num_requests)
+            prometheus.maybe_write_worker_file()
+
+    def _transform(self, data, context):
+        for item in data:
+            body = item.get('body')
+            if body is not None:
+                metrics.payload_sizes.record(len(body))
+
+        if len(data) < 2:
+            return super(SKLearnTransformer, self).transform(data, context)
+
+        response_list = [None] * len(data)
+        try:
+            properties = context.system_properties
+            self.validate_and_initialize(model_dir=properties.get('model_dir'))
+        except Exception as e:  # pylint: disable=broad-except
+            error = self._handle_request_error(context, range(len(data)), e)
+            return [error] * len(data)
+
+        groups = OrderedDict()
+        for i in range(len(data)):
+            groups.setdefault(self._request_headers(context, i), []).append(i)
+
+        for (content_type, accept), indices in groups.items():
+            if self._transform_fn != self._default_transform_fn:
+                for i in indices:
+                    response_list[i] = self._run_request(
+                        context, i, accept, self._transform_fn,
+                        self._model, self._request_body(data, i, content_type), content_type, accept)
+                continue
+
+            inputs = []
+            decoded = []
+            for i in indices:
+                try:
+                    inputs.append(self._input_fn(self._request_body(data, i, content_type), content_type))
+                    decoded.append(i)
+                except Exception as e:  # pylint: disable=broad-except
+                    response_list[i] = self._handle_request_error(context, [i], e)
+            if not inputs:
+                continue
+
+            try:
+                predictions = self._predict(inputs)
+            except Exception as e:  # pylint: disable=broad-except
+                error = self._handle_request_error(context, decoded, e)
+                for i in decoded:
+                    response_list[i] = error
+                continue
+
+            for i, prediction in zip(decoded, predictions):
+                response_list[i] = self._run_request(context, i, accept, self._output_fn, prediction, accept)
+
+        return response_list
+
+    @staticmethod
+    def _request_body(data, index, content_type):
+        input_data = data[index].get('body')
+        if content_type in content_types.UTF8_TYPES:
+            input_data = input_data.decode('utf-8')
+        return input_data
+
+    def _run_request(self, context, index, accept, fn, *args):
+        """Runs the handler function that serializes the response of the request at the given index of the batch,
+        and sets its content type. Returns: the response, or the error message if the function raised."""
+        try:
+            result = fn(*args)
+        except Exception as e:  # pylint: disable=broad-except
+            return self._handle_request_error(context, [index], e)
+
+        response = result
+        response_content_type = accept
+
+        if isinstance(result, tuple):
+            response = result[0]
+            response_content_type = result[1]
+
+        context.set_response_content_type(index, response_content_type)
+        return response
+
+    def _handle_request_error(self, context, indices, exception):
+        """Sets the error status of the requests at the given indices of the batch, like ``handle_error`` does for
+        the first request. Returns: the error message and stacktrace, the response of each of these requests."""
+        trace = traceback.format_exc()
+        if not isinstance(exception, BaseInferenceToolkitError):
+            exception = GenericInferenceToolkitError(http_client.INTERNAL_SERVER_ERROR, str(exception))
+
+        for i in indices:
+            context.set_response_status(code=exception.status_code, phrase=utils.remove_crlf(exception.phrase),
+                                        idx=i)
+            self._status_codes[i] = exception.status_code
+        return '{}\n{}'.format(exception.message, trace)
+
+    def validate_and_initialize(self, model_dir=environment.model_dir, **kwargs):
+        """Validates the user module and loads the model like ``Transformer``, recording how long it took in
+        ``metrics.request_stats`` and reporting the startup of the worker. Other arguments, such as the MMS context
+        that later sagemaker-inference versions take, are passed on to ``Transformer``."""
+        if self._initialized:
+            return
+
+        start = time.perf_counter()
+        super(SKLearnTransformer, self).validate_and_initialize(model_dir=model_dir, **kwargs)
+        metrics.request_stats.model_load_seconds = time.perf_counter() - start
+        # MMS workers don't see the pings, which the front end answers
+        startup.record(startup.MODEL_LOAD, metrics.request_stats.model_load_seconds)
+        startup.report()
+
+    def handle_error(self, context, inference_exception, trace):
+        self._status_codes = [inference_exception.status_code] * len(self._status_codes)
+        return super(SKLearnTransformer, self).handle_error(context, inference_exception, trace)
+
+    def _validate_user_module_and_set_functions(self):
+        """Sets the inference handlers like ``Transformer``, wrapped to record their latency in
+        ``metrics.stage_stats``. The default transform_fn isn't wrapped, as the stages it calls are."""
+        super(SKLearnTransformer, self)._validate_user_module_and_set_functions()
+
+        stage_stats = metrics.stage_stats
+        self._input_fn = stage_stats.timed(metrics.INPUT_FN, self._input_fn)
+        self._predict_fn = stage_stats.timed(metrics.PREDICT_FN, self._predict_fn)
+        self._output_fn = stage_stats.timed(metrics.OUTPUT_FN, self._output_fn)
+        if self._transform_fn != self._default_transform_fn:
+            self._transform_fn = stage_stats.timed(metrics.TRANSFORM_FN, self._transform_fn)
+
+    def _request_headers(self, context, index):
+        """Returns the content type and accept headers of the request at the given index of the batch."""
+        request_property = context.request_processor[index].get_request_properties()
+        content_type = utils.retrieve_content_type_header(request_property)
+        accept = request_property.get('Accept') or request_property.get('accept')
+
+        if not accept or accept == content_types.ANY:
+            accept = self._environment.default_accept
+
+        return content_type, accept
+
+    def _predict(self, inputs):
+        """Predicts the stacked inputs and splits the prediction back into one slice per input.
+
+        Only the default predict_fn, which returns ``model.predict``, is known to return one prediction per row,
+        so a user's predict_fn is called once per input. The stacked prediction is split whatever the sequence
+        type, and is never predicted again.
+        """
+        predict_fn = getattr(self._predict_fn, '__wrapped__', self._predict_fn)
+        stacked = _stack(inputs) if predict_fn == self._default_inference_handler.default_predict_fn else None
+        if stacked is None:
+            return [self._predict_fn(input_data, self._model) for input_data in inputs]
+
+        prediction = self._predict_fn(stacked, self._model)
+        if _num_predictions(prediction) != stacked.shape[0]:
+            raise ValueError('The model returned {} predictions for {} rows'.format(
+                _num_predictions(prediction), stacked.shape[0]))
+
+        rows = getattr(prediction, 'iloc', prediction)
+        ends = np.cumsum([input_data.shape[0] for input_data in inputs])
+        return [rows[end - input_data.shape[0]:end] for end, input_data in zip(ends, inputs)]
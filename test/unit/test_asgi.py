@@ -0,0 +1,196 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import os
+
+import flask
+from mock import DEFAULT, MagicMock, patch
+import pytest
+
+from sagemaker_sklearn_container import asgi, serving
+
+
+def _echo_app():
+    app = flask.Flask('echo')
+
+    @app.route('/invocations', methods=['POST'])
+    def invocations():
+        return flask.Response(flask.request.data[::-1], status=200, mimetype=flask.request.headers['Accept'])
+
+    return app
+
+
+@pytest.fixture(autouse=True)
+def wsgi_app(monkeypatch):
+    monkeypatch.setattr(serving, 'app', _echo_app())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        monkeypatch.setattr(asgi, '_executor', executor)
+        yield
+
+
+def _request(method, path, body=b'', headers=(), chunk_size=None):
+    chunk_size = chunk_size or max(len(body), 1)
+    messages = [{'type': 'http.request', 'body': body[i:i + chunk_size], 'more_body': i + chunk_size < len(body)}
+                for i in range(0, max(len(body), 1), chunk_size)]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': b'', 'headers': list(headers)}
+    asyncio.run(asgi.app(scope, receive, send))
+    return sent[0]['status'], dict(sent[0]['headers']), sent[1]['body']
+
+
+def test_invocations_run_in_pool():
+    status, headers, body = _request('POST', '/invocations', b'1,2,3', [(b'accept', b'text/csv')], chunk_size=2)
+
+    assert status == 200
+    assert headers[b'Content-Type'].startswith(b'text/csv')
+    assert body == b'3,2,1'
+
+
+def test_unknown_route():
+    status, _, _ = _request('GET', '/unknown')
+    assert status == 404
+
+
+def test_ping_does_not_use_pool(monkeypatch):
+    monkeypatch.setattr(asgi, '_executor', None)
+    assert _request('GET', '/ping') == (200, {}, b'')
+
+
+def test_broken_pool_is_replaced(monkeypatch):
+    broken_executor = asgi._executor
+    new_executor = MagicMock()
+    monkeypatch.setattr(asgi, '_handle', MagicMock(side_effect=BrokenProcessPool()))
+    monkeypatch.setattr(asgi, '_new_executor', MagicMock(return_value=new_executor))
+
+    status, _, _ = _request('POST', '/invocations', b'1,2,3', [(b'accept', b'text/csv')])
+
+    assert status == 500
+    assert asgi._executor is new_executor
+    assert broken_executor._shutdown
+
+
+def test_broken_pool_is_replaced_once(monkeypatch):
+    new_executor = MagicMock()
+    monkeypatch.setattr(asgi, '_executor', MagicMock())
+    monkeypatch.setattr(asgi, '_new_executor', MagicMock(return_value=new_executor))
+
+    asgi._replace_executor(MagicMock())
+
+    assert asgi._executor is not new_executor
+    asgi._new_executor.assert_not_called()
+
+
+def test_lifespan():
+    messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi.app({'type': 'lifespan'}, receive, send))
+
+    assert sent == [{'type': 'lifespan.startup.complete'}, {'type': 'lifespan.shutdown.complete'}]
+
+
+@pytest.mark.parametrize('value, enabled', [(None, False), ('false', False), ('true', True)])
+def test_is_enabled(value, enabled):
+    environ = {} if value is None else {asgi.ASYNC_SERVER_ENV: value}
+    with patch.dict(os.environ, environ, clear=True):
+        assert asgi.is_enabled() is enabled
+
+
+@patch.dict(os.environ, {'SAGEMAKER_CPU_AFFINITY': 'true'})
+@patch('sagemaker_sklearn_container.serving.load_app')
+@patch('sagemaker_sklearn_container.cpu_affinity.pin_worker')
+def test_initialize_worker_pins_before_loading_model(pin_worker, load_app):
+    load_app.side_effect = lambda: pin_worker.assert_called_once()
+
+    asgi._initialize_worker()
+
+    load_app.assert_called_once()
+
+
+@patch('sagemaker_sklearn_container.serving.load_app')
+@patch('sagemaker_sklearn_container.thread_limits.limit_loaded_thread_pools')
+def test_initialize_worker_limits_thread_pools_before_loading_model(limit_loaded_thread_pools, load_app):
+    load_app.side_effect = lambda: limit_loaded_thread_pools.assert_called_once()
+
+    asgi._initialize_worker()
+
+    load_app.assert_called_once()
+
+
+@patch.dict(os.environ, {asgi.ASYNC_SERVER_ENV: 'true'})
+@patch('sagemaker_containers._server.start')
+@patch('sagemaker_sklearn_container.asgi.start')
+def test_serving_entrypoint_async_server(start, server_start):
+    serving.serving_entrypoint()
+
+    start.assert_called_once()
+    server_start.assert_not_called()
+
+
+@patch('sagemaker_sklearn_container.asgi.ProcessPoolExecutor')
+@patch.dict('sys.modules', {'uvicorn': MagicMock()})
+def test_start(process_pool_executor):
+    import uvicorn
+
+    asgi.start()
+
+    process_pool_executor.return_value.submit.assert_called_once_with(os.getpid)
+    uvicorn.run.assert_called_once()
+    assert uvicorn.run.call_args[0] == (asgi.app,)
+    process_pool_executor.return_value.shutdown.assert_called_once()
+
+
+@patch.dict(os.environ, {'SAGEMAKER_PROGRAM': 'user_module'})
+@patch('sagemaker_sklearn_container.asgi.ProcessPoolExecutor')
+@patch('sagemaker_containers._modules.import_module')
+@patch.dict('sys.modules', {'uvicorn': MagicMock()})
+def test_start_imports_user_module_before_forking(import_module, process_pool_executor):
+    def new_executor(*args, **kwargs):
+        import_module.assert_called_once()
+        return DEFAULT
+
+    process_pool_executor.side_effect = new_executor
+
+    asgi.start()
+
+    process_pool_executor.assert_called_once()
+    assert import_module.call_args[0][1] == 'user_module'
+
+
+@patch.dict(os.environ, {'SAGEMAKER_KEEP_ALIVE_TIMEOUT': '75', 'SAGEMAKER_WORKER_CONNECTIONS': '500'})
+@patch('sagemaker_sklearn_container.asgi.ProcessPoolExecutor')
+@patch.dict('sys.modules', {'uvicorn': MagicMock()})
+def test_start_connection_settings(process_pool_executor):
+    import uvicorn
+
+    asgi.start()
+
+    assert uvicorn.run.call_args[1]['timeout_keep_alive'] == 75
+    assert uvicorn.run.call_args[1]['limit_concurrency'] == 500
+    assert 'backlog' not in uvicorn.run.call_args[1]
@@ -0,0 +1,99 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+import os
+
+from mock import patch
+import pytest
+
+from sagemaker_sklearn_container import cpu_affinity
+
+
+@pytest.fixture(autouse=True)
+def slot_directory(tmpdir, monkeypatch):
+    monkeypatch.setattr(cpu_affinity, 'SLOT_DIRECTORY', str(tmpdir.join('slots')))
+    monkeypatch.setattr(cpu_affinity, '_slot_file', None)
+
+
+def _write_node(node_directory, node, cpu_list):
+    node_directory.mkdir('node{}'.format(node)).join('cpulist').write(cpu_list + '\n')
+
+
+@pytest.mark.parametrize('cpu_list, cpus', [('0', [0]), ('0-3', [0, 1, 2, 3]), ('0-1,8-9', [0, 1, 8, 9]), ('', [])])
+def test_parse_cpu_list(cpu_list, cpus):
+    assert cpu_affinity._parse_cpu_list(cpu_list) == cpus
+
+
+@patch('os.sched_getaffinity', return_value={0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11})
+def test_numa_nodes(sched_getaffinity, tmpdir, monkeypatch):
+    _write_node(tmpdir, 0, '0-3,8-9')
+    _write_node(tmpdir, 1, '4-7,10-11')
+    _write_node(tmpdir, 10, '12-15')
+    monkeypatch.setattr(cpu_affinity, 'NUMA_NODE_DIRECTORY', str(tmpdir))
+
+    assert cpu_affinity.numa_nodes() == [[0, 1, 2, 3, 8, 9], [4, 5, 6, 7, 10, 11]]
+
+
+@patch('os.sched_getaffinity', return_value={2, 3})
+def test_numa_nodes_without_sysfs(sched_getaffinity, tmpdir, monkeypatch):
+    monkeypatch.setattr(cpu_affinity, 'NUMA_NODE_DIRECTORY', str(tmpdir.join('missing')))
+
+    assert cpu_affinity.numa_nodes() == [[2, 3]]
+
+
+@pytest.mark.parametrize('cores_per_worker, sets', [
+    (1, [[0], [1], [2], [3], [4], [5]]),
+    (2, [[0, 1], [2, 3], [4, 5]]),
+    (3, [[0, 1, 2]]),
+    (4, [[0, 1, 2, 3]]),
+    (8, [[0, 1, 2, 3, 4, 5]]),
+])
+def test_core_sets_do_not_cross_nodes(cores_per_worker, sets):
+    assert cpu_affinity.core_sets(cores_per_worker, nodes=[[0, 1, 2, 3], [4, 5]]) == sets
+
+
+@pytest.mark.parametrize('omp_num_threads, cores', [(None, 1), ('4', 4), ('0', 1)])
+def test_cores_per_worker(omp_num_threads, cores):
+    environ = {} if omp_num_threads is None else {'OMP_NUM_THREADS': omp_num_threads}
+    with patch.dict(os.environ, environ, clear=True):
+        assert cpu_affinity.cores_per_worker() == cores
+
+
+def test_claim_slot_takes_first_free_slot():
+    assert cpu_affinity._claim_slot(3) == 0
+    first_slot_file = cpu_affinity._slot_file
+
+    # A flock held through another open file description excludes this one too
+    assert cpu_affinity._claim_slot(3) == 1
+    first_slot_file.close()
+
+
+@patch('os.getpid', return_value=7)
+@patch('fcntl.flock', side_effect=IOError)
+def test_claim_slot_shares_when_all_taken(flock, getpid):
+    assert cpu_affinity._claim_slot(3) == 1
+
+
+@patch.dict(os.environ, {'OMP_NUM_THREADS': '2'})
+@patch('os.sched_setaffinity')
+@patch('sagemaker_sklearn_container.cpu_affinity.numa_nodes', return_value=[[0, 1, 2, 3]])
+def test_pin_worker(numa_nodes, sched_setaffinity):
+    assert cpu_affinity.pin_worker() == [0, 1]
+    sched_setaffinity.assert_called_once_with(0, [0, 1])
+
+
+@pytest.mark.parametrize('value, enabled', [(None, False), ('false', False), ('true', True), ('TRUE', True)])
+def test_is_enabled(value, enabled):
+    environ = {} if value is None else {cpu_affinity.CPU_AFFINITY_ENV: value}
+    with patch.dict(os.environ, environ, clear=True):
+        assert cpu_affinity.is_enabled() is enabled
@@ -0,0 +1,391 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import json
+import os
+from mock import patch
+from six import BytesIO, StringIO
+import numpy as np
+import pyarrow as pa
+import pytest
+import scipy.sparse
+
+from sagemaker_inference import content_types, errors
+
+from sagemaker_sklearn_container import content_types as sklearn_content_types, decoder
+
+PARQUET_FIXTURE = os.path.join(os.path.dirname(__file__), '..', '..', 'test.parquet')
+
+
+def _genfromtxt(csv_data, dtype=float):
+    return np.genfromtxt(StringIO(csv_data), dtype=dtype, delimiter=',')
+
+
+def _npy(array):
+    buffer = BytesIO()
+    np.save(buffer, array)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('csv_data', [
+    '42',
+    '42\n6\n9\n',
+    '42,6,9',
+    '1.5,2,3\n4,5.25,6\n',
+    '1,2\r\n3,4\r\n',
+    '-1e5,nan,inf\n0.1,0.2,0.3',
+])
+def test_csv_to_numpy_matches_genfromtxt(csv_data):
+    actual = decoder._csv_to_numpy(csv_data, np.float64)
+
+    assert decoder._parse_numeric_csv(csv_data) is not None
+    assert actual.shape == _genfromtxt(csv_data).shape
+    np.testing.assert_array_equal(actual, _genfromtxt(csv_data))
+
+
+@pytest.mark.parametrize('csv_data', [
+    '1,2,3\n4,5\n',
+    '1,,3\n4,5,6',
+    '1,a,3',
+    '"1",2',
+    '1,2\n\n3,4',
+    '1, ,2\n3,4,5',
+    '1\n \n2',
+    '1,2\n3,4\n\n',
+    ',1\n2,3',
+    '1,\n2,3',
+    '',
+])
+def test_csv_to_numpy_falls_back_to_genfromtxt(csv_data):
+    assert decoder._parse_numeric_csv(csv_data) is None
+
+
+def test_csv_to_numpy_blank_field_is_nan():
+    actual = decoder._csv_to_numpy('1, ,2\n3,4,5', np.float64)
+
+    assert np.isnan(actual[0, 1])
+    np.testing.assert_array_equal(actual, _genfromtxt('1, ,2\n3,4,5'))
+
+
+def test_csv_to_numpy_skips_blank_line():
+    np.testing.assert_array_equal(decoder._csv_to_numpy('1\n \n2', np.float64), [1, 2])
+
+
+def test_csv_to_numpy_fallback_result():
+    np.testing.assert_array_equal(decoder._csv_to_numpy('1,,3\n4,5,6'), _genfromtxt('1,,3\n4,5,6', dtype=None))
+
+
+def test_csv_to_numpy_bytes():
+    np.testing.assert_array_equal(decoder._csv_to_numpy(b'1,2\n3,4\n'), [[1, 2], [3, 4]])
+    np.testing.assert_array_equal(decoder._csv_to_numpy(b'1,,3\n4,5,6'), _genfromtxt('1,,3\n4,5,6', dtype=None))
+
+
+def test_csv_to_numpy_dtype():
+    assert decoder._csv_to_numpy('1,2\n3,4', dtype=np.float32).dtype == np.float32
+
+
+@pytest.mark.parametrize('csv_data', ['1,2\n3,4', '1,2.5\n3,4', '42'])
+def test_csv_to_numpy_without_dtype_matches_genfromtxt(csv_data):
+    actual = decoder._csv_to_numpy(csv_data)
+
+    expected = _genfromtxt(csv_data, dtype=None)
+    assert actual.dtype == expected.dtype
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize('content_type', [content_types.CSV, content_types.JSON, content_types.NPY])
+def test_decode(content_type):
+    payloads = {
+        content_types.CSV: '1,2\n3,4',
+        content_types.JSON: '[[1, 2], [3, 4]]',
+        content_types.NPY: _npy(np.array([[1, 2], [3, 4]])),
+    }
+    np.testing.assert_array_equal(decoder.decode(payloads[content_type], content_type), [[1, 2], [3, 4]])
+
+
+def test_decode_bad_content_type():
+    with pytest.raises(errors.UnsupportedFormatError):
+        decoder.decode('', 'application/not_supported')
+
+
+def test_npy_to_numpy_rejects_pickle():
+    with pytest.raises(ValueError):
+        decoder._npy_to_numpy(_npy(np.array([{'a': 1}], dtype=object)))
+
+
+@pytest.mark.parametrize('array', [
+    np.arange(12, dtype=np.float64).reshape(3, 4),
+    np.arange(12, dtype=np.float32).reshape(3, 4),
+    np.asfortranarray(np.arange(12, dtype=np.int64).reshape(3, 4)),
+    np.array(42.),
+    np.zeros((0, 3)),
+])
+def test_npy_to_numpy(array):
+    actual = decoder._npy_to_numpy(_npy(array))
+
+    assert actual.dtype == array.dtype
+    assert actual.shape == array.shape
+    np.testing.assert_array_equal(actual, array)
+
+
+@pytest.mark.parametrize('payload_type', [bytes, bytearray])
+def test_npy_to_numpy_is_zero_copy(payload_type):
+    payload = payload_type(_npy(np.ones((100, 10))))
+    actual = decoder._npy_to_numpy(payload)
+
+    assert np.shares_memory(actual, np.frombuffer(payload, dtype=np.uint8))
+    assert actual.flags.writeable == (payload_type is bytearray)
+
+
+def test_npy_to_numpy_version_2_header():
+    buffer = BytesIO()
+    np.lib.format.write_array(buffer, np.ones((2, 2)), version=(2, 0))
+
+    np.testing.assert_array_equal(decoder._npy_to_numpy(buffer.getvalue()), np.ones((2, 2)))
+
+
+@pytest.mark.parametrize('content_type, payload', [
+    (content_types.CSV, '1,2\n3,4'),
+    (content_types.CSV, '1,,2\n3,4,5'),
+    (content_types.JSON, '[[1, 2], [3, 4]]'),
+    (content_types.NPY, _npy(np.ones((2, 2)))),
+])
+def test_decode_dtype(content_type, payload):
+    assert decoder.decode(payload, content_type, np.float32).dtype == np.float32
+
+
+def test_npy_to_numpy_matching_dtype_is_not_copied():
+    payload = _npy(np.ones((2, 2), dtype=np.float32))
+    actual = decoder._npy_to_numpy(payload, np.float32)
+
+    assert np.shares_memory(actual, np.frombuffer(payload, dtype=np.uint8))
+
+
+@pytest.mark.parametrize('json_data, expected', [
+    ('[42, 6, 9]', np.array([42, 6, 9])),
+    ('[[1, 2.5], [3, 4]]', np.array([[1, 2.5], [3, 4]])),
+    ('[[1, 2, 3]]', np.array([[1, 2, 3]])),
+    ('[[1], [2]]', np.array([[1], [2]])),
+    (' [ [1e3 , -2] ,\n [3, 4] ] ', np.array([[1e3, -2], [3, 4]])),
+    ('{"instances": [[1, 2], [3, 4]]}', np.array([[1, 2], [3, 4]])),
+    ('{ "instances" : [1, 2] }', np.array([1, 2])),
+    (b'[[1, 2], [3, 4]]', np.array([[1, 2], [3, 4]])),
+])
+def test_parse_numeric_json(json_data, expected):
+    actual = decoder._parse_numeric_json(json_data, np.float32)
+
+    assert actual.dtype == np.float32
+    assert actual.shape == expected.shape
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize('json_data', [
+    '42',
+    '[]',
+    '[[1, 2], [3]]',
+    '[[[1, 2]]]',
+    '[[]]',
+    '[[1], []]',
+    '[[1, 2], [ ]]',
+    '[[], [1, 2]]',
+    '["42", "6"]',
+    '[1, null]',
+    '[NaN, 1]',
+    '{"instances": [[1, 2]], "other": 1}',
+    '{"in stances": [1, 2]}',
+    '{"data": [1, 2]}',
+])
+def test_parse_numeric_json_falls_back(json_data):
+    assert decoder._parse_numeric_json(json_data, np.float32) is None
+
+
+@pytest.mark.parametrize('json_data, expected', [
+    ('[0, -0.5, 0.25, 0e3, 10, -10, 1E+2, 1e-05, 2.5E-3]',
+     np.array([0, -0.5, 0.25, 0, 10, -10, 100, 1e-5, 2.5e-3], dtype=np.float32)),
+    ('[ [1 ,2 ] ,[ 3\t,4]\r\n]', np.array([[1, 2], [3, 4]])),
+])
+def test_parse_numeric_json_accepts_json_numbers(json_data, expected):
+    np.testing.assert_array_equal(decoder._parse_numeric_json(json_data, np.float32), expected)
+
+
+@pytest.mark.parametrize('json_data', [
+    '[[1 2, 3], [4, 5, 6]]',
+    '[1 2]',
+    '[1, - 2]',
+    '[1.5 e3]',
+    '[+1]',
+    '[.5]',
+    '[1.]',
+    '[01]',
+    '[-01]',
+    '[00]',
+    '[1e]',
+    '[1e+]',
+    '[1-2]',
+    '[1e5.5]',
+    '[1.2.3]',
+    '[1,,2]',
+    '[-]',
+])
+def test_parse_numeric_json_rejects_invalid_json(json_data):
+    assert decoder._parse_numeric_json(json_data, np.float32) is None
+    with pytest.raises(ValueError):
+        json.loads(json_data)
+
+
+@pytest.mark.parametrize('payload', [
+    '1,2\n3,4\n5,6\n7,8\n',
+    '1,2\r\n3,4\r\n5,6\r\n',
+    b'1.5,2\n3,4.25\n5,6',
+])
+def test_parse_numeric_csv_in_chunks(payload, monkeypatch):
+    monkeypatch.setattr(decoder, '_CHUNK_BYTES', 4)
+
+    expected = _genfromtxt(payload.decode('utf-8') if isinstance(payload, bytes) else payload)
+    np.testing.assert_array_equal(decoder._parse_numeric_csv(payload), expected)
+
+
+@pytest.mark.parametrize('payload', ['1,2\n3,4\n5,6,7\n', '1,2\n3,4\n\n5,6', '1,2\n3,a\n'])
+def test_parse_numeric_csv_in_chunks_falls_back(payload, monkeypatch):
+    monkeypatch.setattr(decoder, '_CHUNK_BYTES', 4)
+
+    assert decoder._parse_numeric_csv(payload) is None
+
+
+@pytest.mark.parametrize('json_data, expected', [
+    ('[1, 2, 3, 4, 5, 6, 7]', np.array([1, 2, 3, 4, 5, 6, 7])),
+    ('[[1, 2], [3, 4], [5, 6], [7, 8]]', np.array([[1, 2], [3, 4], [5, 6], [7, 8]])),
+    ('[[1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12]]', np.arange(1, 13).reshape(2, 6)),
+    ('{"instances": [[1, 2], [3, 4]]} ', np.array([[1, 2], [3, 4]])),
+])
+def test_parse_numeric_json_in_chunks(json_data, expected, monkeypatch):
+    monkeypatch.setattr(decoder, '_CHUNK_BYTES', 4)
+
+    actual = decoder._parse_numeric_json(json_data, np.float32)
+
+    assert actual.shape == expected.shape
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize('json_data', ['[1, 2, 3, 01]', '[[1, 2], [3, 4], [5]]', '[[1, 2], [3, 4], []]', '[1, 2, 3,]'])
+def test_parse_numeric_json_in_chunks_falls_back(json_data, monkeypatch):
+    monkeypatch.setattr(decoder, '_CHUNK_BYTES', 4)
+
+    assert decoder._parse_numeric_json(json_data, np.float32) is None
+
+
+def test_json_to_numpy_rejects_whitespace_inside_large_payloads():
+    json_data = '[[1 2, 3], ' + ', '.join(['[4, 5, 6]'] * 10000) + ']'
+
+    assert len(json_data) >= decoder._BULK_JSON_MIN_BYTES
+    with pytest.raises(ValueError):
+        decoder._json_to_numpy(json_data, np.float32)
+
+
+@pytest.mark.parametrize('json_data, expected', [
+    ('["42", "6"]', np.array([42, 6])),
+    ('[NaN, 1]', np.array([np.nan, 1])),
+    ('{"instances": [[1, 2]], "other": 1}', np.array([[1, 2]])),
+])
+def test_json_to_numpy_fallback(json_data, expected):
+    np.testing.assert_array_equal(decoder._json_to_numpy(json_data, np.float32), expected)
+
+
+def test_json_to_numpy_without_dtype_keeps_json_types():
+    assert decoder._json_to_numpy('[1, 2]').dtype == np.array([1, 2]).dtype
+
+
+def test_json_to_numpy_uses_bulk_parser_for_large_payloads():
+    rows = np.arange(30000, dtype=np.float32).reshape(-1, 3)
+    json_data = json.dumps(rows.tolist())
+
+    assert len(json_data) >= decoder._BULK_JSON_MIN_BYTES
+    with patch.object(decoder, 'json') as mock_json:
+        actual = decoder._json_to_numpy(json_data, np.float32)
+
+    mock_json.loads.assert_not_called()
+    np.testing.assert_array_equal(actual, rows)
+
+
+def _arrow_stream(table):
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def test_arrow_stream_to_numpy():
+    table = pa.table({'a': [1, 2, 3], 'b': [0.5, None, 2.5], 'c': [True, False, True]})
+    actual = decoder.decode(_arrow_stream(table), sklearn_content_types.ARROW_STREAM, np.float32)
+
+    assert actual.dtype == np.float32
+    assert actual.flags.c_contiguous
+    np.testing.assert_array_equal(actual, [[1, 0.5, 1], [2, np.nan, 0], [3, 2.5, 1]])
+
+
+def test_arrow_stream_to_numpy_infers_dtype():
+    table = pa.table({'a': np.arange(3, dtype=np.int32), 'b': np.arange(3, dtype=np.float32)})
+    assert decoder.decode(_arrow_stream(table), sklearn_content_types.ARROW_STREAM).dtype == np.float64
+
+
+def test_arrow_stream_to_numpy_single_column_is_zero_copy():
+    payload = _arrow_stream(pa.table({'a': np.arange(100, dtype=np.float32)}))
+    actual = decoder.decode(payload, sklearn_content_types.ARROW_STREAM, np.float32)
+
+    assert actual.shape == (100, 1)
+    assert np.shares_memory(actual, np.frombuffer(payload, dtype=np.uint8))
+
+
+def test_arrow_stream_to_numpy_fixed_size_list_is_zero_copy():
+    values = pa.array(np.arange(12, dtype=np.float32))
+    payload = _arrow_stream(pa.table({'features': pa.FixedSizeListArray.from_arrays(values, 4)}))
+    actual = decoder.decode(payload, sklearn_content_types.ARROW_STREAM, np.float32)
+
+    np.testing.assert_array_equal(actual, np.arange(12).reshape(3, 4))
+    assert np.shares_memory(actual, np.frombuffer(payload, dtype=np.uint8))
+
+
+def test_arrow_stream_to_numpy_rejects_non_numeric_columns():
+    with pytest.raises(ValueError):
+        decoder.decode(_arrow_stream(pa.table({'a': ['x', 'y']})), sklearn_content_types.ARROW_STREAM)
+
+
+def test_parquet_to_numpy():
+    with open(PARQUET_FIXTURE, 'rb') as f:
+        actual = decoder.decode(f.read(), sklearn_content_types.PARQUET, np.float32)
+
+    np.testing.assert_array_equal(actual, np.array([[1], [2]], dtype=np.float32))
+
+
+def _npz(matrix):
+    buffer = BytesIO()
+    scipy.sparse.save_npz(buffer, matrix)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('matrix', [
+    scipy.sparse.random(10, 100000, density=1e-4, format='csr', random_state=0),
+    scipy.sparse.random(10, 100000, density=1e-4, format='csc', random_state=0),
+])
+def test_npz_to_sparse(matrix):
+    actual = decoder.decode(_npz(matrix), sklearn_content_types.NPZ)
+
+    assert scipy.sparse.isspmatrix_csr(actual)
+    assert actual.shape == matrix.shape
+    assert (actual != matrix).nnz == 0
+
+
+def test_npz_to_sparse_dtype():
+    matrix = scipy.sparse.random(2, 5, density=0.5, format='csr', random_state=0)
+    assert decoder.decode(_npz(matrix), sklearn_content_types.NPZ, np.float32).dtype == np.float32
@@ -0,0 +1,108 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import json
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from sagemaker_containers.beta.framework import encoders
+from sagemaker_inference import content_types as inference_content_types, encoder as inference_encoder
+
+from sagemaker_sklearn_container import content_types, encoder
+
+_rng = np.random.RandomState(0)
+_values = _rng.randn(50, 4) * 10.0 ** _rng.randint(-20, 20, size=(50, 4))
+
+ARRAYS = [
+    np.ones((2, 2)),
+    np.array([0.0, -0.0, 0.1, 1e16, 1e-5, 123456789.125]),
+    _values,
+    _values.astype(np.float32),
+    np.asfortranarray(_values),
+    _values[:, 1],
+    np.arange(-5, 5),
+    np.arange(12, dtype=np.uint8).reshape(3, 4),
+    np.array([[1, 2, 3]]),
+]
+
+
+@pytest.mark.parametrize('array', ARRAYS)
+def test_array_to_csv_matches_default_encoders(array):
+    actual = encoder.encode(array, inference_content_types.CSV)
+
+    assert actual == encoders.array_to_csv(array)
+    assert actual == inference_encoder._array_to_csv(array)
+
+
+@pytest.mark.parametrize('array', ARRAYS + [np.array([np.nan, np.inf])])
+def test_array_to_csv_with_non_finite_values(array):
+    assert encoder.encode(array, inference_content_types.CSV) == encoders.array_to_csv(array)
+
+
+@pytest.mark.parametrize('array', ARRAYS)
+def test_json_is_left_to_default_encoders(array):
+    assert encoder.encode(array, inference_content_types.JSON) is None
+
+
+@pytest.mark.parametrize('array', ARRAYS)
+def test_array_to_jsonlines(array):
+    lines = encoder.encode(array, content_types.JSONLINES).splitlines()
+
+    assert [json.loads(line) for line in lines] == array.tolist()
+    assert lines == [json.dumps(row) for row in array.tolist()]
+
+
+@pytest.mark.parametrize('array_like', [
+    np.array(['a', 'b']),
+    np.array([True, False]),
+    np.array(1.0),
+    np.zeros((0, 2)),
+    [1.0, 2.0],
+])
+def test_encode_falls_back_for_unsupported_arrays(array_like):
+    assert encoder.encode(array_like, inference_content_types.CSV) is None
+
+
+def test_encode_falls_back_for_other_content_types():
+    assert encoder.encode(np.ones(2), inference_content_types.NPY) is None
+    assert encoder.encode(np.ones(2), 'application/not_supported') is None
+
+
+def test_array_to_jsonlines_fallback():
+    assert encoder.encode(np.array(['a', 'b']), content_types.JSONLINES) == '"a"\n"b"\n'
+    assert encoder.encode([[1, 2], [3, 4]], content_types.JSONLINES) == '[1, 2]\n[3, 4]\n'
+
+
+@pytest.mark.parametrize('content_type', [content_types.ARROW_STREAM, content_types.PARQUET])
+@pytest.mark.parametrize('array', [np.arange(6.0).reshape(3, 2), np.arange(3), np.array(['a', 'b'])])
+def test_array_to_arrow_round_trip(content_type, array):
+    table = _read_table(encoder.encode(array, content_type), content_type)
+
+    assert table.column_names == [str(i) for i in range(array.reshape(len(array), -1).shape[1])]
+    np.testing.assert_array_equal(np.column_stack([column.to_numpy() for column in table.columns]),
+                                  array.reshape(len(array), -1))
+
+
+def test_array_to_arrow_rejects_3d_arrays():
+    with pytest.raises(ValueError):
+        encoder.encode(np.ones((2, 2, 2)), content_types.ARROW_STREAM)
+
+
+def _read_table(data, content_type):
+    if content_type == content_types.PARQUET:
+        return pq.read_table(pa.BufferReader(data))
+    return pa.ipc.open_stream(data).read_all()
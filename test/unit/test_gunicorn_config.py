@@ -0,0 +1,92 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+import os
+
+from gunicorn.config import Config
+from mock import call, MagicMock, patch
+
+from sagemaker_sklearn_container import gunicorn_config
+
+
+@patch.dict(os.environ, {'SAGEMAKER_PRELOAD_MODEL': 'true'})
+@patch('sagemaker_sklearn_container.serving.load_app')
+@patch('sagemaker_sklearn_container.gunicorn_config.gc')
+def test_on_starting_loads_model_then_freezes(gc, load_app):
+    manager = MagicMock()
+    manager.attach_mock(gc, 'gc')
+    manager.attach_mock(load_app, 'load_app')
+
+    gunicorn_config.on_starting(MagicMock())
+
+    assert manager.mock_calls == [call.gc.disable(), call.load_app(), call.gc.freeze()]
+
+
+@patch.dict(os.environ, {'SAGEMAKER_PRELOAD_MODEL': 'true', 'SAGEMAKER_CPU_AFFINITY': 'true'})
+@patch('sagemaker_sklearn_container.serving.load_app')
+@patch('sagemaker_sklearn_container.gunicorn_config.gc')
+def test_on_starting_warns_preload_with_cpu_affinity(gc, load_app):
+    server = MagicMock()
+
+    gunicorn_config.on_starting(server)
+
+    server.log.warning.assert_called_once()
+    load_app.assert_called_once()
+
+
+@patch.dict(os.environ, {'SAGEMAKER_PRELOAD_MODEL': 'true', 'SAGEMAKER_CPU_AFFINITY': 'false'})
+@patch('sagemaker_sklearn_container.serving.load_app')
+@patch('sagemaker_sklearn_container.gunicorn_config.gc')
+def test_on_starting_preload_without_cpu_affinity_does_not_warn(gc, load_app):
+    server = MagicMock()
+
+    gunicorn_config.on_starting(server)
+
+    server.log.warning.assert_not_called()
+
+
+@patch.dict(os.environ, {'SAGEMAKER_PRELOAD_MODEL': 'false'})
+@patch('sagemaker_sklearn_container.serving.load_app')
+def test_on_starting_without_preload(load_app):
+    gunicorn_config.on_starting(MagicMock())
+    load_app.assert_not_called()
+
+
+@patch.dict(os.environ, {'SAGEMAKER_CPU_AFFINITY': 'false'})
+@patch('sagemaker_sklearn_container.cpu_affinity.pin_worker')
+@patch('sagemaker_sklearn_container.gunicorn_config.gc')
+def test_post_fork_enables_gc(gc, pin_worker):
+    gunicorn_config.post_fork(MagicMock(), MagicMock())
+    gc.enable.assert_called_once()
+    pin_worker.assert_not_called()
+
+
+@patch.dict(os.environ, {'SAGEMAKER_CPU_AFFINITY': 'true'})
+@patch('sagemaker_sklearn_container.cpu_affinity.pin_worker')
+@patch('sagemaker_sklearn_container.gunicorn_config.gc')
+def test_post_fork_pins_worker(gc, pin_worker):
+    gunicorn_config.post_fork(MagicMock(), MagicMock())
+    pin_worker.assert_called_once()
+
+
+@patch.dict(os.environ, {'SAGEMAKER_PRELOAD_MODEL': 'false', 'SAGEMAKER_KEEP_ALIVE_TIMEOUT': '75',
+                         'SAGEMAKER_WORKER_CONNECTIONS': '100', 'SAGEMAKER_LISTEN_BACKLOG': ''})
+def test_on_starting_applies_connection_settings():
+    server = MagicMock(cfg=Config())
+    server.cfg.set('worker_connections', 4000)
+
+    gunicorn_config.on_starting(server)
+
+    assert server.cfg.keepalive == 75
+    assert server.cfg.worker_connections == 100
+    assert server.cfg.backlog == Config().backlog
@@ -11,8 +11,9 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
+import os
 
-from mock import patch
+from mock import MagicMock, patch
 import numpy as np
 import pytest
 
@@ -44,7 +45,8 @@ class FakeEstimator(BaseEstimator):
         ('[42, 6, 9]', np.array([[42, 6, 9]])),
         ('[42.0, 6.0, 9.0]', np.array([[42., 6., 9.]])),
         ('["42", "6", "9"]', np.array([['42', '6', '9']], dtype=np.float32)),
-        (u'["42", "6", "9"]', np.array([[u'42', u'6', u'9']], dtype=np.float32))])
+        (u'["42", "6", "9"]', np.array([[u'42', u'6', u'9']], dtype=np.float32)),
+        ('{"instances": [42, 6, 9]}', np.array([[42, 6, 9]], dtype=np.float32))])
 def test_input_fn_json(json_data, expected):
     actual = handler.default_input_fn(json_data, content_types.JSON)
     np.testing.assert_equal(actual, expected)
@@ -82,6 +84,14 @@ def test_input_fn_npz(np_array, expected):
     assert np.array_equal(expected, deserialized_np_array)
 
 
+def test_input_fn_npy_does_not_copy():
+    input_data = bytearray(encoder._array_to_npy(np.ones(10)))
+    deserialized_np_array = handler.default_input_fn(input_data, content_types.NPY)
+
+    assert deserialized_np_array.shape == (1, 10)
+    assert np.shares_memory(deserialized_np_array, np.frombuffer(input_data, dtype=np.uint8))
+
+
 def test_input_fn_bad_content_type():
     with pytest.raises(errors.UnsupportedFormatError):
         handler.default_input_fn('', 'application/not_supported')
@@ -109,6 +119,11 @@ def test_output_fn_csv(np_array):
     assert response == ('1.0,1.0\n1.0,1.0\n', content_types.CSV)
 
 
+def test_output_fn_jsonlines(np_array):
+    response = handler.default_output_fn(np_array, 'application/jsonlines')
+    assert response == ('[1.0, 1.0]\n[1.0, 1.0]\n', 'application/jsonlines')
+
+
 def test_output_fn_npz(np_array):
     response = handler.default_output_fn(np_array, content_types.NPY)
     assert response == (encoder._array_to_npy(np_array), content_types.NPY)
@@ -117,3 +132,16 @@ def test_output_fn_npz(np_array):
 def test_input_fn_bad_accept():
     with pytest.raises(errors.UnsupportedFormatError):
         handler.default_output_fn('', 'application/not_supported')
+
+
+@patch.dict(os.environ, {'SAGEMAKER_CPU_AFFINITY': 'true'})
+@patch('sagemaker_inference.default_handler_service.DefaultHandlerService.initialize')
+@patch('sagemaker_sklearn_container.cpu_affinity.pin_worker')
+def test_initialize_pins_worker_before_loading_model(pin_worker, initialize):
+    pin_worker.side_effect = lambda: initialize.assert_not_called()
+    context = MagicMock()
+
+    HandlerService().initialize(context)
+
+    pin_worker.assert_called_once()
+    initialize.assert_called_once_with(context)
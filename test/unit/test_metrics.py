@@ -0,0 +1,94 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import json
+
+from mock import patch
+import numpy as np
+import pytest
+
+from sagemaker_sklearn_container import metrics
+from sagemaker_sklearn_container.metrics import Histogram, PayloadSizeStats, StageStats
+
+
+@pytest.mark.parametrize('num_bytes, bucket', [(0, 1), (1, 1), (2, 2), (3, 4), (1024, 1024), (1025, 2048)])
+def test_bucket(num_bytes, bucket):
+    assert metrics.bucket(num_bytes) == bucket
+
+
+@patch('sagemaker_sklearn_container.metrics.logger')
+def test_payload_size_stats(logger):
+    payload_sizes = PayloadSizeStats()
+    for num_bytes in (100, 120, 3000, 10):
+        payload_sizes.record(num_bytes)
+
+    assert payload_sizes.stats() == {'count': 4, 'total': 3230, 'max': 3000, 'histogram': {128: 2, 4096: 1, 16: 1}}
+    assert logger.info.call_count == 2
+
+
+def test_histogram():
+    histogram = Histogram()
+    for value in (3, 4, 5, 0):
+        histogram.record(value)
+
+    assert histogram.stats() == {'count': 4, 'total': 12, 'max': 5, 'histogram': {4: 2, 8: 1, 1: 1}}
+
+
+def test_stage_stats_timed():
+    stage_stats = StageStats(log_interval=0)
+
+    def input_fn(input_data, content_type):
+        return np.ones((3, 2))
+
+    timed_input_fn = stage_stats.timed(metrics.INPUT_FN, input_fn)
+    timed_output_fn = stage_stats.timed(metrics.OUTPUT_FN, lambda prediction, accept: (b'1\n1\n1\n', accept))
+
+    assert timed_input_fn.__wrapped__ is input_fn
+    assert timed_input_fn('1,1\n1,1\n1,1', 'text/csv').shape == (3, 2)
+    timed_output_fn(None, 'text/csv')
+
+    stats = stage_stats.stats()
+    assert set(stats['latency_us']) == {metrics.INPUT_FN, metrics.OUTPUT_FN}
+    assert stats['latency_us'][metrics.INPUT_FN]['count'] == 1
+    assert stats['request_bytes']['total'] == 11
+    assert stats['rows']['total'] == 3
+    assert stats['response_bytes']['total'] == 6
+
+
+def test_stage_stats_transform_fn():
+    stage_stats = StageStats(log_interval=0)
+    transform_fn = stage_stats.timed(metrics.TRANSFORM_FN, lambda model, data, content_type, accept: b'12')
+
+    transform_fn(None, b'1,2,3', 'text/csv', 'text/csv')
+
+    assert stage_stats.stats()['request_bytes']['total'] == 5
+    assert stage_stats.stats()['response_bytes']['total'] == 2
+
+
+@patch('sagemaker_sklearn_container.metrics.logger')
+def test_stage_stats_logs_json_line(logger):
+    stage_stats = StageStats(log_interval=1e-9)
+    stage_stats.timed(metrics.OUTPUT_FN, lambda prediction, accept: b'1')(None, 'text/csv')
+
+    message = logger.info.call_args[0][0]
+    assert message.startswith('stage metrics: ')
+    assert json.loads(message[len('stage metrics: '):])['response_bytes']['count'] == 1
+
+
+@patch('sagemaker_sklearn_container.metrics.logger')
+def test_stage_stats_log_disabled(logger):
+    stage_stats = StageStats(log_interval=0)
+    stage_stats.timed(metrics.OUTPUT_FN, lambda prediction, accept: b'1')(None, 'text/csv')
+
+    logger.info.assert_not_called()
@@ -0,0 +1,113 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import os
+import time
+
+import joblib
+from mock import patch
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from sagemaker_sklearn_container import mms_tuning
+
+GB = 1024 ** 3
+MB = 1024 ** 2
+
+
+def _profile(worker_bytes=100 * MB, request_latency_s=0.01):
+    return {'worker_bytes': worker_bytes, 'request_latency_s': request_latency_s}
+
+
+def test_max_heap_size_mb():
+    assert mms_tuning.max_heap_size_mb(4, 8, 6 * MB) == 215
+
+
+def test_tune_one_worker_per_core():
+    tuned = mms_tuning.tune(_profile(), cpu_count=4, host_memory=16 * GB, max_content_length=6 * MB)
+
+    assert tuned['workers'] == 4
+    assert tuned['job_queue_size'] == 400
+    assert tuned['max_heap_size_mb'] == mms_tuning.max_heap_size_mb(4, 400, 6 * MB)
+
+
+def test_tune_fits_workers_in_memory():
+    tuned = mms_tuning.tune(_profile(worker_bytes=2 * GB), cpu_count=8, host_memory=8 * GB,
+                            max_content_length=6 * MB)
+
+    assert tuned['workers'] == 3
+    assert 3 * 2 * GB + tuned['max_heap_size_mb'] * MB <= 8 * GB * mms_tuning.MEMORY_FRACTION
+
+
+def test_tune_shares_cores_and_memory_across_models():
+    tuned = mms_tuning.tune(_profile(worker_bytes=GB), cpu_count=8, host_memory=16 * GB, max_content_length=6 * MB,
+                            num_models=2)
+
+    assert tuned['workers'] == 4
+    assert tuned['max_heap_size_mb'] == mms_tuning.max_heap_size_mb(8, 2 * tuned['job_queue_size'], 6 * MB)
+    assert 8 * GB + tuned['max_heap_size_mb'] * MB <= 16 * GB * mms_tuning.MEMORY_FRACTION
+
+
+def test_tune_keeps_one_worker_per_model():
+    tuned = mms_tuning.tune(_profile(worker_bytes=GB), cpu_count=4, host_memory=8 * GB, max_content_length=6 * MB,
+                            num_models=16)
+
+    assert tuned['workers'] == 1
+    assert tuned['job_queue_size'] == 1
+
+
+def test_tune_caps_job_queue_size():
+    tuned = mms_tuning.tune(_profile(request_latency_s=1e-5), cpu_count=4, host_memory=64 * GB,
+                            max_content_length=MB)
+
+    assert tuned['job_queue_size'] == mms_tuning.MAX_JOB_QUEUE_SIZE
+
+
+def test_tune_without_latency():
+    tuned = mms_tuning.tune(_profile(request_latency_s=None), cpu_count=2, host_memory=16 * GB,
+                            max_content_length=6 * MB)
+
+    assert tuned['job_queue_size'] == 4
+
+
+def test_profile_model(tmpdir):
+    x = np.random.RandomState(0).rand(10, 3)
+    joblib.dump(LinearRegression().fit(x, x.sum(axis=1)), os.path.join(str(tmpdir), 'model.joblib'))
+
+    profile = mms_tuning.profile_model(str(tmpdir))
+
+    assert profile['worker_bytes'] > 0
+    assert profile['request_latency_s'] > 0
+
+
+def test_profile_model_without_artifact(tmpdir):
+    assert mms_tuning.profile_model(str(tmpdir)) is None
+
+
+def _exit(model_dir, results):
+    os._exit(1)
+
+
+def _hang(model_dir, results):
+    time.sleep(60)
+
+
+@pytest.mark.parametrize('profile', [_exit, _hang])
+def test_profile_model_without_answer(tmpdir, profile):
+    with patch.object(mms_tuning, '_profile', profile), patch.object(mms_tuning, 'PROFILE_POLL_INTERVAL_S', 0.1):
+        start = time.monotonic()
+        assert mms_tuning.profile_model(str(tmpdir), timeout=1) is None
+
+    assert time.monotonic() - start < 10
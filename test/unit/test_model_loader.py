@@ -0,0 +1,172 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import os
+import pickle
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from sagemaker_sklearn_container import model_loader, serving
+from sagemaker_sklearn_container.handler_service import HandlerService
+
+
+@pytest.fixture(name='model')
+def fixture_model():
+    x = np.random.RandomState(0).rand(100, 10)
+    return LinearRegression().fit(x, x.sum(axis=1))
+
+
+def _touch(path):
+    open(path, 'w').close()
+
+
+def test_find_model_file_prefers_model_joblib(tmpdir):
+    _touch(os.path.join(str(tmpdir), 'other.pkl'))
+    _touch(os.path.join(str(tmpdir), 'model.joblib'))
+
+    assert model_loader.find_model_file(str(tmpdir)) == os.path.join(str(tmpdir), 'model.joblib')
+
+
+def test_find_model_file_single_artifact(tmpdir):
+    _touch(os.path.join(str(tmpdir), 'code.py'))
+    _touch(os.path.join(str(tmpdir), 'sklearn-model.pkl'))
+
+    assert model_loader.find_model_file(str(tmpdir)) == os.path.join(str(tmpdir), 'sklearn-model.pkl')
+
+
+@pytest.mark.parametrize('filenames', [[], ['a.pkl', 'b.joblib'], ['sklearn-model']])
+def test_find_model_file_not_found(tmpdir, filenames):
+    for filename in filenames:
+        _touch(os.path.join(str(tmpdir), filename))
+
+    assert model_loader.find_model_file(str(tmpdir)) is None
+
+
+def test_find_model_file_missing_dir():
+    assert model_loader.find_model_file('model_dir') is None
+
+
+def test_load_model_memory_maps_arrays(tmpdir, model):
+    model_file = os.path.join(str(tmpdir), 'model.joblib')
+    joblib.dump(model, model_file)
+
+    loaded = model_loader.load_model(model_file)
+
+    assert isinstance(loaded.coef_, np.memmap)
+    assert not loaded.coef_.flags.writeable
+    np.testing.assert_array_equal(loaded.coef_, model.coef_)
+
+
+def test_load_model_pickle(tmpdir, model):
+    model_file = os.path.join(str(tmpdir), 'model.pkl')
+    with open(model_file, 'wb') as f:
+        pickle.dump(model, f)
+
+    np.testing.assert_array_equal(model_loader.load_model(model_file).coef_, model.coef_)
+
+
+@pytest.mark.parametrize('model_fn', [serving.default_model_fn,
+                                      HandlerService.DefaultSKLearnUserModuleInferenceHandler.default_model_fn])
+def test_default_model_fn_reads_arrays_into_memory_with_cpu_affinity(tmpdir, model, model_fn, monkeypatch):
+    joblib.dump(model, os.path.join(str(tmpdir), 'model.joblib'))
+    monkeypatch.setenv('SAGEMAKER_CPU_AFFINITY', 'true')
+
+    loaded = model_fn(str(tmpdir))
+
+    assert not isinstance(loaded.coef_, np.memmap)
+    np.testing.assert_array_equal(loaded.coef_, model.coef_)
+
+
+@pytest.mark.parametrize('model_fn', [serving.default_model_fn,
+                                      HandlerService.DefaultSKLearnUserModuleInferenceHandler.default_model_fn])
+def test_default_model_fn_loads_joblib_artifact(tmpdir, model, model_fn):
+    joblib.dump(model, os.path.join(str(tmpdir), 'model.joblib'))
+    x = np.ones((2, 10))
+
+    np.testing.assert_array_equal(model_fn(str(tmpdir)).predict(x), model.predict(x))
+
+
+def test_cache_model_file_converts_compressed_artifact(tmpdir, model):
+    model_file = os.path.join(str(tmpdir), 'model.joblib')
+    joblib.dump(model, model_file, compress=3)
+    cache_dir = os.path.join(str(tmpdir), 'cache')
+
+    cached_file = model_loader.cache_model_file(model_file, cache_dir)
+
+    assert os.path.dirname(cached_file) == cache_dir
+    assert isinstance(joblib.load(cached_file, mmap_mode='r').coef_, np.memmap)
+    assert model_loader.cache_model_file(model_file, cache_dir) == cached_file
+
+
+def test_cache_model_file_is_keyed_by_content(tmpdir, model):
+    cache_dir = os.path.join(str(tmpdir), 'cache')
+    cached_files = []
+    for name in ('a.pkl', 'b.pkl'):
+        model_file = os.path.join(str(tmpdir), name)
+        with open(model_file, 'wb') as f:
+            pickle.dump(model, f)
+        cached_files.append(model_loader.cache_model_file(model_file, cache_dir))
+
+    assert cached_files[0] == cached_files[1]
+    assert len([name for name in os.listdir(cache_dir) if name.endswith('.joblib')]) == 1
+
+
+def test_load_model_from_artifact_cache(tmpdir, model, monkeypatch):
+    model_file = os.path.join(str(tmpdir), 'model.pkl')
+    with open(model_file, 'wb') as f:
+        pickle.dump(model, f)
+    monkeypatch.setenv(model_loader.MODEL_ARTIFACT_CACHE_ENV, os.path.join(str(tmpdir), 'cache'))
+
+    loaded = model_loader.load_model(model_file)
+
+    assert isinstance(loaded.coef_, np.memmap)
+    np.testing.assert_array_equal(loaded.coef_, model.coef_)
+
+
+def test_cache_model_file_evicts_least_recently_used(tmpdir, model):
+    cache_dir = os.path.join(str(tmpdir), 'cache')
+    model_files = []
+    for i in range(3):
+        model.coef_ = np.full(10, float(i))
+        model_files.append(os.path.join(str(tmpdir), '{}.pkl'.format(i)))
+        with open(model_files[-1], 'wb') as f:
+            pickle.dump(model, f)
+
+    first = model_loader.cache_model_file(model_files[0], cache_dir)
+    os.utime(first, (0, 0))
+    max_bytes = 2 * os.path.getsize(first)
+    second = model_loader.cache_model_file(model_files[1], cache_dir, max_bytes)
+    os.utime(second, (1, 1))
+    # A hit marks the first artifact as the most recently used one
+    assert model_loader.cache_model_file(model_files[0], cache_dir, max_bytes) == first
+    third = model_loader.cache_model_file(model_files[2], cache_dir, max_bytes)
+
+    assert sorted(name for name in os.listdir(cache_dir) if name.endswith('.joblib')) == sorted(
+        [os.path.basename(first), os.path.basename(third)])
+    assert len([name for name in os.listdir(cache_dir) if name.endswith('.sha256')]) == 2
+    assert not os.path.exists(second)
+
+
+def test_load_model_without_artifact_cache_by_default(tmpdir, model, monkeypatch):
+    model_file = os.path.join(str(tmpdir), 'model.joblib')
+    joblib.dump(model, model_file, compress=3)
+    monkeypatch.delenv(model_loader.MODEL_ARTIFACT_CACHE_ENV, raising=False)
+
+    loaded = model_loader.load_model(model_file)
+
+    assert os.listdir(str(tmpdir)) == ['model.joblib']
+    np.testing.assert_array_equal(loaded.coef_, model.coef_)
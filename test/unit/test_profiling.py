@@ -0,0 +1,116 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+from sagemaker_sklearn_container import metrics, profiling
+from sagemaker_sklearn_container.metrics import StageStats
+
+
+@pytest.fixture(autouse=True, name='profile_dir')
+def fixture_profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(profiling, '_env_checked', False)
+    yield tmp_path
+    profiling.stop()
+
+
+def busy_predict_fn(input_data, model):
+    end = time.process_time() + 0.3
+    while time.process_time() < end:
+        pass
+
+
+def test_profile_of_stage():
+    predict_fn = StageStats(log_interval=0).timed(metrics.PREDICT_FN, busy_predict_fn)
+
+    path = profiling.start(10, sample_rate=1000)
+    predict_fn(None, None)
+    assert profiling.stop() == path
+
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(' ', 1)
+        frames = stack.split(';')
+        assert frames[0] == 'predict_fn'
+        assert frames[1].startswith('busy_predict_fn (')
+        assert int(count) > 0
+    assert signal.getsignal(signal.SIGPROF) in (signal.SIG_DFL, None)
+
+
+def test_samples_outside_stages_are_dropped():
+    path = profiling.start(10, sample_rate=1000)
+    busy_predict_fn(None, None)
+    profiling.stop()
+
+    with open(path) as f:
+        assert f.read() == ''
+
+
+def test_samples_are_weighted_by_cpu_time(monkeypatch):
+    sampler = profiling.StackSampler(10, 100, None)
+    monkeypatch.setattr(signal, 'setitimer', lambda *args: None)
+    cpu_times = iter([1.0, 1.01, 1.51])
+    monkeypatch.setattr(time, 'process_time', lambda: next(cpu_times))
+    sampler.start()
+
+    def predict_fn(input_data, model):
+        sampler._sample(signal.SIGPROF, sys._getframe())
+
+    timed_predict_fn = StageStats(log_interval=0).timed(metrics.PREDICT_FN, predict_fn)
+    timed_predict_fn(None, None)
+    timed_predict_fn(None, None)
+    signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    # A signal delayed by a native call that ran for 50 intervals counts as 50 samples.
+    assert sampler.samples == 51
+    assert list(sampler.stacks.values()) == [51]
+
+
+def test_start_while_profiling():
+    assert profiling.start(10) is not None
+    assert profiling.start(10) is None
+
+
+def test_start_invalid_duration():
+    with pytest.raises(ValueError):
+        profiling.start(0)
+
+
+def test_profile_ends_after_its_duration():
+    path = profiling.start(0.01)
+    time.sleep(0.02)
+    profiling.on_request()
+
+    assert profiling._sampler is None
+    assert os.path.exists(path)
+
+
+def test_env_profile_is_taken_by_one_worker(profile_dir, monkeypatch):
+    monkeypatch.setenv(profiling.PROFILE_SECONDS_ENV, '10')
+
+    profiling.on_request()
+    assert profiling._sampler is not None
+    profiling.stop()
+
+    monkeypatch.setattr(profiling, '_env_checked', False)
+    profiling.on_request()
+    assert profiling._sampler is None
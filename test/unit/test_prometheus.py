@@ -0,0 +1,114 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import os
+
+from mock import patch
+import numpy as np
+import pytest
+
+from sagemaker_sklearn_container import metrics, prometheus
+from sagemaker_sklearn_container.metrics import RequestStats, StageStats
+
+
+@pytest.fixture(autouse=True, name='metrics_dir')
+def fixture_metrics_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(prometheus.METRICS_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(prometheus, '_last_write', None)
+    monkeypatch.setattr(metrics, 'request_stats', RequestStats())
+    monkeypatch.setattr(metrics, 'stage_stats', StageStats(log_interval=0))
+    return tmp_path
+
+
+def _samples(text, name):
+    return [line for line in text.splitlines() if line.startswith(prometheus.PREFIX + name)]
+
+
+def test_request_stats():
+    request_stats = RequestStats()
+    start = request_stats.start(2)
+    assert request_stats.in_flight == 2
+
+    request_stats.finish(start, 200, 2)
+    request_stats.finish(request_stats.start(), 415)
+
+    stats = request_stats.stats()
+    assert stats['in_flight'] == 0
+    assert stats['responses'] == {200: 2, 415: 1}
+    assert stats['latency_us']['count'] == 3
+
+
+def test_render_worker():
+    request_stats = metrics.request_stats
+    request_stats.finish(request_stats.start(), 200)
+    request_stats.start()
+    request_stats.model_load_seconds = 1.5
+    metrics.stage_stats.timed(metrics.INPUT_FN, lambda data, content_type: np.ones((2, 2)))(b'1,2\n3,4', 'text/csv')
+
+    text = prometheus.render_worker()
+    pid = 'pid="{}"'.format(os.getpid())
+
+    assert _samples(text, 'requests_total') == ['sagemaker_sklearn_requests_total{{{},code="200"}} 1'.format(pid)]
+    assert _samples(text, 'requests_in_flight') == ['sagemaker_sklearn_requests_in_flight{{{}}} 1'.format(pid)]
+    assert _samples(text, 'model_load_seconds') == ['sagemaker_sklearn_model_load_seconds{{{}}} 1.5'.format(pid)]
+    assert 'sagemaker_sklearn_request_duration_seconds_count{{{}}} 1'.format(pid) in text
+    assert 'sagemaker_sklearn_request_duration_seconds_bucket{{{},le="+Inf"}} 1'.format(pid) in text
+    assert 'sagemaker_sklearn_stage_duration_seconds_count{{{},stage="input_fn"}} 1'.format(pid) in text
+    assert 'sagemaker_sklearn_stage_bytes_total{{{},stage="input_fn"}} 7'.format(pid) in text
+    assert 'sagemaker_sklearn_rows_total{{{}}} 2'.format(pid) in text
+    assert _samples(text, 'worker_resident_memory_bytes')
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = metrics.Histogram()
+    for value in (3, 3, 100):
+        histogram.record(value)
+    family = prometheus._Family('test_seconds', 'histogram', 'Test.')
+    family.histogram([], histogram)
+
+    buckets = [line for line in family.lines if '_bucket' in line]
+    assert len(buckets) == len(prometheus.LATENCY_BUCKETS_US) + 1
+    assert 'sagemaker_sklearn_test_seconds_bucket{le="2e-06"} 0' in buckets
+    assert 'sagemaker_sklearn_test_seconds_bucket{le="4e-06"} 2' in buckets
+    assert 'sagemaker_sklearn_test_seconds_bucket{le="0.000128"} 3' in buckets
+    assert buckets[-1] == 'sagemaker_sklearn_test_seconds_bucket{le="+Inf"} 3'
+
+
+def test_collect_merges_live_workers(metrics_dir):
+    other_worker = ('# HELP sagemaker_sklearn_requests_total Requests answered, by status code.\n'
+                    '# TYPE sagemaker_sklearn_requests_total counter\n'
+                    'sagemaker_sklearn_requests_total{pid="1",code="200"} 7\n')
+    metrics_dir.joinpath('1.prom').write_text(other_worker)
+    metrics_dir.joinpath('999999999.prom').write_text(other_worker.replace('pid="1"', 'pid="999999999"'))
+    metrics.request_stats.finish(metrics.request_stats.start(), 200)
+
+    with patch('psutil.pid_exists', side_effect=lambda pid: pid in (1, os.getpid())):
+        text = prometheus.collect()
+
+    assert text.count('# TYPE sagemaker_sklearn_requests_total counter') == 1
+    assert 'sagemaker_sklearn_requests_total{pid="1",code="200"} 7' in text
+    assert 'sagemaker_sklearn_requests_total{{pid="{}",code="200"}} 1'.format(os.getpid()) in text
+    assert 'pid="999999999"' not in text
+
+
+def test_maybe_write_worker_file_is_throttled(metrics_dir, monkeypatch):
+    monkeypatch.setenv(prometheus.METRICS_FLUSH_INTERVAL_ENV, '60')
+    path = metrics_dir.joinpath('{}.prom'.format(os.getpid()))
+
+    prometheus.maybe_write_worker_file()
+    assert path.exists()
+    path.unlink()
+
+    prometheus.maybe_write_worker_file()
+    assert not path.exists()
@@ -16,12 +16,16 @@ from mock import patch, MagicMock
 import numpy as np
 import pytest
 import os
+import scipy.sparse
+from six import BytesIO
 
 from sklearn.base import BaseEstimator
+from werkzeug.exceptions import UnsupportedMediaType
 
-from sagemaker_containers.beta.framework import (content_types, encoders, errors)
-from sagemaker_sklearn_container import serving
+from sagemaker_containers.beta.framework import (content_types, encoders, errors, worker)
+from sagemaker_sklearn_container import encoder, serving
 from sagemaker_sklearn_container.exceptions import UserError
+from sagemaker_sklearn_container.metrics import RequestStats, StageStats
 from sagemaker_sklearn_container.serving import default_model_fn, import_module
 
 
@@ -56,7 +60,8 @@ class DummyUserModule:
         ('[42, 6, 9]', np.array([42, 6, 9])),
         ('[42.0, 6.0, 9.0]', np.array([42., 6., 9.])),
         ('["42", "6", "9"]', np.array(['42', '6', '9'], dtype=np.float32)),
-        (u'["42", "6", "9"]', np.array([u'42', u'6', u'9'], dtype=np.float32))])
+        (u'["42", "6", "9"]', np.array([u'42', u'6', u'9'], dtype=np.float32)),
+        ('{"instances": [[42, 6, 9]]}', np.array([[42, 6, 9]], dtype=np.float32))])
 def test_input_fn_json(json_data, expected):
     actual = serving.default_input_fn(json_data, content_types.JSON)
     np.testing.assert_equal(actual, expected)
@@ -92,6 +97,35 @@ def test_input_fn_npz(np_array):
     assert np.array_equal(float_64_array, deserialized_np_array)
 
 
+def test_input_fn_npy_does_not_copy():
+    input_data = encoders.array_to_npy(np.ones((2, 10)))
+    deserialized_np_array = serving.default_input_fn(input_data, content_types.NPY)
+
+    assert np.shares_memory(deserialized_np_array, np.frombuffer(input_data, dtype=np.uint8))
+
+
+def test_input_fn_arrow_stream():
+    arrow_stream = encoder.encode(np.array([[42, 6, 9]]), 'application/vnd.apache.arrow.stream')
+    deserialized_np_array = serving.default_input_fn(arrow_stream, 'application/vnd.apache.arrow.stream')
+
+    assert deserialized_np_array.dtype == np.float32
+    np.testing.assert_array_equal(deserialized_np_array, [[42, 6, 9]])
+
+
+def test_input_fn_and_predict_fn_sparse():
+    matrix = scipy.sparse.random(3, 1000, density=0.01, format='csr', random_state=0)
+    buffer = BytesIO()
+    scipy.sparse.save_npz(buffer, matrix)
+
+    deserialized = serving.default_input_fn(buffer.getvalue(), 'application/x-npz')
+    assert scipy.sparse.isspmatrix_csr(deserialized)
+
+    mock_estimator = FakeEstimator()
+    with patch.object(mock_estimator, 'predict') as mock:
+        serving.default_predict_fn(deserialized, mock_estimator)
+    mock.assert_called_once_with(deserialized)
+
+
 def test_input_fn_bad_content_type():
     with pytest.raises(errors.UnsupportedFormatError):
         serving.default_input_fn('', 'application/not_supported')
@@ -123,6 +157,13 @@ def test_output_fn_csv(np_array):
     assert content_types.CSV in response.content_type
 
 
+def test_output_fn_jsonlines(np_array):
+    response = serving.default_output_fn(np_array, 'application/jsonlines')
+
+    assert response.get_data(as_text=True) == '[1.0, 1.0]\n[1.0, 1.0]\n'
+    assert response.content_type == 'application/jsonlines'
+
+
 def test_output_fn_npz(np_array):
     response = serving.default_output_fn(np_array, content_types.NPY)
 
@@ -146,9 +187,27 @@ def test_user_module_transformer_with_transform_and_other_fn(mock_transformer):
 def test_user_module_transformer_with_transform_and_no_other_fn(mock_transformer):
     mock_module = MagicMock(spec=["model_fn", "transform_fn"])
     serving._user_module_transformer(mock_module)
-    mock_transformer.Transformer.assert_called_once_with(
-        model_fn=mock_module.model_fn, transform_fn=mock_module.transform_fn
-    )
+    mock_transformer.Transformer.assert_called_once()
+    kwargs = mock_transformer.Transformer.call_args[1]
+    assert kwargs['model_fn'] == mock_module.model_fn
+    assert kwargs['transform_fn'].__wrapped__ == mock_module.transform_fn
+
+
+@patch('sagemaker_sklearn_container.serving.metrics.stage_stats', new_callable=StageStats, log_interval=0)
+@patch('sagemaker_sklearn_container.serving.transformer')
+def test_user_module_transformer_records_stages(mock_transformer, stage_stats):
+    serving._user_module_transformer(MagicMock(spec=['model_fn']))
+    kwargs = mock_transformer.Transformer.call_args[1]
+
+    data = kwargs['input_fn']('1,2\n3,4', 'text/csv')
+    prediction = kwargs['predict_fn'](data, MagicMock(predict=lambda data: data[:, 0]))
+    kwargs['output_fn'](prediction, 'text/csv')
+
+    stats = stage_stats.stats()
+    assert set(stats['latency_us']) == {'input_fn', 'predict_fn', 'output_fn'}
+    assert stats['request_bytes']['total'] == 7
+    assert stats['rows']['total'] == 2
+    assert stats['response_bytes']['count'] == 1
 
 
 @patch('importlib.import_module')
@@ -159,15 +218,211 @@ def test_import_module_execution_parameters(importlib_module_mock):
     assert execution_parameters_fn == dummy_execution_parameters_fn
 
 
-@patch('sagemaker_sklearn_container.serving.server')
-def test_serving_entrypoint_start_gunicorn(mock_server):
-    mock_server.start = MagicMock()
+@patch('sagemaker_containers._modules.import_module')
+@patch('importlib.import_module', side_effect=ImportError())
+def test_import_module_installs_missing_module(importlib_module_mock, modules_import_module):
+    modules_import_module.return_value = DummyUserModule()
+    _, execution_parameters_fn = import_module('dummy_module', 'dummy_dir')
+
+    modules_import_module.assert_called_once_with('dummy_dir', 'dummy_module')
+    assert execution_parameters_fn == dummy_execution_parameters_fn
+
+
+@patch.dict(os.environ, {})
+@patch('sagemaker_sklearn_container.serving.startup.report')
+@patch('sagemaker_sklearn_container.serving.startup.phases', new_callable=dict)
+@patch('sagemaker_containers._modules.import_module')
+@patch('sagemaker_containers._server.start')
+def test_serving_entrypoint_reports_user_module_import(mock_start, modules_import_module, phases, report):
+    from sagemaker_containers import _modules as modules
+
+    mock_start.side_effect = lambda framework_module: modules.import_module('dummy_dir', 'dummy_module')
+
+    serving.serving_entrypoint()
+
+    modules_import_module.assert_called_once_with('dummy_dir', 'dummy_module')
+    assert set(phases) == {'user_module'}
+    report.assert_called_once()
+    assert modules.import_module is modules_import_module
+
+
+@pytest.fixture(name='nginx_config_template', autouse=True)
+def fixture_nginx_config_template(tmp_path, monkeypatch):
+    from sagemaker_containers import _server as server
+
+    monkeypatch.setattr(serving, 'NGINX_CONFIG_TEMPLATE_FILE', str(tmp_path / 'nginx.conf.template'))
+    monkeypatch.setattr(server, 'nginx_config_template_file', server.nginx_config_template_file)
+    return server
+
+
+@patch.dict(os.environ, {'SAGEMAKER_USE_NGINX': 'true'})
+@patch('sagemaker_containers._server.start')
+def test_serving_entrypoint_proxies_metrics(mock_start, nginx_config_template):
+    serving.serving_entrypoint()
+
+    assert nginx_config_template.nginx_config_template_file == serving.NGINX_CONFIG_TEMPLATE_FILE
+    with open(serving.NGINX_CONFIG_TEMPLATE_FILE) as f:
+        assert 'location ~ ^/(ping|invocations|execution-parameters|metrics) {' in f.read()
+
+
+@patch.dict(os.environ, {'SAGEMAKER_USE_NGINX': 'true', 'SAGEMAKER_PROFILE_ENDPOINT': 'true'})
+@patch('sagemaker_containers._server.start')
+def test_serving_entrypoint_proxies_profile_endpoint(mock_start):
+    serving.serving_entrypoint()
+
+    with open(serving.NGINX_CONFIG_TEMPLATE_FILE) as f:
+        assert 'location ~ ^/(ping|invocations|execution-parameters|metrics|profile) {' in f.read()
+
+
+def test_set_nginx_config_template_unexpected_template(nginx_config_template, tmp_path):
+    template_file = str(tmp_path / 'other.conf.template')
+    with open(template_file, 'w') as f:
+        f.write('location / {}')
+    nginx_config_template.nginx_config_template_file = template_file
+
+    serving._set_nginx_config_template(nginx_config_template)
+
+    assert nginx_config_template.nginx_config_template_file == template_file
+
+
+@patch.dict(os.environ, {})
+@patch('sagemaker_containers._server.start')
+def test_serving_entrypoint_start_gunicorn(mock_start):
+    serving.serving_entrypoint()
+    mock_start.assert_called_once()
+
+
+@patch.dict(os.environ, {'SAGEMAKER_THREADS_PER_WORKER': '2'})
+@patch('multiprocessing.cpu_count', return_value=8)
+@patch('sagemaker_containers._server.start')
+def test_serving_entrypoint_threads_per_worker(mock_start, cpu_count):
+    for env_var in serving.thread_limits.THREAD_LIMIT_ENV_VARS + ['SAGEMAKER_MODEL_SERVER_WORKERS']:
+        os.environ.pop(env_var, None)
+
+    serving.serving_entrypoint()
+
+    assert os.environ['SAGEMAKER_MODEL_SERVER_WORKERS'] == '4'
+    assert os.environ['OMP_NUM_THREADS'] == '2'
+
+
+@patch.dict(os.environ, {'SAGEMAKER_PRELOAD_MODEL': 'true', 'GUNICORN_CMD_ARGS': '--keep-alive 5'})
+@patch('sagemaker_containers._server.start')
+def test_serving_entrypoint_preload_model(mock_start):
     serving.serving_entrypoint()
-    mock_server.start.assert_called_once()
+
+    assert os.environ['GUNICORN_CMD_ARGS'] == '--keep-alive 5 --config ' + serving.GUNICORN_CONFIG
+    mock_start.assert_called_once()
+
+
+@patch.dict(os.environ, {'SAGEMAKER_CPU_AFFINITY': 'true'})
+@patch('sagemaker_containers._server.start')
+def test_serving_entrypoint_cpu_affinity(mock_start):
+    os.environ.pop('GUNICORN_CMD_ARGS', None)
+
+    serving.serving_entrypoint()
+
+    assert os.environ['GUNICORN_CMD_ARGS'] == '--config ' + serving.GUNICORN_CONFIG
+
+
+@patch.dict(os.environ, {'SAGEMAKER_KEEP_ALIVE_TIMEOUT': '75'})
+@patch('sagemaker_containers._server.start')
+def test_serving_entrypoint_keep_alive(mock_start):
+    os.environ.pop('GUNICORN_CMD_ARGS', None)
+    os.environ.pop('SAGEMAKER_USE_NGINX', None)
+
+    serving.serving_entrypoint()
+
+    assert os.environ['GUNICORN_CMD_ARGS'] == '--config ' + serving.GUNICORN_CONFIG
+    assert os.environ['SAGEMAKER_USE_NGINX'] == 'false'
+
+
+@patch.dict(os.environ, {'SAGEMAKER_KEEP_ALIVE_TIMEOUT': '75', 'SAGEMAKER_USE_NGINX': 'true'})
+@patch('sagemaker_containers._server.start')
+def test_serving_entrypoint_keep_alive_behind_nginx(mock_start):
+    serving.serving_entrypoint()
+
+    assert os.environ['SAGEMAKER_USE_NGINX'] == 'true'
+
+
+@patch('sagemaker_sklearn_container.serving.worker')
+@patch('sagemaker_sklearn_container.serving.env.ServingEnv')
+@patch('sagemaker_sklearn_container.serving.import_module', return_value=(MagicMock(), None))
+def test_load_app_once(import_module, serving_env, worker, monkeypatch):
+    monkeypatch.setattr(serving, 'app', None)
+
+    assert serving.load_app() is serving.load_app()
+    import_module.assert_called_once()
+
+
+@patch('sagemaker_sklearn_container.serving.startup.on_ping')
+@patch('sagemaker_sklearn_container.serving.env.ServingEnv')
+@patch('sagemaker_sklearn_container.serving.import_module', return_value=(MagicMock(), None))
+def test_load_app_ping_reports_startup(import_module, serving_env, on_ping, monkeypatch):
+    monkeypatch.setattr(serving, 'app', None)
+    serving_env.return_value.module_name = 'user_module'
+
+    assert serving.load_app().test_client().get('/ping').status_code == 200
+    on_ping.assert_called_once()
+
+
+@patch('sagemaker_sklearn_container.serving.metrics.request_stats', new_callable=RequestStats)
+@patch('sagemaker_sklearn_container.serving.env.ServingEnv')
+@patch('sagemaker_sklearn_container.serving.import_module')
+def test_load_app_records_requests_and_serves_metrics(import_module, serving_env, request_stats, tmp_path,
+                                                      monkeypatch):
+    def transform():
+        if worker.Request().content_type == 'application/not_supported':
+            raise UnsupportedMediaType()
+        return worker.Response('1', mimetype='text/csv')
+
+    import_module.return_value = (MagicMock(transform=transform), None)
+    serving_env.return_value.module_name = 'user_module'
+    monkeypatch.setattr(serving, 'app', None)
+    monkeypatch.setenv('SAGEMAKER_METRICS_DIR', str(tmp_path))
+    client = serving.load_app().test_client()
+
+    assert client.post('/invocations', data='1', content_type='text/csv').status_code == 200
+    assert client.post('/invocations', data='1', content_type='application/not_supported').status_code == 415
+    response = client.get('/metrics')
+
+    assert request_stats.responses == {200: 1, 415: 1}
+    assert request_stats.in_flight == 0
+    assert response.content_type == 'text/plain; version=0.0.4; charset=utf-8'
+    assert 'sagemaker_sklearn_requests_total{{pid="{}",code="415"}} 1'.format(os.getpid()) in response.get_data(
+        as_text=True)
+
+
+@patch('sagemaker_sklearn_container.serving.env.ServingEnv')
+@patch('sagemaker_sklearn_container.serving.import_module', return_value=(MagicMock(), None))
+def test_load_app_profile_endpoint(import_module, serving_env, tmp_path, monkeypatch):
+    monkeypatch.setattr(serving, 'app', None)
+    monkeypatch.setenv('SAGEMAKER_PROFILE_ENDPOINT', 'true')
+    monkeypatch.setenv('SAGEMAKER_PROFILE_DIR', str(tmp_path))
+    serving_env.return_value.module_name = 'user_module'
+    client = serving.load_app().test_client()
+
+    try:
+        response = client.post('/profile?seconds=5')
+        assert response.status_code == 202
+        assert response.get_json()['path'].startswith(str(tmp_path))
+        assert client.post('/profile').status_code == 409
+    finally:
+        serving.profiling.stop()
+    assert client.post('/profile?seconds=-1').status_code == 400
+
+
+@patch('sagemaker_sklearn_container.serving.env.ServingEnv')
+@patch('sagemaker_sklearn_container.serving.import_module', return_value=(MagicMock(), None))
+def test_load_app_without_profile_endpoint(import_module, serving_env, monkeypatch):
+    monkeypatch.setattr(serving, 'app', None)
+    monkeypatch.delenv('SAGEMAKER_PROFILE_ENDPOINT', raising=False)
+    serving_env.return_value.module_name = 'user_module'
+
+    assert serving.load_app().test_client().post('/profile').status_code == 404
 
 
 @patch.dict(os.environ, {'SAGEMAKER_MULTI_MODEL': 'True', })
-@patch('sagemaker_sklearn_container.serving.start_model_server')
+@patch('sagemaker_sklearn_container.serving_mms.start_model_server')
 def test_serving_entrypoint_start_mms(mock_start_model_server):
     serving.serving_entrypoint()
     mock_start_model_server.assert_called_once()
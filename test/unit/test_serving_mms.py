@@ -17,6 +17,7 @@ import pytest
 
 from sagemaker_sklearn_container import serving, serving_mms
 from sagemaker_sklearn_container import handler_service
+from sagemaker_sklearn_container.mms_patch import model_server
 
 
 TEST_CONFIG_FILE = "test_dir"
@@ -79,3 +80,91 @@ def test_set_max_content_len(start_model_server):
     with patch.dict('os.environ', {'MAX_CONTENT_LENGTH': str(TEST_MAX_CONTENT_LEN)}):
         serving_mms._set_mms_configs(False, test_handler_str)
         assert os.environ['SAGEMAKER_MAX_REQUEST_SIZE'] == str(TEST_MAX_CONTENT_LEN)
+
+
+@patch('sagemaker_sklearn_container.serving_mms.mms_tuning.profile_model',
+       return_value={'worker_bytes': 1024 ** 2, 'request_latency_s': 0.1})
+@patch('multiprocessing.cpu_count', return_value=TEST_NUM_CPU)
+def test_set_mms_configs_autotune(cpu_count, profile_model):
+    with patch.dict('os.environ', {'SAGEMAKER_MMS_AUTOTUNE': 'true'}):
+        serving_mms._set_mms_configs(True, 'foo')
+
+        # One worker per model, for as many models as cores
+        assert os.environ['SAGEMAKER_NUM_MODEL_WORKERS'] == '1'
+        assert os.environ['SAGEMAKER_MODEL_JOB_QUEUE_SIZE'] == '10'
+        max_heap_size = serving_mms.mms_tuning.max_heap_size_mb(TEST_NUM_CPU, 10 * TEST_NUM_CPU,
+                                                                serving_mms.DEFAULT_MAX_CONTENT_LEN)
+        assert os.environ['SAGEMAKER_MAX_HEAP_SIZE'] == '{}m'.format(max_heap_size)
+
+
+@patch('sagemaker_sklearn_container.serving_mms.mms_tuning.profile_model',
+       return_value={'worker_bytes': 1024 ** 2, 'request_latency_s': 0.1})
+@patch('multiprocessing.cpu_count', return_value=TEST_NUM_CPU)
+def test_set_mms_configs_autotune_for_one_model(cpu_count, profile_model):
+    with patch.dict('os.environ', {'SAGEMAKER_MMS_AUTOTUNE': 'true', 'SAGEMAKER_MMS_AUTOTUNE_MODELS': '1'}):
+        serving_mms._set_mms_configs(True, 'foo')
+
+        assert os.environ['SAGEMAKER_NUM_MODEL_WORKERS'] == str(TEST_NUM_CPU)
+        assert os.environ['SAGEMAKER_MODEL_JOB_QUEUE_SIZE'] == str(10 * TEST_NUM_CPU)
+
+
+@patch('sagemaker_sklearn_container.serving_mms.mms_tuning.profile_model', return_value=None)
+def test_set_mms_configs_autotune_without_model(profile_model):
+    with patch.dict('os.environ', {'SAGEMAKER_MMS_AUTOTUNE': 'true'}):
+        serving_mms._set_mms_configs(True, 'foo')
+
+        assert os.environ['SAGEMAKER_NUM_MODEL_WORKERS'] == str(serving_mms.MMS_NUM_MODEL_WORKERS_INIT)
+
+
+@patch('multiprocessing.cpu_count', return_value=TEST_NUM_CPU)
+def test_jvm_args_static_heap(cpu_count):
+    with patch.dict('os.environ', {}):
+        serving_mms._set_mms_configs(True, 'foo')
+        jvm_args = serving_mms._jvm_args()
+
+        assert '-XX:+UseG1GC' in jvm_args
+        assert '-XX:+UseParNewGC' not in jvm_args
+        assert '-Xms' + os.environ['SAGEMAKER_MAX_HEAP_SIZE'] in jvm_args
+        assert '-Xmx' + os.environ['SAGEMAKER_MAX_HEAP_SIZE'] in jvm_args
+
+
+@patch('multiprocessing.cpu_count', return_value=TEST_NUM_CPU)
+def test_jvm_args_dynamic_heap(cpu_count):
+    with patch.dict('os.environ', {'SAGEMAKER_MMS_HEAP_SIZING': 'dynamic', 'SAGEMAKER_MMS_GC_LOG': '/tmp/gc.log'}):
+        serving_mms._set_mms_configs(True, 'foo')
+        jvm_args = serving_mms._jvm_args()
+
+        initial_heap_size = serving_mms.mms_tuning.max_heap_size_mb(TEST_NUM_CPU, 0,
+                                                                    serving_mms.DEFAULT_MAX_CONTENT_LEN)
+        assert '-Xms{}m'.format(initial_heap_size) in jvm_args
+        assert '-Xmx' + os.environ['SAGEMAKER_MAX_HEAP_SIZE'] in jvm_args
+        assert '-Xloggc:/tmp/gc.log' in jvm_args
+
+
+def test_jvm_args_dynamic_heap_with_user_max_heap_size():
+    with patch.dict('os.environ', {'SAGEMAKER_MMS_HEAP_SIZING': 'dynamic', 'SAGEMAKER_MAX_HEAP_SIZE': '256m'}):
+        serving_mms._set_mms_configs(True, 'foo')
+        jvm_args = serving_mms._jvm_args()
+
+        assert not any(arg.startswith('-Xms') for arg in jvm_args)
+        assert '-Xmx256m' in jvm_args
+
+
+@patch('multiprocessing.cpu_count', return_value=TEST_NUM_CPU)
+def test_set_mms_configs_thread_limits(cpu_count):
+    with patch.dict('os.environ', {}):
+        for env_var in serving_mms.thread_limits.THREAD_LIMIT_ENV_VARS:
+            os.environ.pop(env_var, None)
+        serving_mms._set_mms_configs(True, 'foo')
+
+        assert os.environ['OMP_NUM_THREADS'] == '1'
+        assert os.environ['OPENBLAS_NUM_THREADS'] == '1'
+
+
+def test_mms_properties_files():
+    mme_config_file = serving_mms.get_mme_mms_config_file_path()
+
+    assert os.path.isfile(mme_config_file)
+    assert os.path.basename(mme_config_file) == 'mme-mms.properties'
+    assert os.path.isfile(model_server.inference_resource(model_server.DEFAULT_MMS_CONFIG_FILE_NAME))
+    assert model_server.inference_resource.cache_info().currsize >= 2
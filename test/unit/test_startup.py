@@ -0,0 +1,97 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+from collections import OrderedDict
+import json
+import os
+import subprocess
+import sys
+
+from mock import patch
+import pytest
+
+from sagemaker_sklearn_container import startup
+
+
+@pytest.fixture(autouse=True)
+def fixture_phases(monkeypatch):
+    monkeypatch.setattr(startup, 'phases', OrderedDict())
+    monkeypatch.setattr(startup, '_reported', False)
+
+
+def test_timed_accumulates():
+    with startup.timed(startup.REQUIREMENTS_INSTALL):
+        pass
+    first = startup.phases[startup.REQUIREMENTS_INSTALL]
+    with startup.timed(startup.REQUIREMENTS_INSTALL):
+        pass
+
+    assert startup.phases[startup.REQUIREMENTS_INSTALL] >= first
+
+
+@patch('sagemaker_sklearn_container.startup.since_process_start', side_effect=[1.5, 2.5])
+def test_record_import_once(since_process_start):
+    startup.record_import()
+    startup.record_import()
+
+    assert startup.phases == {startup.IMPORT: 1.5}
+
+
+@patch('sagemaker_sklearn_container.startup.logger')
+@patch('sagemaker_sklearn_container.startup.since_process_start', return_value=3.0)
+def test_on_ping_reports_once(since_process_start, logger):
+    startup.record(startup.MODEL_LOAD, 1.0)
+
+    startup.on_ping()
+    startup.on_ping()
+
+    logger.info.assert_called_once()
+    message = logger.info.call_args[0][0]
+    assert message.startswith('startup phases: ')
+    assert json.loads(message[len('startup phases: '):]) == {'model_load': 1.0, 'first_ping': 3.0, 'total': 3.0}
+
+
+def test_since_process_start():
+    assert 0 <= startup.since_process_start() < 24 * 3600
+
+
+def test_serving_imports_only_gunicorn_worker_modules():
+    code = 'import sys, sagemaker_sklearn_container.serving; print(" ".join(sys.modules))'
+    src_dir = os.path.dirname(os.path.dirname(startup.__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([src_dir, os.environ.get('PYTHONPATH', '')]))
+
+    modules = set(subprocess.check_output([sys.executable, '-c', code], env=env).decode().split())
+
+    assert 'sagemaker_sklearn_container.serving' in modules
+    assert not modules & {'sagemaker_containers.beta.framework', 'sagemaker_containers._server', 'paramiko',
+                          'sagemaker_sklearn_container.serving_mms', 'sagemaker_sklearn_container.asgi',
+                          'sagemaker_inference.transformer'}
+
+
+def test_handler_service_imports_model_libraries_lazily():
+    # The image replaces sagemaker_inference.decoder, which imports scipy.sparse in the installed package
+    patched_decoder = os.path.join(os.path.dirname(__file__), '..', '..', 'docker', '1.4-2-py312', 'resources',
+                                   'patches', 'decoder.py')
+    code = ('import importlib.util, sys, sagemaker_inference\n'
+            'spec = importlib.util.spec_from_file_location("sagemaker_inference.decoder", {!r})\n'
+            'sys.modules[spec.name] = importlib.util.module_from_spec(spec)\n'
+            'spec.loader.exec_module(sys.modules[spec.name])\n'
+            'import sagemaker_sklearn_container.handler_service\n'
+            'print(" ".join(sys.modules))').format(patched_decoder)
+    src_dir = os.path.dirname(os.path.dirname(startup.__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([src_dir, os.environ.get('PYTHONPATH', '')]))
+
+    modules = set(subprocess.check_output([sys.executable, '-c', code], env=env).decode().split())
+
+    assert 'sagemaker_sklearn_container.handler_service' in modules
+    assert not modules & {'scipy.sparse', 'joblib'}
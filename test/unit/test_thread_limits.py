@@ -0,0 +1,69 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+from mock import patch
+import os
+import pytest
+
+from sagemaker_sklearn_container import thread_limits
+
+
+@pytest.fixture(autouse=True)
+def clear_thread_limits():
+    env = {name: value for name, value in os.environ.items()
+           if name not in thread_limits.THREAD_LIMIT_ENV_VARS + [thread_limits.THREADS_PER_WORKER_ENV]}
+    with patch.dict(os.environ, env, clear=True):
+        yield
+
+
+@pytest.mark.parametrize('num_workers, cpu_count, threads', [(8, 8, 1), (2, 8, 4), (3, 8, 2), (16, 8, 1)])
+def test_set_thread_limits(num_workers, cpu_count, threads):
+    assert thread_limits.set_thread_limits(num_workers, cpu_count) == threads
+
+    for env_var in thread_limits.THREAD_LIMIT_ENV_VARS:
+        assert os.environ[env_var] == str(threads)
+
+
+def test_set_thread_limits_keeps_user_limits():
+    os.environ['OMP_NUM_THREADS'] = '3'
+    thread_limits.set_thread_limits(8, 8)
+
+    assert os.environ['OMP_NUM_THREADS'] == '3'
+    assert os.environ['OPENBLAS_NUM_THREADS'] == '1'
+
+
+def test_set_thread_limits_threads_per_worker():
+    os.environ[thread_limits.THREADS_PER_WORKER_ENV] = '4'
+
+    assert thread_limits.set_thread_limits(8, 8) == 4
+    assert thread_limits.workers_for_threads(thread_limits.threads_per_worker(), 8) == 2
+
+
+def test_workers_for_threads_at_least_one():
+    assert thread_limits.workers_for_threads(16, 8) == 1
+
+
+@patch('threadpoolctl.threadpool_limits')
+def test_limit_loaded_thread_pools(threadpool_limits):
+    with patch.dict(os.environ, {'OMP_NUM_THREADS': '2', 'MKL_NUM_THREADS': '3'}):
+        assert thread_limits.limit_loaded_thread_pools() == {'openmp': 2, 'blas': 3}
+
+    threadpool_limits.assert_called_once_with(limits={'openmp': 2, 'blas': 3})
+
+
+@patch('threadpoolctl.threadpool_limits')
+def test_limit_loaded_thread_pools_without_limits(threadpool_limits):
+    assert thread_limits.limit_loaded_thread_pools() == {}
+
+    threadpool_limits.assert_not_called()
@@ -0,0 +1,273 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License'). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the 'license' file accompanying this file. This file is
+# distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+from mock import MagicMock, Mock, patch
+from six import BytesIO
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse
+
+from sagemaker_inference import content_types
+
+from sagemaker_sklearn_container import content_types as sklearn_content_types
+from sagemaker_sklearn_container.handler_service import HandlerService
+from sagemaker_sklearn_container.metrics import RequestStats, StageStats
+from sagemaker_sklearn_container.transformer import _num_predictions, SKLearnTransformer
+
+
+class SumEstimator(object):
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, input_data):
+        self.calls.append(input_data)
+        return np.asarray(input_data.sum(axis=1)).ravel()
+
+
+@pytest.fixture(autouse=True)
+def fixture_metrics_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('SAGEMAKER_METRICS_DIR', str(tmp_path))
+
+
+@pytest.fixture(name='model')
+def fixture_model():
+    return SumEstimator()
+
+
+def _transformer(model, transform_fn=None):
+    handler = HandlerService.DefaultSKLearnUserModuleInferenceHandler()
+    transformer = SKLearnTransformer(default_inference_handler=handler)
+
+    transformer._initialized = True
+    transformer._environment = Mock(default_accept=content_types.JSON)
+    transformer._model = model
+    transformer._input_fn = handler.default_input_fn
+    transformer._predict_fn = handler.default_predict_fn
+    transformer._output_fn = handler.default_output_fn
+    transformer._transform_fn = transform_fn or transformer._default_transform_fn
+    return transformer
+
+
+def _context(content_type, accept=content_types.CSV):
+    context = MagicMock()
+    request_properties = {'Content-Type': content_type, 'Accept': accept}
+    context.request_processor[0].get_request_properties.return_value = request_properties
+    return context
+
+
+def _batch(*bodies):
+    return [{'body': body} for body in bodies]
+
+
+def test_transform_predicts_batch_once(model):
+    context = _context(content_types.CSV)
+    response = _transformer(model).transform(_batch(b'1,2', b'3,4', b'5,6'), context)
+
+    assert response == ['3.0\n', '7.0\n', '11.0\n']
+    assert len(model.calls) == 1
+    np.testing.assert_array_equal(model.calls[0], [[1, 2], [3, 4], [5, 6]])
+    context.set_response_content_type.assert_any_call(2, content_types.CSV)
+
+
+def test_transform_splits_multi_row_requests(model):
+    response = _transformer(model).transform(_batch(b'1,2\n3,4', b'5,6'), _context(content_types.CSV))
+
+    assert response == ['3.0\n7.0\n', '11.0\n']
+    assert len(model.calls) == 1
+
+
+def test_transform_stacks_sparse_requests(model):
+    def npz(matrix):
+        buffer = BytesIO()
+        scipy.sparse.save_npz(buffer, scipy.sparse.csr_matrix(matrix, dtype=np.float64))
+        return buffer.getvalue()
+
+    response = _transformer(model).transform(_batch(npz([[1, 0]]), npz([[0, 2]])),
+                                             _context(sklearn_content_types.NPZ))
+
+    assert response == ['1.0\n', '2.0\n']
+    assert len(model.calls) == 1
+    assert scipy.sparse.isspmatrix_csr(model.calls[0])
+
+
+def test_transform_predicts_mismatched_columns_per_request(model):
+    response = _transformer(model).transform(_batch(b'1,2', b'3,4,5'), _context(content_types.CSV))
+
+    assert response == ['3.0\n', '12.0\n']
+    assert len(model.calls) == 2
+
+
+@pytest.mark.parametrize('to_sequence', [
+    list,
+    pd.Series,
+    lambda prediction: scipy.sparse.csr_matrix(prediction.reshape(-1, 1)),
+])
+def test_transform_splits_any_prediction_sequence(to_sequence):
+    model = Mock()
+    model.predict.side_effect = lambda input_data: to_sequence(input_data.sum(axis=1))
+
+    transformer = _transformer(model)
+    transformer._output_fn = lambda prediction, accept: str(_num_predictions(prediction))
+    response = transformer.transform(_batch(b'1,2\n3,4', b'5,6'), _context(content_types.CSV))
+
+    assert response == ['2', '1']
+    model.predict.assert_called_once()
+
+
+def test_transform_with_predict_fn_predicts_per_request(model):
+    transformer = _transformer(model)
+    transformer._predict_fn = lambda input_data, model: model.predict(input_data).tolist()
+
+    response = transformer.transform(_batch(b'1,2', b'3,4'), _context(content_types.CSV))
+
+    assert response == ['3.0\n', '7.0\n']
+    assert len(model.calls) == 2
+
+
+def test_transform_fails_group_when_prediction_has_other_length():
+    model = Mock()
+    model.predict.return_value = np.array([1.0])
+    context = _context(content_types.CSV)
+
+    response = _transformer(model).transform(_batch(b'1,2', b'3,4'), context)
+
+    assert len(response) == 2
+    assert 'returned 1 predictions for 2 rows' in response[0]
+    model.predict.assert_called_once()
+
+
+def test_transform_with_transform_fn_runs_per_request(model):
+    def transform_fn(model, input_data, content_type, accept):
+        return input_data, accept
+
+    response = _transformer(model, transform_fn).transform(_batch(b'1,2', b'3,4'), _context(content_types.CSV))
+
+    assert response == ['1,2', '3,4']
+    assert model.calls == []
+
+
+def test_transform_single_request(model):
+    response = _transformer(model).transform(_batch(b'1,2'), _context(content_types.CSV))
+
+    assert response == ['3.0\n']
+
+
+def _batch_context(headers):
+    context = MagicMock()
+    context.request_processor = []
+    for content_type, accept in headers:
+        request_processor = Mock()
+        request_processor.get_request_properties.return_value = {'Content-Type': content_type, 'Accept': accept}
+        context.request_processor.append(request_processor)
+    return context
+
+
+def test_transform_error(model):
+    context = _context('application/not_supported')
+    response = _transformer(model).transform(_batch(b'1,2', b'3,4'), context)
+
+    assert len(response) == 2
+    assert [call[1]['idx'] for call in context.set_response_status.call_args_list] == [0, 1]
+    assert context.set_response_status.call_args[1]['code'] == 500
+
+
+@patch('sagemaker_sklearn_container.metrics.request_stats', new_callable=RequestStats)
+def test_transform_answers_failed_requests_of_batch_individually(request_stats, model):
+    context = _batch_context([(content_types.CSV, content_types.CSV), ('application/not_supported', content_types.CSV),
+                              (content_types.CSV, content_types.CSV)])
+    response = _transformer(model).transform(_batch(b'1,2', b'3,4', b'5,6'), context)
+
+    assert len(response) == 3
+    assert response[0] == '3.0\n' and response[2] == '11.0\n'
+    assert 'not_supported' in response[1]
+    context.set_response_status.assert_called_once()
+    assert context.set_response_status.call_args[1]['idx'] == 1
+    assert context.set_response_status.call_args[1]['code'] == 500
+    assert len(model.calls) == 1
+    np.testing.assert_array_equal(model.calls[0], [[1, 2], [5, 6]])
+    assert request_stats.responses == {200: 2, 500: 1}
+
+
+def test_transform_answers_failed_prediction_per_group():
+    class FailingEstimator(object):
+        def predict(self, input_data):
+            if input_data.shape[1] == 3:
+                raise ValueError('expected 2 features')
+            return input_data.sum(axis=1)
+
+    context = _batch_context([(content_types.CSV, content_types.CSV), (content_types.JSON, content_types.JSON),
+                              (content_types.CSV, content_types.CSV)])
+    response = _transformer(FailingEstimator()).transform(_batch(b'1,2,3', b'[[3, 4]]', b'5,6,7'), context)
+
+    assert response[1] == '[7.0]'
+    assert 'expected 2 features' in response[0] and response[0] == response[2]
+    assert [call[1]['idx'] for call in context.set_response_status.call_args_list] == [0, 2]
+
+
+@patch('sagemaker_sklearn_container.metrics.request_stats', new_callable=RequestStats)
+def test_transform_records_requests(request_stats, model):
+    transformer = _transformer(model)
+    transformer.transform(_batch(b'1,2', b'3,4'), _context(content_types.CSV))
+    transformer.transform(_batch(b'1,2', b'3,4'), _context('application/not_supported'))
+
+    assert request_stats.responses == {200: 2, 500: 2}
+    assert request_stats.in_flight == 0
+    assert request_stats.latency_us.count == 4
+
+
+@patch('sagemaker_sklearn_container.metrics.request_stats', new_callable=RequestStats)
+def test_validate_and_initialize_records_model_load(request_stats, model):
+    transformer = SKLearnTransformer(default_inference_handler=Mock(default_model_fn=lambda model_dir: model))
+    with patch('sagemaker_inference.transformer.environment.Environment',
+               return_value=Mock(module_name='no_such_user_module')):
+        transformer.validate_and_initialize(model_dir='model_dir')
+
+    assert transformer._model is model
+    assert request_stats.model_load_seconds >= 0
+
+
+def test_transform_groups_requests_by_content_type_and_accept(model):
+    headers = [(content_types.CSV, content_types.CSV), (content_types.JSON, content_types.JSON),
+               (content_types.CSV, content_types.JSON), (content_types.CSV, content_types.CSV)]
+    context = _batch_context(headers)
+
+    response = _transformer(model).transform(_batch(b'1,2', b'[3, 4]', b'5,6', b'7,8'), context)
+
+    assert response == ['3.0\n', '[7.0]', '[11.0]', '15.0\n']
+    assert len(model.calls) == 3
+    np.testing.assert_array_equal(model.calls[0], [[1, 2], [7, 8]])
+    context.set_response_content_type.assert_any_call(1, content_types.JSON)
+    context.set_response_content_type.assert_any_call(3, content_types.CSV)
+
+
+@patch('sagemaker_sklearn_container.metrics.stage_stats', new_callable=StageStats, log_interval=0)
+def test_validate_user_module_records_stages(stage_stats, model):
+    handler = HandlerService.DefaultSKLearnUserModuleInferenceHandler()
+    transformer = SKLearnTransformer(default_inference_handler=handler)
+    transformer._environment = Mock(module_name='no_such_user_module', default_accept=content_types.JSON)
+    transformer._validate_user_module_and_set_functions()
+    transformer._initialized = True
+    transformer._model = model
+
+    response = transformer.transform(_batch(b'1,2\n3,4', b'5,6'), _context(content_types.CSV))
+
+    assert response == ['3.0\n7.0\n', '11.0\n']
+    assert transformer._transform_fn == transformer._default_transform_fn
+    stats = stage_stats.stats()
+    assert stats['latency_us']['input_fn']['count'] == 2
+    assert stats['latency_us']['predict_fn']['count'] == 1
+    assert stats['latency_us']['output_fn']['count'] == 2
+    assert stats['rows']['total'] == 3
+    assert stats['request_bytes']['total'] == 10